@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 import json
-import sys
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, NoReturn, Union
 import importlib.util
 
+from uip_report import Violation, run_checker, run_checks
 from uip_yaml import YamlError, load_yaml
 
 ROOT = Path(__file__).resolve().parent.parent
@@ -14,19 +14,8 @@ REQUIRED_EVENT_FIELDS = {"intentId", "uiSessionId", "idempotencyKey", "schemaVer
 NONDETERMINISTIC_TOKENS = ("Math.random", "Date.now", "new Date(", "crypto.randomUUID")
 
 
-def fail(category: str, file_path: Union[Path, str], rule: str, suggestion: str) -> None:
-    if isinstance(file_path, Path):
-        try:
-            display_path: Union[Path, str] = file_path.relative_to(ROOT)
-        except ValueError:
-            display_path = file_path
-    else:
-        display_path = file_path
-    message = (
-        f"{category} | file: {display_path} | rule: {rule} | suggestion: {suggestion}"
-    )
-    print(message, file=sys.stderr)
-    raise SystemExit(1)
+def fail(category: str, file_path: Union[Path, str], rule: str, suggestion: str) -> NoReturn:
+    raise Violation(category, file_path, rule, suggestion)
 
 
 def load_intent_validator():
@@ -174,99 +163,113 @@ def ensure_validation_call(path: Path, text: str) -> None:
         )
 
 
-def main() -> None:
-    intent_module = load_intent_validator()
-    validate_intent_fn = getattr(intent_module, "validate_intent")
-    renderers = load_manifest()
+# Set by check() before renderers are certified (and inherited by forked workers).
+_validate_intent_fn = None
+
 
-    for renderer in renderers:
-        if not isinstance(renderer, dict):
+def check_renderer(renderer: Any) -> None:
+    if not isinstance(renderer, dict):
+        fail(
+            "UIP-STRUCTURAL-VIOLATION",
+            MANIFEST_PATH,
+            "renderer.manifest",
+            "Renderer entries must be mappings.",
+        )
+    entrypoint = renderer.get("entrypoint")
+    adapter = renderer.get("adapter")
+    intent_fixture = renderer.get("intentFixture")
+    invalid_intent_fixture = renderer.get("invalidIntentFixture")
+    event_fixture = renderer.get("eventFixture")
+
+    for key, value in [
+        ("entrypoint", entrypoint),
+        ("adapter", adapter),
+        ("intentFixture", intent_fixture),
+        ("invalidIntentFixture", invalid_intent_fixture),
+        ("eventFixture", event_fixture),
+    ]:
+        if not isinstance(value, str) or not value.strip():
             fail(
                 "UIP-STRUCTURAL-VIOLATION",
                 MANIFEST_PATH,
                 "renderer.manifest",
-                "Renderer entries must be mappings.",
-            )
-        entrypoint = renderer.get("entrypoint")
-        adapter = renderer.get("adapter")
-        intent_fixture = renderer.get("intentFixture")
-        invalid_intent_fixture = renderer.get("invalidIntentFixture")
-        event_fixture = renderer.get("eventFixture")
-
-        for key, value in [
-            ("entrypoint", entrypoint),
-            ("adapter", adapter),
-            ("intentFixture", intent_fixture),
-            ("invalidIntentFixture", invalid_intent_fixture),
-            ("eventFixture", event_fixture),
-        ]:
-            if not isinstance(value, str) or not value.strip():
-                fail(
-                    "UIP-STRUCTURAL-VIOLATION",
-                    MANIFEST_PATH,
-                    "renderer.manifest",
-                    f"Set {key} to a non-empty path string.",
-                )
-
-        entry_path = ROOT / entrypoint
-        adapter_path = ROOT / adapter
-        if not entry_path.exists():
-            fail(
-                "UIP-STRUCTURAL-VIOLATION",
-                entry_path,
-                "renderer.entrypoint",
-                "Ensure the renderer entrypoint file exists.",
-            )
-        if not adapter_path.exists():
-            fail(
-                "UIP-STRUCTURAL-VIOLATION",
-                adapter_path,
-                "renderer.adapter",
-                "Ensure the renderer adapter file exists.",
+                f"Set {key} to a non-empty path string.",
             )
 
-        entry_text = entry_path.read_text(encoding="utf-8")
-        adapter_text = adapter_path.read_text(encoding="utf-8")
+    entry_path = ROOT / entrypoint
+    adapter_path = ROOT / adapter
+    if not entry_path.exists():
+        fail(
+            "UIP-STRUCTURAL-VIOLATION",
+            entry_path,
+            "renderer.entrypoint",
+            "Ensure the renderer entrypoint file exists.",
+        )
+    if not adapter_path.exists():
+        fail(
+            "UIP-STRUCTURAL-VIOLATION",
+            adapter_path,
+            "renderer.adapter",
+            "Ensure the renderer adapter file exists.",
+        )
 
-        ensure_validation_call(entry_path, entry_text)
-        ensure_no_disallowed_imports(entry_path, entry_text)
-        ensure_no_disallowed_imports(adapter_path, adapter_text)
-        ensure_determinism(entry_path, entry_text)
-        ensure_determinism(adapter_path, adapter_text)
-        ensure_tokenized_styling(adapter_path, adapter_text)
+    entry_text = entry_path.read_text(encoding="utf-8")
+    adapter_text = adapter_path.read_text(encoding="utf-8")
 
-        valid_intent = read_json(ROOT / intent_fixture)
-        intent_errors = validate_intent_fn(valid_intent)
-        if intent_errors:
-            fail(
-                "UIP-SCHEMA-VIOLATION",
-                ROOT / intent_fixture,
-                "renderer.input.valid",
-                "Fix the valid UIIntent fixture to pass validation.",
-            )
+    ensure_validation_call(entry_path, entry_text)
+    ensure_no_disallowed_imports(entry_path, entry_text)
+    ensure_no_disallowed_imports(adapter_path, adapter_text)
+    ensure_determinism(entry_path, entry_text)
+    ensure_determinism(adapter_path, adapter_text)
+    ensure_tokenized_styling(adapter_path, adapter_text)
 
-        invalid_payload = read_json(ROOT / invalid_intent_fixture)
-        invalid_intent = invalid_payload.get("intent") if isinstance(invalid_payload, dict) else None
-        if invalid_intent is None:
-            invalid_intent = invalid_payload
-        invalid_errors = validate_intent_fn(invalid_intent)
-        if not invalid_errors:
-            fail(
-                "UIP-SCHEMA-VIOLATION",
-                ROOT / invalid_intent_fixture,
-                "renderer.input.invalid",
-                "Provide an invalid UIIntent fixture that fails validation.",
-            )
-        if not any(error.get("path") == "schemaVersion" for error in invalid_errors):
-            fail(
-                "UIP-SCHEMA-VIOLATION",
-                ROOT / invalid_intent_fixture,
-                "renderer.input.schemaVersion",
-                "Ensure the invalid fixture triggers schemaVersion rejection.",
-            )
+    valid_intent = read_json(ROOT / intent_fixture)
+    intent_errors = _validate_intent_fn(valid_intent)
+    if intent_errors:
+        fail(
+            "UIP-SCHEMA-VIOLATION",
+            ROOT / intent_fixture,
+            "renderer.input.valid",
+            "Fix the valid UIIntent fixture to pass validation.",
+        )
 
-        event_payload = read_json(ROOT / event_fixture)
-        validate_event_fixture(ROOT / event_fixture, event_payload)
+    invalid_payload = read_json(ROOT / invalid_intent_fixture)
+    invalid_intent = invalid_payload.get("intent") if isinstance(invalid_payload, dict) else None
+    if invalid_intent is None:
+        invalid_intent = invalid_payload
+    invalid_errors = _validate_intent_fn(invalid_intent)
+    if not invalid_errors:
+        fail(
+            "UIP-SCHEMA-VIOLATION",
+            ROOT / invalid_intent_fixture,
+            "renderer.input.invalid",
+            "Provide an invalid UIIntent fixture that fails validation.",
+        )
+    if not any(error.get("path") == "schemaVersion" for error in invalid_errors):
+        fail(
+            "UIP-SCHEMA-VIOLATION",
+            ROOT / invalid_intent_fixture,
+            "renderer.input.schemaVersion",
+            "Ensure the invalid fixture triggers schemaVersion rejection.",
+        )
+
+    event_payload = read_json(ROOT / event_fixture)
+    validate_event_fixture(ROOT / event_fixture, event_payload)
+
+
+def check(collect: bool, parallelism: int) -> list[Violation]:
+    global _validate_intent_fn
+    _validate_intent_fn = getattr(load_intent_validator(), "validate_intent")
+    _, violations = run_checks(check_renderer, load_manifest(), collect, parallelism)
+    return violations
+
+
+def main() -> None:
+    run_checker(
+        "check-renderer-certification",
+        "Certify every renderer in ui-contracts/renderers.yaml (inputs, outputs, boundaries, determinism).",
+        check,
+    )
 
 
 if __name__ == "__main__":
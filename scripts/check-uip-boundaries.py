@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+import argparse
+import multiprocessing
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from uip_discovery import IgnoreChain, IgnoreRule, is_ignored, load_gitignore, parse_gitignore
+
+ROOT = Path(__file__).resolve().parent.parent
+
+MARKUP_EXTENSIONS = (".ts", ".tsx", ".js", ".jsx")
+IMPORT_EXTENSIONS = (".ts", ".tsx", ".js", ".jsx", ".py")
+
+# Allowlist globs (gitignore syntax, relative to the repo root). Matching files are not scanned.
+SCAN_EXCLUDES = (
+    "concepts/**/adapter/**",
+    "ui-adapters/**",
+    "renderer/**",
+    "renderers/**",
+    "ui-patterns/**",
+)
+BOUNDARY_EXCLUDES: tuple[str, ...] = ()
+
+MARKUP_SUGGESTION = "Move UI markup/styling into ui-adapters/ or renderer/ allowlisted paths."
+
+
+@dataclass(frozen=True)
+class Rule:
+    pattern: bytes
+    targets: tuple[str, ...]
+    extensions: tuple[str, ...]
+    excludes: tuple[str, ...]
+    rule: str
+    suggestion: str
+    category: str = "UIP-BOUNDARY-VIOLATION"
+
+
+def markup_rule(pattern: bytes, label: str) -> Rule:
+    return Rule(
+        pattern=pattern,
+        targets=("concepts", "skills", "agents"),
+        extensions=MARKUP_EXTENSIONS,
+        excludes=SCAN_EXCLUDES,
+        rule=f"UIP violation: UI markup or styling detected outside adapter layer ({label})",
+        suggestion=MARKUP_SUGGESTION,
+    )
+
+
+def import_rule(targets: tuple[str, ...], pattern: bytes, rule: str, suggestion: str) -> Rule:
+    return Rule(
+        pattern=pattern,
+        targets=targets,
+        extensions=IMPORT_EXTENSIONS,
+        excludes=BOUNDARY_EXCLUDES,
+        rule=rule,
+        suggestion=suggestion,
+    )
+
+
+# Patterns are the regexes check-uip-compliance.sh passed to rg, in its order. The Tailwind class
+# pattern uses a real word boundary; the rg scan's doubled `\\b` matched a literal backslash and never fired.
+RULES = (
+    markup_rule(rb"<div", "HTML/JSX <div"),
+    markup_rule(rb"<button", "HTML/JSX <button"),
+    markup_rule(rb"<form", "HTML/JSX <form"),
+    markup_rule(rb"<input", "HTML/JSX <input"),
+    markup_rule(rb"<select", "HTML/JSX <select"),
+    markup_rule(rb"className=", "className usage"),
+    markup_rule(
+        rb"\b(bg|text|flex|grid|px|py|mx|my|mt|mb|ml|mr|pt|pb|pl|pr|w|h)-[a-z0-9-]+",
+        "Tailwind class patterns",
+    ),
+    markup_rule(rb"tailwind", "Tailwind keyword"),
+    import_rule(
+        ("agents",),
+        rb"ui-adapters/|renderer/|renderers/|ui-patterns/",
+        "UIP violation: agent importing adapter layer",
+        "Remove adapter/renderer imports from agents and emit UI intent instead.",
+    ),
+    import_rule(
+        ("skills",),
+        rb"ui-adapters/|renderer/|renderers/|ui-patterns/",
+        "UIP violation: skill importing adapter layer",
+        "Remove adapter/renderer imports from skills and emit UI intent instead.",
+    ),
+    import_rule(
+        ("skills",),
+        rb"from ['\"]react['\"]|require\(['\"]react['\"]\)",
+        "UIP violation: skill importing React",
+        "Remove React imports from skills; keep rendering in adapter layers.",
+    ),
+    import_rule(
+        ("skills",),
+        rb"from ['\"](tailwind|tailwindcss)['\"]|require\(['\"](tailwind|tailwindcss)['\"]\)",
+        "UIP violation: skill importing Tailwind",
+        "Remove Tailwind imports from skills; keep styling in adapter layers.",
+    ),
+    import_rule(
+        ("renderer", "renderers"),
+        rb"concepts/|agents/|skills/",
+        "UIP violation: renderer importing domain layer",
+        "Remove concept/agent/skill imports from renderers and consume intent artifacts only.",
+    ),
+)
+
+SCAN_ROOTS = tuple(dict.fromkeys(target for rule in RULES for target in rule.targets))
+RULE_EXCLUDES = tuple(tuple(parse_gitignore("\n".join(rule.excludes))) for rule in RULES)
+
+
+def applicable_rules(rel_path: str) -> tuple[int, ...]:
+    top = rel_path.split("/", 1)[0]
+    ext = os.path.splitext(rel_path)[1]
+    chosen = []
+    for index, rule in enumerate(RULES):
+        if top not in rule.targets or ext not in rule.extensions:
+            continue
+        excludes = RULE_EXCLUDES[index]
+        if excludes and is_ignored((("", excludes),), rel_path, is_dir=False):
+            continue
+        chosen.append(index)
+    return tuple(chosen)
+
+
+RULE_PATTERNS = tuple(re.compile(rule.pattern) for rule in RULES)
+
+
+@lru_cache(maxsize=None)
+def combined_matcher(rule_ids: tuple[int, ...]) -> "re.Pattern[bytes]":
+    # One alternation per distinct rule set; `lastgroup` names the rule that matched.
+    return re.compile(b"|".join(b"(?P<r%d>%s)" % (i, RULES[i].pattern) for i in rule_ids))
+
+
+def scan_file(job: tuple[str, tuple[int, ...]]) -> tuple[str, list[int]]:
+    """Return the ids of the rules that match anywhere in one file (like rg, text after a NUL byte is skipped)."""
+    rel_path, rule_ids = job
+    try:
+        with open(ROOT / rel_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return rel_path, []
+    data = data.split(b"\0", 1)[0]
+    found: set[int] = set()
+    for match in combined_matcher(rule_ids).finditer(data):
+        found.add(int(match.lastgroup[1:]))  # type: ignore[index]
+        if len(found) == len(rule_ids):
+            break
+    if found and len(found) < len(rule_ids):
+        # Alternation matches don't overlap, so a rule whose only match sits inside another rule's match
+        # (`tailwind` inside `require("tailwindcss")`) is rechecked on its own. Clean files never get here.
+        found.update(i for i in rule_ids if i not in found and RULE_PATTERNS[i].search(data))
+    return rel_path, sorted(found)
+
+
+def collect_jobs() -> list[tuple[str, tuple[int, ...]]]:
+    """Walk every scan root once, skipping hidden and gitignored paths as rg does."""
+    root_rules = load_gitignore(str(ROOT))
+    base_chain: IgnoreChain = (("", root_rules),) if root_rules else ()
+    jobs: list[tuple[str, tuple[int, ...]]] = []
+    stack: list[tuple[str, IgnoreChain]] = [
+        (top, base_chain) for top in reversed(SCAN_ROOTS) if (ROOT / top).is_dir()
+    ]
+    while stack:
+        rel_dir, chain = stack.pop()
+        abs_dir = os.path.join(str(ROOT), rel_dir)
+        rules: tuple[IgnoreRule, ...] = load_gitignore(abs_dir)
+        if rules:
+            chain = chain + ((rel_dir, rules),)
+        try:
+            with os.scandir(abs_dir) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            rel_path = f"{rel_dir}/{entry.name}"
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if chain and is_ignored(chain, rel_path, is_dir=is_dir):
+                continue
+            if is_dir:
+                subdirs.append(rel_path)
+            elif entry.is_file():
+                rule_ids = applicable_rules(rel_path)
+                if rule_ids:
+                    jobs.append((rel_path, rule_ids))
+        stack.extend((d, chain) for d in reversed(subdirs))
+    return jobs
+
+
+# Below this many files, forking a pool costs more than it saves.
+PARALLEL_MIN_FILES = 64
+PARALLEL_CHUNK_SIZE = 32
+
+
+def scan(parallelism: int) -> list[tuple[str, int]]:
+    """Return every (file, rule id) violation, sorted by file and then rule order."""
+    jobs = collect_jobs()
+    if parallelism > 1 and len(jobs) >= PARALLEL_MIN_FILES:
+        context = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+        with ProcessPoolExecutor(max_workers=parallelism, mp_context=context) as pool:
+            results = list(pool.map(scan_file, jobs, chunksize=PARALLEL_CHUNK_SIZE))
+    else:
+        results = [scan_file(job) for job in jobs]
+    return sorted((rel_path, rule_id) for rel_path, found in results for rule_id in found)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Scan for UI markup outside adapter layers and forbidden cross-layer imports."
+    )
+    parser.add_argument(
+        "--parallelism",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes used to scan files (default: CPU count; 1 scans serially).",
+    )
+    args = parser.parse_args()
+    if args.parallelism < 1:
+        parser.error("--parallelism must be a positive integer")
+
+    violations = scan(args.parallelism)
+    for rel_path, rule_id in violations:
+        rule = RULES[rule_id]
+        print(
+            f"{rule.category} | file: {rel_path} | rule: {rule.rule} | suggestion: {rule.suggestion}",
+            file=sys.stderr,
+        )
+    if violations:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
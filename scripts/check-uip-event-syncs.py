@@ -1,14 +1,13 @@
 #!/usr/bin/env python3
-import json
-import subprocess
 import sys
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, NoReturn, Union
 
+from uip_discovery import Artifact, DiscoveryError, discover, discover_with_errors
+from uip_report import Violation, run_checker, run_checks
 from uip_yaml import YamlError, load_yaml
 
 ROOT = Path(__file__).resolve().parent.parent
-DISCOVERY_SCRIPT = ROOT / "scripts/discover-uip-artifacts.py"
 
 UI_EVENT_TYPES = {
     "form.submitted",
@@ -19,68 +18,41 @@ UI_EVENT_TYPES = {
 }
 
 
-def fail(category: str, file_path: Union[Path, str], rule: str, suggestion: str) -> None:
-    if isinstance(file_path, Path):
-        try:
-            display_path: Union[Path, str] = file_path.relative_to(ROOT)
-        except ValueError:
-            display_path = file_path
-    else:
-        display_path = file_path
-    message = (
-        f"{category} | file: {display_path} | rule: {rule} | suggestion: {suggestion}"
-    )
-    print(message, file=sys.stderr)
-    raise SystemExit(1)
+def fail(category: str, file_path: Union[Path, str], rule: str, suggestion: str) -> NoReturn:
+    raise Violation(category, file_path, rule, suggestion)
 
 
-def run_event_discovery() -> dict[str, Path]:
-    result = subprocess.run(
-        [sys.executable, str(DISCOVERY_SCRIPT)],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        message = (result.stderr or result.stdout).strip()
-        if message:
-            print(message, file=sys.stderr)
-        raise SystemExit(result.returncode)
+def event_type_of(artifact: Artifact) -> str:
+    event_type = artifact.payload.get("type")
+    if not isinstance(event_type, str) or not event_type.strip():
+        fail(
+            "UIP-SCHEMA-VIOLATION",
+            artifact.path,
+            "event.type",
+            "Set type to a non-empty UIEvent type string.",
+        )
+    return event_type
 
-    event_types: dict[str, Path] = {}
-    for line in result.stdout.splitlines():
-        if not line.strip():
-            continue
-        try:
-            artifact = json.loads(line)
-        except json.JSONDecodeError:
-            fail(
-                "UIP-STRUCTURAL-VIOLATION",
-                DISCOVERY_SCRIPT,
-                "discovery.output",
-                "Ensure discovery emits JSON lines with path/type.",
-            )
-        if artifact.get("type") != "event":
-            continue
-        path = Path(artifact["path"])
+
+def run_event_discovery(collect: bool) -> tuple[dict[str, Path], list[Violation]]:
+    if collect:
+        artifacts, errors = discover_with_errors()
+        violations = [Violation.from_discovery_error(exc) for exc in errors]
+    else:
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            fail(
-                "UIP-STRUCTURAL-VIOLATION",
-                path,
-                "valid-json",
-                "Fix JSON syntax so the event artifact can be parsed.",
-            )
-        event_type = payload.get("type")
-        if not isinstance(event_type, str) or not event_type.strip():
-            fail(
-                "UIP-SCHEMA-VIOLATION",
-                path,
-                "event.type",
-                "Set type to a non-empty UIEvent type string.",
-            )
-        event_types.setdefault(event_type, path)
-    return event_types
+            artifacts = discover()
+        except DiscoveryError as exc:
+            print(exc, file=sys.stderr)
+            raise SystemExit(1)
+        violations = []
+
+    events = [artifact for artifact in artifacts if artifact.type == "event"]
+    found, type_violations = run_checks(event_type_of, events, collect)
+    event_types: dict[str, Path] = {}
+    for artifact, event_type in zip(events, found):
+        if event_type is not None:
+            event_types.setdefault(event_type, artifact.path)
+    return event_types, violations + type_violations
 
 
 def discover_sync_manifests() -> list[Path]:
@@ -256,41 +228,48 @@ def validate_sync_manifest(path: Path, data: Any) -> set[str]:
     return event_types
 
 
-def main() -> None:
-    event_types = run_event_discovery()
-    sync_paths = discover_sync_manifests()
-    if not sync_paths:
-        if event_types:
-            first_event = next(iter(event_types.values()))
-            fail(
-                "UIP-BOUNDARY-VIOLATION",
-                first_event,
-                "UIP violation: UIEvent type has no synchronization",
-                "Add a Synchronization manifest that routes this UIEvent.",
-            )
-        return
+def check_sync_manifest(path: Path) -> set[str]:
+    try:
+        manifest = load_yaml(path)
+    except YamlError as exc:
+        fail(
+            "UIP-SCHEMA-VIOLATION",
+            path,
+            "sync.yaml",
+            f"Fix YAML syntax: {exc}",
+        )
+    return validate_sync_manifest(path, manifest)
 
-    sync_event_types: set[str] = set()
-    for path in sync_paths:
-        try:
-            manifest = load_yaml(path)
-        except YamlError as exc:
-            fail(
-                "UIP-SCHEMA-VIOLATION",
-                path,
-                "sync.yaml",
-                f"Fix YAML syntax: {exc}",
-            )
-        sync_event_types.update(validate_sync_manifest(path, manifest))
+
+def check(collect: bool, parallelism: int) -> list[Violation]:
+    event_types, violations = run_event_discovery(collect)
+    sync_paths = discover_sync_manifests()
+    routed, manifest_violations = run_checks(check_sync_manifest, sync_paths, collect, parallelism)
+    violations.extend(manifest_violations)
+    sync_event_types: set[str] = set().union(*(types for types in routed if types is not None))
 
     for event_type, path in event_types.items():
-        if event_type not in sync_event_types:
-            fail(
-                "UIP-BOUNDARY-VIOLATION",
-                path,
-                f"UIP violation: UIEvent type '{event_type}' has no synchronization",
-                "Add a Synchronization trigger for this UIEvent type.",
-            )
+        if event_type in sync_event_types:
+            continue
+        if sync_paths:
+            rule = f"UIP violation: UIEvent type '{event_type}' has no synchronization"
+            suggestion = "Add a Synchronization trigger for this UIEvent type."
+        else:
+            rule = "UIP violation: UIEvent type has no synchronization"
+            suggestion = "Add a Synchronization manifest that routes this UIEvent."
+        violation = Violation("UIP-BOUNDARY-VIOLATION", path, rule, suggestion)
+        if not collect:
+            raise violation
+        violations.append(violation)
+    return violations
+
+
+def main() -> None:
+    run_checker(
+        "check-uip-event-syncs",
+        "Check that every UIEvent type is routed by a valid Synchronization manifest.",
+        check,
+    )
 
 
 if __name__ == "__main__":
@@ -1,14 +1,14 @@
 #!/usr/bin/env python3
-import json
-import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
 import importlib.util
-from typing import Union
+from typing import NoReturn, Union
+
+from uip_discovery import Artifact, DiscoveryError, discover, discover_with_errors
+from uip_report import Violation, run_checker, run_checks
 
 ROOT = Path(__file__).resolve().parent.parent
-DISCOVERY_SCRIPT = ROOT / "scripts/discover-uip-artifacts.py"
 
 # Explicit allowlist for suppressing schema checks (repo-relative paths only).
 ALLOWLIST_PATHS = {
@@ -25,19 +25,8 @@ UI_EVENT_TYPES = {
 UI_EVENT_SCHEMA_VERSIONS = {"1.0.0"}
 
 
-def fail(category: str, file_path: Union[Path, str], rule: str, suggestion: str) -> None:
-    if isinstance(file_path, Path):
-        try:
-            display_path: Union[Path, str] = file_path.relative_to(ROOT)
-        except ValueError:
-            display_path = file_path
-    else:
-        display_path = file_path
-    message = (
-        f"{category} | file: {display_path} | rule: {rule} | suggestion: {suggestion}"
-    )
-    print(message, file=sys.stderr)
-    raise SystemExit(1)
+def fail(category: str, file_path: Union[Path, str], rule: str, suggestion: str) -> NoReturn:
+    raise Violation(category, file_path, rule, suggestion)
 
 
 def is_non_empty_string(value: object) -> bool:
@@ -90,40 +79,12 @@ def load_intent_validator():
     return module
 
 
-def run_discovery() -> list[dict[str, str]]:
-    result = subprocess.run(
-        [sys.executable, str(DISCOVERY_SCRIPT)],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        message = (result.stderr or result.stdout).strip()
-        if message:
-            print(message, file=sys.stderr)
-        raise SystemExit(result.returncode)
-
-    artifacts: list[dict[str, str]] = []
-    for line in result.stdout.splitlines():
-        if not line.strip():
-            continue
-        try:
-            artifact = json.loads(line)
-        except json.JSONDecodeError:
-            fail(
-                "UIP-STRUCTURAL-VIOLATION",
-                DISCOVERY_SCRIPT,
-                "discovery.output",
-                "Ensure discovery emits JSON lines with path/type.",
-            )
-        if "path" not in artifact or "type" not in artifact:
-            fail(
-                "UIP-STRUCTURAL-VIOLATION",
-                DISCOVERY_SCRIPT,
-                "discovery.output",
-                "Ensure discovery emits path/type for every artifact.",
-            )
-        artifacts.append(artifact)
-    return artifacts
+def run_discovery() -> list[Artifact]:
+    try:
+        return discover()
+    except DiscoveryError as exc:
+        print(exc, file=sys.stderr)
+        raise SystemExit(1)
 
 
 def validate_intent(path: Path, data: dict, intent_module) -> None:
@@ -252,48 +213,56 @@ def validate_event(path: Path, data: dict) -> None:
         )
 
 
+# Set by check() before artifacts are validated (and inherited by forked workers).
+_intent_module = None
+
+
+def check_artifact(artifact: Artifact) -> None:
+    artifact_path = artifact.path
+    try:
+        relative = artifact_path.relative_to(ROOT).as_posix()
+    except ValueError:
+        relative = artifact_path.as_posix()
+    if relative in ALLOWLIST_PATHS:
+        return
+
+    payload = artifact.payload
+    if not isinstance(payload, dict):
+        fail(
+            "UIP-SCHEMA-VIOLATION",
+            artifact_path,
+            "artifact.root",
+            "Ensure the artifact is a JSON object.",
+        )
+
+    artifact_type = artifact.type
+    if artifact_type == "intent":
+        validate_intent(artifact_path, payload, _intent_module)
+    elif artifact_type == "event":
+        validate_event(artifact_path, payload)
+    else:
+        fail(
+            "UIP-STRUCTURAL-VIOLATION",
+            artifact_path,
+            "artifact.type",
+            "Ensure artifacts are tagged as intent or event during discovery.",
+        )
+
+
+def check(collect: bool, parallelism: int) -> list[Violation]:
+    global _intent_module
+    _intent_module = load_intent_validator()
+    if not collect:
+        run_checks(check_artifact, run_discovery(), collect=False)
+        return []
+    artifacts, errors = discover_with_errors()
+    _, violations = run_checks(check_artifact, artifacts, collect=True, parallelism=parallelism)
+    violations.extend(Violation.from_discovery_error(exc) for exc in errors)
+    return sorted(violations, key=lambda violation: violation.file)
+
+
 def main() -> None:
-    intent_module = load_intent_validator()
-    artifacts = run_discovery()
-    for artifact in artifacts:
-        artifact_path = Path(artifact["path"])
-        try:
-            relative = artifact_path.relative_to(ROOT).as_posix()
-        except ValueError:
-            relative = artifact_path.as_posix()
-        if relative in ALLOWLIST_PATHS:
-            continue
-
-        try:
-            payload = json.loads(artifact_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            fail(
-                "UIP-STRUCTURAL-VIOLATION",
-                artifact_path,
-                "valid-json",
-                "Fix JSON syntax so the artifact can be parsed.",
-            )
-
-        if not isinstance(payload, dict):
-            fail(
-                "UIP-SCHEMA-VIOLATION",
-                artifact_path,
-                "artifact.root",
-                "Ensure the artifact is a JSON object.",
-            )
-
-        artifact_type = artifact.get("type")
-        if artifact_type == "intent":
-            validate_intent(artifact_path, payload, intent_module)
-        elif artifact_type == "event":
-            validate_event(artifact_path, payload)
-        else:
-            fail(
-                "UIP-STRUCTURAL-VIOLATION",
-                artifact_path,
-                "artifact.type",
-                "Ensure artifacts are tagged as intent or event during discovery.",
-            )
+    run_checker("check-uip-schemas", "Validate UIP intent/event artifacts against the UIP schemas.", check)
 
 
 if __name__ == "__main__":
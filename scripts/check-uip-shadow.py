@@ -1,13 +1,11 @@
 #!/usr/bin/env python3
-import json
-import subprocess
-import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from uip_discovery import Artifact, DiscoveryError, discover
+
 ROOT = Path(__file__).resolve().parent.parent
-DISCOVERY_SCRIPT = ROOT / "scripts/discover-uip-artifacts.py"
 
 INTENT_SCHEMA_VERSION = "0.2.0"
 EVENT_SCHEMA_VERSION = "0.2.0"
@@ -50,31 +48,14 @@ def is_iso8601(value: object) -> bool:
         return False
 
 
-def run_discovery() -> list[dict[str, str]]:
-    result = subprocess.run(
-        [sys.executable, str(DISCOVERY_SCRIPT)],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        message = (result.stderr or result.stdout).strip()
+def run_discovery() -> list[Artifact]:
+    try:
+        return discover()
+    except DiscoveryError as exc:
         print("UIP-0.2 Shadow Validation Results")
-        if message:
-            print(f"Shadow validation skipped: {message}")
-        else:
-            print("Shadow validation skipped: discovery failed.")
+        print(f"Shadow validation skipped: {exc}")
         return []
 
-    artifacts: list[dict[str, str]] = []
-    for line in result.stdout.splitlines():
-        if not line.strip():
-            continue
-        try:
-            artifacts.append(json.loads(line))
-        except json.JSONDecodeError:
-            continue
-    return artifacts
-
 
 def validate_intent(data: dict[str, Any]) -> list[str]:
     errors: list[str] = []
@@ -123,20 +104,14 @@ def main() -> None:
     failures: list[tuple[Path, list[str]]] = []
 
     for artifact in artifacts:
-        path = Path(artifact.get("path", ""))
-        if not path.exists():
-            continue
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            failures.append((path, ["invalid JSON"]))
-            continue
+        path = artifact.path
+        payload = artifact.payload
         if not isinstance(payload, dict):
             failures.append((path, ["artifact must be a JSON object"]))
             continue
-        if artifact.get("type") == "intent":
+        if artifact.type == "intent":
             errors = validate_intent(payload)
-        elif artifact.get("type") == "event":
+        elif artifact.type == "event":
             errors = validate_event(payload)
         else:
             errors = ["unknown artifact type"]
@@ -3,17 +3,27 @@
 from __future__ import annotations
 
 import argparse
+import codecs
+import hashlib
 import json
 import os
 import re
+import select
 import shutil
+import signal
+import socket
+import socketserver
 import subprocess
 import sys
+import tempfile
+import threading
 import time
 import uuid
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Callable
 
 try:
     import jsonschema  # type: ignore
@@ -33,6 +43,44 @@ class SkillRef:
     path: Path
 
 
+@dataclass(frozen=True)
+class RegistryEntry:
+    path: Path
+    manifest: dict[str, Any] | None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class PreparedSkill:
+    ref: SkillRef
+    manifest: dict[str, Any]
+    runtime_type: str
+    command: list[str]
+    cwd: Path
+    timeout_ms: int
+    input_validator: Any
+    output_validator: Any
+
+
+@dataclass(frozen=True)
+class RunOutcome:
+    status: str
+    duration_ms: int
+    exit_code: int | None
+    stderr: bytes
+    error: str | None = None
+
+
+REGISTRY_FORMAT = 1
+VALIDATION_CACHE_FORMAT = 1
+
+# Registry records per repo root, mirrored from `<cache>/registry.json` once per process.
+_REGISTRY_RECORDS: dict[Path, dict[str, Any]] = {}
+
+# Compiled contract validator for `validate` pool workers (set by `_init_validate_worker`).
+_CONTRACT_VALIDATOR: Any = None
+
+
 def _eprint(message: str) -> None:
     print(message, file=sys.stderr)
 
@@ -65,18 +113,6 @@ def _skills_root(repo_root: Path) -> Path:
     return skills_dir
 
 
-def _iter_skill_dirs(skills_dir: Path) -> list[Path]:
-    out: list[Path] = []
-    for entry in sorted(skills_dir.iterdir(), key=lambda p: p.name):
-        if not entry.is_dir():
-            continue
-        if entry.name.startswith("_"):
-            continue
-        if (entry / "skill.yaml").exists():
-            out.append(entry)
-    return out
-
-
 def _strip_yaml_comment(line: str) -> str:
     in_single = False
     in_double = False
@@ -234,10 +270,13 @@ def _json_pointer(err: Any) -> str:
     return "/" + "/".join(parts)
 
 
-def _validate_manifest(manifest: dict[str, Any], schema: dict[str, Any]) -> None:
+def _manifest_validator(schema: dict[str, Any]) -> Any:
     _require_deps()
     validator_cls = jsonschema.validators.validator_for(schema)
-    validator = validator_cls(schema)
+    return validator_cls(schema)
+
+
+def _validate_manifest(manifest: dict[str, Any], validator: Any) -> None:
     errors = sorted(validator.iter_errors(manifest), key=lambda e: (list(e.path), e.message))
     if errors:
         lines = ["Manifest validation failed:"]
@@ -246,6 +285,20 @@ def _validate_manifest(manifest: dict[str, Any], schema: dict[str, Any]) -> None
         raise SkillctlError("\n".join(lines))
 
 
+def _compile_validator(schema: Any) -> Any:
+    _require_deps()
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+def _check_instance(validator: Any, instance: Any) -> None:
+    # Same failure semantics as `jsonschema.validate`, minus the per-call schema check and class build.
+    error = jsonschema.exceptions.best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
+
+
 def _safe_join(base_dir: Path, rel_path: str) -> Path:
     if rel_path.startswith("/"):
         raise SkillctlError(f"Absolute paths are not allowed: {rel_path}")
@@ -258,9 +311,13 @@ def _safe_join(base_dir: Path, rel_path: str) -> Path:
     return candidate
 
 
+def _is_path_target(target: str) -> bool:
+    return "/" in target or target.startswith(".")
+
+
 def _resolve_skill_dir(repo_root: Path, target: str, allow_template: bool = True) -> Path:
     candidate = Path(target)
-    if "/" in target or target.startswith("."):
+    if _is_path_target(target):
         skill_dir = (repo_root / candidate).resolve() if not candidate.is_absolute() else candidate.resolve()
         if not skill_dir.exists():
             raise SkillctlError(f"Skill path not found: {skill_dir}")
@@ -270,14 +327,158 @@ def _resolve_skill_dir(repo_root: Path, target: str, allow_template: bool = True
             raise SkillctlError("Template/internal skills cannot be targeted without explicit allowance")
         return skill_dir
 
-    skills_dir = _skills_root(repo_root)
-    for skill_dir in _iter_skill_dirs(skills_dir):
-        manifest = _load_yaml(skill_dir / "skill.yaml")
-        if manifest.get("id") == target:
-            return skill_dir
+    for entry in _load_registry(repo_root):
+        if entry.manifest is None:
+            raise SkillctlError(entry.error or f"Invalid manifest under: {entry.path}")
+        if entry.manifest.get("id") == target:
+            return entry.path
     raise SkillctlError(f"Unknown skill id: {target}")
 
 
+def _cache_dir(repo_root: Path) -> Path:
+    """Cache directory for `repo_root`; a shared `SKILLCTL_CACHE_DIR` gets one subdirectory per repo."""
+    override = os.environ.get("SKILLCTL_CACHE_DIR")
+    if override:
+        # Records are keyed by repo-relative paths, so two checkouts must never share a directory.
+        root_digest = hashlib.sha256(os.fsencode(repo_root.resolve())).hexdigest()[:16]
+        return Path(override) / root_digest
+    return repo_root / ".skillctl-cache"
+
+
+def _registry_path(repo_root: Path) -> Path:
+    return _cache_dir(repo_root) / "registry.json"
+
+
+def _read_cache_section(path: Path, fmt: int, section: str) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("format") != fmt:
+        return {}
+    records = data.get(section)
+    return records if isinstance(records, dict) else {}
+
+
+def _write_cache_section(path: Path, fmt: int, section: str, records: dict[str, Any]) -> None:
+    payload = {"format": fmt, section: records}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(_canonical_json(payload), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        # Caches are an optimization; read-only checkouts fall back to recomputing.
+        pass
+
+
+def _read_registry_records(repo_root: Path) -> dict[str, Any]:
+    return _read_cache_section(_registry_path(repo_root), REGISTRY_FORMAT, "manifests")
+
+
+def _write_registry_records(repo_root: Path, records: dict[str, Any]) -> None:
+    _write_cache_section(_registry_path(repo_root), REGISTRY_FORMAT, "manifests", records)
+
+
+def _registry_records(repo_root: Path) -> dict[str, Any]:
+    records = _REGISTRY_RECORDS.get(repo_root)
+    if records is None:
+        records = _read_registry_records(repo_root)
+        _REGISTRY_RECORDS[repo_root] = records
+    return records
+
+
+def _registry_key(repo_root: Path, skill_dir: Path) -> str | None:
+    try:
+        return skill_dir.resolve().relative_to(repo_root.resolve()).as_posix()
+    except ValueError:
+        return None
+
+
+def _refresh_record(manifest_path: Path, st: os.stat_result, cached: Any) -> tuple[dict[str, Any], bool]:
+    if (
+        isinstance(cached, dict)
+        and cached.get("mtimeNs") == st.st_mtime_ns
+        and cached.get("size") == st.st_size
+        and ("manifest" in cached or "error" in cached)
+    ):
+        return cached, False
+
+    record: dict[str, Any] = {"mtimeNs": st.st_mtime_ns, "size": st.st_size}
+    try:
+        record["manifest"] = _load_yaml(manifest_path)
+    except (OSError, UnicodeDecodeError, SkillctlError) as e:
+        record["error"] = str(e)
+    return record, True
+
+
+def _entry_from_record(skill_dir: Path, record: dict[str, Any]) -> RegistryEntry:
+    manifest = record.get("manifest")
+    if isinstance(manifest, dict):
+        return RegistryEntry(path=skill_dir, manifest=manifest)
+    return RegistryEntry(path=skill_dir, manifest=None, error=str(record.get("error", "Invalid manifest")))
+
+
+def _load_registry(repo_root: Path) -> list[RegistryEntry]:
+    """Return discoverable Skills in sorted order, re-parsing only manifests whose mtime/size changed."""
+    skills_dir = _skills_root(repo_root)
+    records = _registry_records(repo_root)
+
+    with os.scandir(skills_dir) as it:
+        dir_entries = sorted(
+            (e for e in it if not e.name.startswith("_") and e.is_dir()),
+            key=lambda e: e.name,
+        )
+
+    entries: list[RegistryEntry] = []
+    refreshed: dict[str, Any] = {}
+    dirty = False
+    for dir_entry in dir_entries:
+        skill_dir = Path(dir_entry.path)
+        manifest_path = skill_dir / "skill.yaml"
+        try:
+            st = manifest_path.stat()
+        except OSError:
+            continue
+        key = _registry_key(repo_root, skill_dir) or str(skill_dir)
+        record, changed = _refresh_record(manifest_path, st, records.get(key))
+        dirty = dirty or changed
+        refreshed[key] = record
+        entries.append(_entry_from_record(skill_dir, record))
+
+    prefix = f"{_registry_key(repo_root, skills_dir)}/"
+    for key, record in records.items():
+        if key in refreshed:
+            continue
+        if key.startswith(prefix) and not key[len(prefix):].startswith("_"):
+            dirty = True  # Skill directory was removed or lost its manifest.
+            continue
+        refreshed[key] = record
+
+    if dirty:
+        records.clear()
+        records.update(refreshed)
+        _write_registry_records(repo_root, records)
+    return entries
+
+
+def _load_manifest(repo_root: Path, skill_dir: Path) -> dict[str, Any]:
+    manifest_path = skill_dir / "skill.yaml"
+    key = _registry_key(repo_root, skill_dir)
+    if key is None:
+        return _load_yaml(manifest_path)
+
+    records = _registry_records(repo_root)
+    record, changed = _refresh_record(manifest_path, manifest_path.stat(), records.get(key))
+    if changed:
+        records[key] = record
+        _write_registry_records(repo_root, records)
+    entry = _entry_from_record(skill_dir, record)
+    if entry.manifest is None:
+        raise SkillctlError(entry.error or f"Invalid manifest: {manifest_path}")
+    return entry.manifest
+
+
 def _skill_ref_from_manifest(skill_dir: Path, manifest: dict[str, Any]) -> SkillRef:
     return SkillRef(
         id=str(manifest["id"]),
@@ -292,11 +493,11 @@ def _canonical_json(obj: Any) -> str:
 
 
 def cmd_list(repo_root: Path, args: argparse.Namespace) -> int:
-    skills_dir = _skills_root(repo_root)
     skills = []
-    for skill_dir in _iter_skill_dirs(skills_dir):
-        manifest = _load_yaml(skill_dir / "skill.yaml")
-        skills.append(_skill_ref_from_manifest(skill_dir, manifest))
+    for entry in _load_registry(repo_root):
+        if entry.manifest is None:
+            raise SkillctlError(entry.error or f"Invalid manifest under: {entry.path}")
+        skills.append(_skill_ref_from_manifest(entry.path, entry.manifest))
 
     if args.json:
         payload = [
@@ -313,7 +514,7 @@ def cmd_list(repo_root: Path, args: argparse.Namespace) -> int:
 
 def cmd_describe(repo_root: Path, args: argparse.Namespace) -> int:
     skill_dir = _resolve_skill_dir(repo_root, args.target, allow_template=args.allow_template)
-    manifest = _load_yaml(skill_dir / "skill.yaml")
+    manifest = _load_manifest(repo_root, skill_dir)
     if args.json:
         sys.stdout.write(_canonical_json(manifest))
         return 0
@@ -322,12 +523,8 @@ def cmd_describe(repo_root: Path, args: argparse.Namespace) -> int:
     return 0
 
 
-def _validate_skill_dir(repo_root: Path, skill_dir: Path, args: argparse.Namespace) -> None:
-    skills_dir = _skills_root(repo_root)
-    contract_schema = _load_contract_schema(skills_dir)
-    manifest_path = skill_dir / "skill.yaml"
-    manifest = _load_yaml(manifest_path)
-    _validate_manifest(manifest, contract_schema)
+def _validate_skill_dir(skill_dir: Path, manifest: dict[str, Any], contract_validator: Any) -> None:
+    _validate_manifest(manifest, contract_validator)
 
     input_schema_rel = manifest["io"]["inputSchema"]
     output_schema_rel = manifest["io"]["outputSchema"]
@@ -335,116 +532,1104 @@ def _validate_skill_dir(repo_root: Path, skill_dir: Path, args: argparse.Namespa
     _load_json(_safe_join(skill_dir, output_schema_rel))
 
 
+# Below this many Skills to (re)validate, starting a process pool costs more than it saves.
+VALIDATE_PARALLEL_MIN_SKILLS = 32
+
+
+def _init_validate_worker(contract_schema: dict[str, Any]) -> None:
+    global _CONTRACT_VALIDATOR
+    _CONTRACT_VALIDATOR = _manifest_validator(contract_schema)
+
+
+def _validate_skill_job(skill_dir: Path, manifest: dict[str, Any]) -> str | None:
+    try:
+        _validate_skill_dir(skill_dir, manifest, _CONTRACT_VALIDATOR)
+    except Exception as e:
+        return str(e)
+    return None
+
+
+def _validation_cache_path(repo_root: Path) -> Path:
+    return _cache_dir(repo_root) / "validate.json"
+
+
+def _validation_key(contract_digest: str, skill_dir: Path, manifest: dict[str, Any]) -> str | None:
+    """Hash of everything a validation result depends on, or None when the inputs cannot be read."""
+    hasher = hashlib.sha256(contract_digest.encode("ascii"))
+    try:
+        paths = [
+            skill_dir / "skill.yaml",
+            _safe_join(skill_dir, manifest["io"]["inputSchema"]),
+            _safe_join(skill_dir, manifest["io"]["outputSchema"]),
+        ]
+        for path in paths:
+            data = path.read_bytes()
+            hasher.update(f"{len(data)}\0".encode("ascii"))
+            hasher.update(data)
+    except Exception:
+        return None
+    return hasher.hexdigest()
+
+
 def cmd_validate(repo_root: Path, args: argparse.Namespace) -> int:
     targets = []
     if args.all:
-        targets = [str(p.relative_to(repo_root)) for p in _iter_skill_dirs(_skills_root(repo_root))]
+        targets = [str(entry.path.relative_to(repo_root)) for entry in _load_registry(repo_root)]
     else:
         targets = args.targets
 
-    failures: list[str] = []
-    for target in targets:
+    jobs = int(args.jobs) if args.jobs is not None else (os.cpu_count() or 1)
+    if jobs < 1:
+        raise SkillctlError("--jobs must be a positive integer")
+
+    contract_path = _skills_root(repo_root) / "_schema" / "skill.schema.json"
+    contract_schema = _load_contract_schema(_skills_root(repo_root))
+    contract_digest = hashlib.sha256(contract_path.read_bytes()).hexdigest()
+
+    cache_path = _validation_cache_path(repo_root)
+    cached = {} if args.no_cache else _read_cache_section(cache_path, VALIDATION_CACHE_FORMAT, "results")
+    results: dict[str, Any] = dict(cached)
+
+    errors: dict[int, str] = {}
+    pending: list[tuple[int, str, Path, dict[str, Any], str | None]] = []
+    for index, target in enumerate(targets):
         try:
             skill_dir = _resolve_skill_dir(repo_root, target, allow_template=args.allow_template)
-            _validate_skill_dir(repo_root, skill_dir, args)
+            manifest = _load_manifest(repo_root, skill_dir)
         except Exception as e:
-            failures.append(f"{target}: {e}")
+            errors[index] = f"{target}: {e}"
+            continue
+        key = _registry_key(repo_root, skill_dir) or str(skill_dir)
+        digest = _validation_key(contract_digest, skill_dir, manifest)
+        if digest is not None and cached.get(key) == digest:
+            continue
+        pending.append((index, key, skill_dir, manifest, digest))
+
+    if len(pending) >= VALIDATE_PARALLEL_MIN_SKILLS and jobs > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(pending)),
+            initializer=_init_validate_worker,
+            initargs=(contract_schema,),
+        ) as pool:
+            outcomes = list(pool.map(_validate_skill_job, [p[2] for p in pending], [p[3] for p in pending]))
+    else:
+        _init_validate_worker(contract_schema)
+        outcomes = [_validate_skill_job(p[2], p[3]) for p in pending]
 
-    if failures:
+    for (index, key, _, _, digest), error in zip(pending, outcomes):
+        if error is not None:
+            errors[index] = f"{targets[index]}: {error}"
+            results.pop(key, None)
+        elif digest is not None:
+            results[key] = digest
+
+    for key in [k for k in results if not (repo_root / k / "skill.yaml").exists()]:
+        del results[key]
+    if results != cached and not args.no_cache:
+        _write_cache_section(cache_path, VALIDATION_CACHE_FORMAT, "results", results)
+
+    if errors:
         _eprint("Validation failed:")
-        for f in failures:
-            _eprint(f"- {f}")
+        for index in sorted(errors):
+            _eprint(f"- {errors[index]}")
         return 1
 
     return 0
 
 
-def cmd_run(repo_root: Path, args: argparse.Namespace) -> int:
-    skill_dir = _resolve_skill_dir(repo_root, args.target, allow_template=args.allow_template)
+def _prepare_skill(repo_root: Path, skill_dir: Path, use_worker: bool = False) -> PreparedSkill:
     skills_dir = _skills_root(repo_root)
     contract_schema = _load_contract_schema(skills_dir)
-    manifest = _load_yaml(skill_dir / "skill.yaml")
-    _validate_manifest(manifest, contract_schema)
-    skill_ref = _skill_ref_from_manifest(skill_dir, manifest)
+    manifest = _load_manifest(repo_root, skill_dir)
+    _validate_manifest(manifest, _manifest_validator(contract_schema))
 
     input_schema = _load_json(_safe_join(skill_dir, manifest["io"]["inputSchema"]))
     output_schema = _load_json(_safe_join(skill_dir, manifest["io"]["outputSchema"]))
 
-    raw_input = Path(args.input).read_bytes() if args.input else sys.stdin.buffer.read()
-    try:
-        input_obj = json.loads(raw_input.decode("utf-8"))
-    except Exception as e:
-        raise SkillctlError(f"Input is not valid UTF-8 JSON: {e}") from e
+    runtime = manifest["runtime"]
+    runtime_type, command = str(runtime["type"]), list(runtime["command"])
+    if use_worker and "workerCommand" in runtime:
+        # The worker entry point is opt-in: callers that don't ask keep the manifest's per-run process.
+        runtime_type, command = "worker", list(runtime["workerCommand"])
+    return PreparedSkill(
+        ref=_skill_ref_from_manifest(skill_dir, manifest),
+        manifest=manifest,
+        runtime_type=runtime_type,
+        command=command,
+        cwd=_safe_join(skill_dir, runtime.get("cwd", ".")),
+        timeout_ms=int(runtime.get("timeoutMs", 60000)),
+        input_validator=_compile_validator(input_schema),
+        output_validator=_compile_validator(output_schema),
+    )
 
-    _require_deps()
-    jsonschema.validate(instance=input_obj, schema=input_schema)
 
-    runtime = manifest["runtime"]
-    command = runtime["command"]
-    timeout_ms = int(args.timeout_ms) if args.timeout_ms is not None else int(runtime.get("timeoutMs", 60000))
-    runtime_cwd_rel = runtime.get("cwd", ".")
-    cwd = _safe_join(skill_dir, runtime_cwd_rel)
+class _WorkerExit(SkillctlError):
+    def __init__(self, message: str, exit_code: int | None) -> None:
+        super().__init__(message)
+        self.exit_code = exit_code
+
+
+class _WorkerProcess:
+    """One long-lived `runtime.type: worker` process speaking line-delimited JSON on stdin/stdout.
+
+    Each request is one canonical JSON input line; each reply is one JSON line
+    `{"exitCode": int, "output": <json>, "stderr": str}`. Anything the worker writes to its real
+    stderr outside a reply is drained in the background and attached to the next outcome.
+    """
+
+    def __init__(self, prepared: PreparedSkill) -> None:
+        self.command = prepared.command
+        self.proc = subprocess.Popen(
+            prepared.command,
+            cwd=str(prepared.cwd),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env={**os.environ},
+        )
+        self._buffer = b""
+        self._stderr = bytearray()
+        self._stderr_lock = threading.Lock()
+        self._drain = threading.Thread(target=self._drain_stderr, daemon=True)
+        self._drain.start()
+
+    def _drain_stderr(self) -> None:
+        assert self.proc.stderr is not None
+        for chunk in iter(lambda: self.proc.stderr.read1(65536), b""):  # type: ignore[union-attr]
+            with self._stderr_lock:
+                self._stderr.extend(chunk)
+
+    def take_stderr(self) -> bytes:
+        with self._stderr_lock:
+            data = bytes(self._stderr)
+            self._stderr.clear()
+        return data
+
+    def _read_line(self, deadline: float, timeout_s: float) -> bytes:
+        assert self.proc.stdout is not None
+        fd = self.proc.stdout.fileno()
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                raise subprocess.TimeoutExpired(self.command, timeout_s)
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                exit_code = self.proc.wait()
+                raise _WorkerExit(f"Skill exited with code {exit_code}", exit_code)
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return line
+
+    def request(self, input_obj: Any, timeout_ms: int) -> tuple[int, Any, bytes]:
+        assert self.proc.stdin is not None
+        timeout_s = timeout_ms / 1000.0
+        deadline = time.monotonic() + timeout_s
+        try:
+            self.proc.stdin.write(_canonical_json(input_obj).encode("utf-8"))
+            self.proc.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            exit_code = self.proc.wait()
+            raise _WorkerExit(f"Skill exited with code {exit_code}", exit_code) from e
+
+        line = self._read_line(deadline, timeout_s)
+        try:
+            reply = json.loads(line.decode("utf-8"))
+        except Exception as e:
+            raise SkillctlError(f"Skill stdout is not valid JSON: {e}") from e
+        if not isinstance(reply, dict) or not isinstance(reply.get("exitCode"), int):
+            raise SkillctlError("Skill worker reply must be an object with an integer exitCode")
+        logs = reply.get("stderr") or ""
+        if not isinstance(logs, str):
+            raise SkillctlError("Skill worker reply field 'stderr' must be a string")
+        return reply["exitCode"], reply.get("output"), logs.encode("utf-8")
+
+    def close(self) -> None:
+        if self.proc.poll() is None:
+            try:
+                assert self.proc.stdin is not None
+                self.proc.stdin.close()
+                self.proc.wait(timeout=5)
+            except Exception:
+                self.proc.kill()
+                self.proc.wait()
+        self._drain.join(timeout=1)
+
+
+class _WorkerPool:
+    """Up to `size` warm worker processes; a worker that fails or times out is discarded.
+
+    After `close()`, workers still busy with a request are shut down when they are released.
+    """
+
+    def __init__(self, prepared: PreparedSkill, size: int) -> None:
+        self.prepared = prepared
+        self.size = max(1, size)
+        self._idle: list[_WorkerProcess] = []
+        self._live = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def _checkout(self) -> _WorkerProcess:
+        with self._cond:
+            while not self._idle and self._live >= self.size:
+                self._cond.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._live += 1
+        try:
+            return _WorkerProcess(self.prepared)
+        except Exception:
+            self._release(None)
+            raise
+
+    def _release(self, worker: _WorkerProcess | None) -> None:
+        with self._cond:
+            retire = worker is not None and self._closed
+            if worker is None or retire:
+                self._live -= 1
+            else:
+                self._idle.append(worker)
+            self._cond.notify()
+        if retire:
+            worker.close()  # type: ignore[union-attr]
+
+    def invoke(self, input_obj: Any, timeout_ms: int) -> tuple[int | None, Any, bytes, Exception | None]:
+        worker = self._checkout()
+        try:
+            exit_code, output_obj, logs = worker.request(input_obj, timeout_ms)
+        except Exception as e:
+            worker.proc.kill()
+            worker.close()
+            self._release(None)
+            return getattr(e, "exit_code", None), None, worker.take_stderr(), e
+        self._release(worker)
+        return exit_code, output_obj, worker.take_stderr() + logs, None
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._live -= len(idle)
+        for worker in idle:
+            worker.close()
+
+
+def _worker_pool_for(prepared: PreparedSkill, size: int) -> _WorkerPool | None:
+    if prepared.runtime_type != "worker":
+        return None
+    return _WorkerPool(prepared, size)
+
 
+def _execute_skill(
+    prepared: PreparedSkill,
+    input_obj: Any,
+    timeout_ms: int,
+    write_output: Callable[[bytes], None],
+    workers: _WorkerPool | None = None,
+    canonical: bool = True,
+) -> RunOutcome:
     started = time.monotonic()
-    proc = None
-    stdout = b""
     stderr = b""
     exit_code: int | None = None
     status = "error"
     error_message: str | None = None
 
     try:
-        proc = subprocess.run(
-            command,
-            cwd=str(cwd),
-            input=_canonical_json(input_obj).encode("utf-8"),
-            capture_output=True,
-            timeout=timeout_ms / 1000.0,
-            env={**os.environ},
-        )
-        stdout = proc.stdout
-        stderr = proc.stderr
-        exit_code = proc.returncode
-        if proc.returncode != 0:
-            raise SkillctlError(f"Skill exited with code {proc.returncode}")
+        if prepared.runtime_type == "worker":
+            if workers is None:
+                raise SkillctlError("Worker runtime requires a worker pool")
+            exit_code, output_obj, stderr, failure = workers.invoke(input_obj, timeout_ms)
+            if failure is not None:
+                raise failure
+            if exit_code != 0:
+                raise SkillctlError(f"Skill exited with code {exit_code}")
+        else:
+            proc = subprocess.run(
+                prepared.command,
+                cwd=str(prepared.cwd),
+                input=_canonical_json(input_obj).encode("utf-8"),
+                capture_output=True,
+                timeout=timeout_ms / 1000.0,
+                env={**os.environ},
+            )
+            stderr = proc.stderr
+            exit_code = proc.returncode
+            if proc.returncode != 0:
+                raise SkillctlError(f"Skill exited with code {proc.returncode}")
+
+            try:
+                output_obj = json.loads(proc.stdout.decode("utf-8"))
+            except Exception as e:
+                raise SkillctlError(f"Skill stdout is not valid JSON: {e}") from e
+
+        _check_instance(prepared.output_validator, output_obj)
+        status = "success"
+        if canonical:
+            write_output(_canonical_json(output_obj).encode("utf-8"))
+        elif prepared.runtime_type == "worker":
+            write_output(json.dumps(output_obj, separators=(",", ":")).encode("utf-8") + b"\n")
+        else:
+            write_output(proc.stdout)
+    except Exception as e:
+        error_message = str(e)
+
+    return RunOutcome(
+        status=status,
+        duration_ms=int((time.monotonic() - started) * 1000),
+        exit_code=exit_code,
+        stderr=stderr,
+        error=error_message,
+    )
+
+
+_STREAMABLE_OBJECT_KEYS = {"$schema", "$id", "title", "description", "type", "required", "properties", "additionalProperties"}
+_STREAMABLE_ARRAY_KEYS = {"title", "description", "type", "items", "minItems", "maxItems"}
+
+
+class _JsonStreamReader:
+    """Incremental reader that decodes one JSON value at a time from a byte stream."""
+
+    def __init__(self, stream: BinaryIO, chunk_size: int = 1 << 16, subject: str = "Skill stdout") -> None:
+        self._stream = stream
+        self._subject = subject
+        self._chunk_size = chunk_size
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, min_size: int = 0) -> bool:
+        if self._eof:
+            return False
+        if self._pos:
+            self._buf = self._buf[self._pos :]
+            self._pos = 0
+        target = max(min_size, len(self._buf) + 1)
+        while len(self._buf) < target:
+            data = self._stream.read1(self._chunk_size)  # type: ignore[attr-defined]
+            if not data:
+                self._buf += self._utf8.decode(b"", final=True)
+                self._eof = True
+                break
+            self._buf += self._utf8.decode(data)
+        return True
+
+    def error(self, message: str) -> SkillctlError:
+        return SkillctlError(f"{self._subject} is not valid JSON: {message}")
+
+    def peek(self) -> str:
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def take(self, allowed: str) -> str:
+        ch = self.peek()
+        if not ch or ch not in allowed:
+            raise self.error(f"expected one of {allowed!r}, found {ch or 'end of output'!r}")
+        self._pos += 1
+        return ch
+
+    def read_value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as e:
+                if not self._fill(2 * (len(self._buf) - self._pos)):
+                    raise self.error(str(e)) from e
+                continue
+            # A value touching the buffer end may be a truncated number or literal; confirm with more data.
+            if end < len(self._buf) or not self._fill(len(self._buf) - self._pos + 1):
+                self._pos = end
+                return value
+
+    def expect_end(self) -> None:
+        if self.peek():
+            raise self.error("extra data after the top-level value")
+
+
+def _streamable_arrays(schema: Any) -> dict[str, dict[str, Any]]:
+    if not isinstance(schema, dict) or set(schema) - _STREAMABLE_OBJECT_KEYS or schema.get("type") != "object":
+        return {}
+    arrays: dict[str, dict[str, Any]] = {}
+    for key, sub in (schema.get("properties") or {}).items():
+        if (
+            isinstance(sub, dict)
+            and sub.get("type") == "array"
+            and isinstance(sub.get("items"), dict)
+            and not set(sub) - _STREAMABLE_ARRAY_KEYS
+        ):
+            arrays[key] = sub
+    return arrays
+
+
+OUTPUT_VALIDATION_FAILURE = "Skill output failed schema validation"
+INPUT_VALIDATION_FAILURE = "Input validation failed"
+
+
+def _discard_bytes(data: bytes) -> None:
+    pass
+
 
+def _stream_array(
+    reader: _JsonStreamReader,
+    item_validator: Any,
+    key: str,
+    write: Callable[[bytes], None],
+    canonical: bool,
+    failure: str = OUTPUT_VALIDATION_FAILURE,
+) -> int:
+    reader.take("[")
+    write(b"[")
+    count = 0
+    if reader.peek() == "]":
+        reader.take("]")
+    else:
+        while True:
+            item = reader.read_value()
+            error = jsonschema.exceptions.best_match(item_validator.iter_errors(item))
+            if error is not None:
+                pointer = _json_pointer(error).rstrip("/")
+                raise SkillctlError(f"{failure} at /{key}/{count}{pointer}: {error.message}")
+            write((b"," if count else b"") + json.dumps(item, separators=(",", ":"), sort_keys=canonical).encode("utf-8"))
+            count += 1
+            if reader.take(",]") == "]":
+                break
+    write(b"]")
+    return count
+
+
+def _copy_spool(spool: Any, emit: Callable[[bytes], None]) -> None:
+    spool.seek(0)
+    for chunk in iter(lambda: spool.read(1 << 20), b""):
+        emit(chunk)
+
+
+def _close_spools(arrival: Any, spools: dict[str, Any]) -> None:
+    for spool in spools.values():
+        spool.close()
+    if arrival is not None:
+        arrival.close()
+
+
+def _stream_validated_value(
+    reader: _JsonStreamReader,
+    validator: Any,
+    emit: Callable[[bytes], None] | None,
+    canonical: bool,
+    failure: str = OUTPUT_VALIDATION_FAILURE,
+) -> Callable[[], None]:
+    """Decode and validate one value; return a callback that emits it (nothing, if `emit` is None).
+
+    Top-level array properties with a plain `items` schema are validated item by item and never held in
+    memory: they are spooled to disk, and nothing reaches `emit` until the whole value has validated.
+    Other schemas fall back to whole-value validation.
+    """
+    schema = validator.schema
+    arrays = _streamable_arrays(schema)
+    if not arrays or reader.peek() != "{":
+        value = reader.read_value()
+        _check_instance(validator, value)
+        if emit is None:
+            return lambda: None
+        encoded = json.dumps(value, separators=(",", ":"), sort_keys=canonical).encode("utf-8") + b"\n"
+        return lambda: emit(encoded)
+
+    # Canonical output spools each array on its own so keys can be sorted at the end; otherwise the whole
+    # value is spooled in arrival order.
+    spools: dict[str, Any] = {}
+    arrival = None if canonical or emit is None else tempfile.TemporaryFile()
+    write = arrival.write if arrival is not None else _discard_bytes
+    try:
+        reader.take("{")
+        skeleton: dict[str, Any] = {}
+        counts: dict[str, int] = {}
+        write(b"{")
+        if reader.peek() == "}":
+            reader.take("}")
+        else:
+            while True:
+                key = reader.read_value()
+                if not isinstance(key, str):
+                    raise reader.error("object keys must be strings")
+                reader.take(":")
+                write((b"," if skeleton else b"") + json.dumps(key).encode("utf-8") + b":")
+                if key in arrays and reader.peek() == "[":
+                    item_validator = validator.evolve(schema=arrays[key]["items"])
+                    if canonical and emit is not None:
+                        spools[key] = tempfile.TemporaryFile()
+                        counts[key] = _stream_array(reader, item_validator, key, spools[key].write, canonical, failure)
+                    else:
+                        counts[key] = _stream_array(reader, item_validator, key, write, canonical, failure)
+                    skeleton[key] = []
+                else:
+                    skeleton[key] = reader.read_value()
+                    write(json.dumps(skeleton[key], separators=(",", ":")).encode("utf-8"))
+                if reader.take(",}") == "}":
+                    break
+        write(b"}\n")
+
+        properties = {**schema.get("properties", {}), **{key: {"type": "array"} for key in counts}}
+        _check_instance(validator.evolve(schema={**schema, "properties": properties}), skeleton)
+        for key, count in counts.items():
+            if count < arrays[key].get("minItems", 0):
+                raise SkillctlError(f"{failure} at /{key}: expected at least {arrays[key]['minItems']} items")
+            if "maxItems" in arrays[key] and count > arrays[key]["maxItems"]:
+                raise SkillctlError(f"{failure} at /{key}: expected at most {arrays[key]['maxItems']} items")
+    except BaseException:
+        _close_spools(arrival, spools)
+        raise
+
+    def finish() -> None:
         try:
-            output_obj = json.loads(stdout.decode("utf-8"))
-        except Exception as e:
-            raise SkillctlError(f"Skill stdout is not valid JSON: {e}") from e
+            if emit is None:
+                return
+            if arrival is not None:
+                _copy_spool(arrival, emit)
+                return
+            emit(b"{")
+            for index, key in enumerate(sorted(skeleton)):
+                emit((b"," if index else b"") + json.dumps(key).encode("utf-8") + b":")
+                if key in spools:
+                    _copy_spool(spools[key], emit)
+                else:
+                    emit(json.dumps(skeleton[key], separators=(",", ":"), sort_keys=True).encode("utf-8"))
+            emit(b"}\n")
+        finally:
+            _close_spools(arrival, spools)
+
+    return finish
+
+
+def _stream_worker_reply(
+    reader: _JsonStreamReader,
+    validator: Any,
+    emit: Callable[[bytes], None],
+    canonical: bool,
+) -> tuple[int, str, Callable[[], None] | None]:
+    exit_code: int | None = None
+    logs = ""
+    finish: Callable[[], None] | None = None
+    reader.take("{")
+    if reader.peek() == "}":
+        reader.take("}")
+    else:
+        while True:
+            key = reader.read_value()
+            reader.take(":")
+            if key == "output" and exit_code in (None, 0):
+                finish = _stream_validated_value(reader, validator, emit, canonical)
+            else:
+                value = reader.read_value()
+                if key == "exitCode" and isinstance(value, int):
+                    exit_code = value
+                elif key == "stderr" and isinstance(value, str):
+                    logs = value
+            if reader.take(",}") == "}":
+                break
+    if exit_code is None:
+        raise SkillctlError("Skill worker reply must be an object with an integer exitCode")
+    return exit_code, logs, finish
+
+
+def _execute_skill_streaming(
+    prepared: PreparedSkill,
+    input_file: BinaryIO,
+    timeout_ms: int,
+    sink: BinaryIO,
+    canonical: bool,
+) -> RunOutcome:
+    """Run one input with bounded memory: input is piped in chunks, output is validated as it arrives."""
+    started = time.monotonic()
+    exit_code: int | None = None
+    status = "error"
+    error_message: str | None = None
+    logs = b""
+    timed_out = threading.Event()
+    stderr_file = tempfile.TemporaryFile()
+
+    proc = subprocess.Popen(
+        prepared.command,
+        cwd=str(prepared.cwd),
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=stderr_file,
+        env={**os.environ},
+    )
+
+    def feed() -> None:
+        assert proc.stdin is not None
+        try:
+            shutil.copyfileobj(input_file, proc.stdin, 1 << 20)
+            proc.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+
+    def expire() -> None:
+        timed_out.set()
+        proc.kill()
 
-        jsonschema.validate(instance=output_obj, schema=output_schema)
+    feeder = threading.Thread(target=feed, daemon=True)
+    feeder.start()
+    timer = threading.Timer(timeout_ms / 1000.0, expire)
+    timer.start()
+    try:
+        assert proc.stdout is not None
+        reader = _JsonStreamReader(proc.stdout)
+        reply_code: int | None = None
+        parse_error: Exception | None = None
+        finish: Callable[[], None] | None = None
+        killed = False
+        try:
+            if prepared.runtime_type == "worker":
+                reply_code, reply_logs, finish = _stream_worker_reply(reader, prepared.output_validator, sink.write, canonical)
+                logs = reply_logs.encode("utf-8")
+            else:
+                finish = _stream_validated_value(reader, prepared.output_validator, sink.write, canonical)
+                reader.expect_end()
+        except Exception as e:
+            parse_error = e
+            killed = proc.poll() is None
+            if killed:
+                proc.kill()
+
+        proc.wait()
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(prepared.command, timeout_ms / 1000.0)
+        exit_code = reply_code if reply_code is not None else proc.returncode
+        if exit_code != 0 and not killed:
+            raise SkillctlError(f"Skill exited with code {exit_code}")
+        if parse_error is not None:
+            raise parse_error
+        if finish is None:
+            raise SkillctlError("Skill worker reply is missing output")
         status = "success"
-        normalized = _canonical_json(output_obj).encode("utf-8")
-        if args.output:
-            Path(args.output).write_bytes(normalized)
-        else:
-            sys.stdout.buffer.write(normalized)
+        finish()
     except Exception as e:
         error_message = str(e)
     finally:
-        duration_ms = int((time.monotonic() - started) * 1000)
-        if stderr:
-            sys.stderr.buffer.write(stderr)
-            if not stderr.endswith(b"\n"):
-                sys.stderr.buffer.write(b"\n")
-
-        report = {
-            "event": "skill_run_report",
-            "skill": {
-                "id": skill_ref.id,
-                "version": skill_ref.version,
-                "path": str(skill_ref.path.relative_to(repo_root)),
-            },
-            "status": status,
-            "durationMs": duration_ms,
-            "exitCode": exit_code,
-        }
-        if error_message:
-            report["error"] = error_message
+        timer.cancel()
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        feeder.join(timeout=1)
+        stderr_file.seek(0)
+        stderr = stderr_file.read() + logs
+        stderr_file.close()
+
+    return RunOutcome(
+        status=status,
+        duration_ms=int((time.monotonic() - started) * 1000),
+        exit_code=exit_code,
+        stderr=stderr,
+        error=error_message,
+    )
+
+
+def _report_skill(repo_root: Path, ref: SkillRef) -> dict[str, str]:
+    return {
+        "id": ref.id,
+        "version": ref.version,
+        "path": str(ref.path.relative_to(repo_root)),
+    }
+
+
+def _run_report(repo_root: Path, ref: SkillRef, outcome: RunOutcome) -> dict[str, Any]:
+    report: dict[str, Any] = {
+        "event": "skill_run_report",
+        "skill": _report_skill(repo_root, ref),
+        "status": outcome.status,
+        "durationMs": outcome.duration_ms,
+        "exitCode": outcome.exit_code,
+    }
+    if outcome.error:
+        report["error"] = outcome.error
+    return report
+
+
+def _emit_skill_stderr(stderr: bytes) -> None:
+    if stderr:
+        sys.stderr.buffer.write(stderr)
+        if not stderr.endswith(b"\n"):
+            sys.stderr.buffer.write(b"\n")
+
+
+def _output_writer(args: argparse.Namespace) -> Callable[[bytes], None]:
+    if args.output:
+        return Path(args.output).write_bytes
+    return sys.stdout.buffer.write
+
+
+def _read_run_input(args: argparse.Namespace) -> Any:
+    raw_input = Path(args.input).read_bytes() if args.input else sys.stdin.buffer.read()
+    try:
+        return json.loads(raw_input.decode("utf-8"))
+    except Exception as e:
+        raise SkillctlError(f"Input is not valid UTF-8 JSON: {e}") from e
+
+
+def _describe_validation_error(err: Exception) -> str:
+    if jsonschema is not None and isinstance(err, jsonschema.exceptions.ValidationError):
+        return f"Input validation failed at {_json_pointer(err)}: {err.message}"
+    return str(err)
+
+
+def _run_batch_record(
+    prepared: PreparedSkill,
+    line: bytes,
+    timeout_ms: int,
+    workers: _WorkerPool | None,
+) -> tuple[RunOutcome, bytes | None]:
+    try:
+        input_obj = json.loads(line.decode("utf-8"))
+    except Exception as e:
+        return RunOutcome(status="error", duration_ms=0, exit_code=None, stderr=b"", error=f"Input is not valid UTF-8 JSON: {e}"), None
+    try:
+        _check_instance(prepared.input_validator, input_obj)
+    except Exception as e:
+        return RunOutcome(status="error", duration_ms=0, exit_code=None, stderr=b"", error=_describe_validation_error(e)), None
+
+    outputs: list[bytes] = []
+    outcome = _execute_skill(prepared, input_obj, timeout_ms, outputs.append, workers)
+    return outcome, (outputs[0] if outputs else None)
+
+
+def _run_batch(repo_root: Path, args: argparse.Namespace, prepared: PreparedSkill, timeout_ms: int) -> int:
+    jobs = int(args.jobs) if args.jobs is not None else (os.cpu_count() or 1)
+    if jobs < 1:
+        raise SkillctlError("--jobs must be a positive integer")
+
+    started = time.monotonic()
+    total = 0
+    succeeded = 0
+    source: BinaryIO = Path(args.input).open("rb") if args.input else sys.stdin.buffer
+    sink: BinaryIO = Path(args.output).open("wb") if args.output else sys.stdout.buffer
+    pending: deque[tuple[int, Future[tuple[RunOutcome, bytes | None]]]] = deque()
+    workers = _worker_pool_for(prepared, jobs)
+
+    def emit_next() -> None:
+        nonlocal total, succeeded
+        record, future = pending.popleft()
+        outcome, output = future.result()
+        total += 1
+        if outcome.status == "success" and output is not None:
+            succeeded += 1
+            sink.write(output)
+        else:
+            # Failed records keep their slot so output line N always answers input record N.
+            sink.write(b"null\n")
+        sink.flush()
+        _emit_skill_stderr(outcome.stderr)
+        report = _run_report(repo_root, prepared.ref, outcome)
+        report["record"] = record
         sys.stderr.write(_canonical_json(report))
 
-    return 0 if status == "success" else 1
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            # Blank lines get no output line, so `record` counts only the records that do.
+            for record, line in enumerate((line for line in source if line.strip()), start=1):
+                pending.append((record, pool.submit(_run_batch_record, prepared, line, timeout_ms, workers)))
+                while len(pending) >= jobs * 2:
+                    emit_next()
+            while pending:
+                emit_next()
+    finally:
+        if workers is not None:
+            workers.close()
+        if args.input:
+            source.close()
+        if args.output:
+            sink.close()
+
+    summary = {
+        "event": "skill_batch_summary",
+        "skill": _report_skill(repo_root, prepared.ref),
+        "total": total,
+        "succeeded": succeeded,
+        "failed": total - succeeded,
+        "jobs": jobs,
+        "durationMs": int((time.monotonic() - started) * 1000),
+    }
+    sys.stderr.write(_canonical_json(summary))
+    return 0 if succeeded == total else 1
+
+
+_LINE_BREAKS_TO_SPACES = bytes.maketrans(b"\r\n", b"  ")
+
+
+def _validate_streamed_input(source: BinaryIO, validator: Any) -> None:
+    reader = _JsonStreamReader(source, subject="Input")
+    try:
+        _stream_validated_value(reader, validator, None, canonical=False, failure=INPUT_VALIDATION_FAILURE)
+        reader.expect_end()
+    except UnicodeDecodeError as e:
+        raise SkillctlError(f"Input is not valid UTF-8 JSON: {e}") from e
+
+
+def _run_streaming(args: argparse.Namespace, prepared: PreparedSkill) -> RunOutcome:
+    with tempfile.TemporaryFile() as spooled_input:
+        if args.input:
+            source: BinaryIO = Path(args.input).open("rb")
+        else:
+            shutil.copyfileobj(sys.stdin.buffer, spooled_input, 1 << 20)
+            spooled_input.seek(0)
+            source = spooled_input
+        try:
+            # Validated the same way as streamed output: array items one at a time, then the bytes are piped
+            # through unchanged.
+            _validate_streamed_input(source, prepared.input_validator)
+            source.seek(0)
+            if prepared.runtime_type == "worker":
+                # Worker requests are single lines. Line breaks in valid JSON can only be whitespace (they are
+                # never inside strings or multi-byte sequences), so blanking them keeps the value intact.
+                request = tempfile.TemporaryFile()
+                for chunk in iter(lambda: source.read(1 << 20), b""):
+                    request.write(chunk.translate(_LINE_BREAKS_TO_SPACES))
+                request.write(b"\n")
+                request.seek(0)
+                source.close()
+                source = request
+
+            timeout_ms = int(args.timeout_ms) if args.timeout_ms is not None else prepared.timeout_ms
+            canonical = not args.no_canonical
+            if not args.output:
+                return _execute_skill_streaming(prepared, source, timeout_ms, sys.stdout.buffer, canonical)
+
+            output_path = Path(args.output)
+            partial_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.partial")
+            with partial_path.open("wb") as sink:
+                outcome = _execute_skill_streaming(prepared, source, timeout_ms, sink, canonical)
+            if outcome.status == "success":
+                os.replace(partial_path, output_path)
+            else:
+                partial_path.unlink(missing_ok=True)
+            return outcome
+        finally:
+            source.close()
+
+
+def cmd_run(repo_root: Path, args: argparse.Namespace) -> int:
+    if args.server:
+        if args.batch or args.stream or args.worker:
+            raise SkillctlError("--batch, --stream and --worker cannot be combined with --server (use `serve --worker`)")
+        return _run_via_server(repo_root, args)
+    if args.batch and args.stream:
+        raise SkillctlError("--batch cannot be combined with --stream")
+
+    skill_dir = _resolve_skill_dir(repo_root, args.target, allow_template=args.allow_template)
+    prepared = _prepare_skill(repo_root, skill_dir, use_worker=args.worker)
+    if args.batch:
+        timeout_ms = int(args.timeout_ms) if args.timeout_ms is not None else prepared.timeout_ms
+        return _run_batch(repo_root, args, prepared, timeout_ms)
+
+    if args.stream:
+        outcome = _run_streaming(args, prepared)
+    else:
+        input_obj = _read_run_input(args)
+        _check_instance(prepared.input_validator, input_obj)
+
+        timeout_ms = int(args.timeout_ms) if args.timeout_ms is not None else prepared.timeout_ms
+        workers = _worker_pool_for(prepared, 1)
+        try:
+            outcome = _execute_skill(
+                prepared, input_obj, timeout_ms, _output_writer(args), workers, canonical=not args.no_canonical
+            )
+        finally:
+            if workers is not None:
+                workers.close()
+    sys.stdout.flush()
+    _emit_skill_stderr(outcome.stderr)
+    sys.stderr.write(_canonical_json(_run_report(repo_root, prepared.ref, outcome)))
+    return 0 if outcome.status == "success" else 1
+
+
+def _default_socket_path(repo_root: Path) -> Path:
+    return _cache_dir(repo_root) / "skillctl.sock"
+
+
+def _file_signature(path: Path) -> tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _prepared_signature(repo_root: Path, skill_dir: Path, manifest: dict[str, Any]) -> tuple[Any, ...]:
+    return (
+        _file_signature(_skills_root(repo_root) / "_schema" / "skill.schema.json"),
+        _file_signature(skill_dir / "skill.yaml"),
+        _file_signature(_safe_join(skill_dir, manifest["io"]["inputSchema"])),
+        _file_signature(_safe_join(skill_dir, manifest["io"]["outputSchema"])),
+    )
+
+
+class _WarmSkills:
+    """Prepared skills (manifest, schemas, compiled validators) kept warm across serve requests."""
+
+    def __init__(self, repo_root: Path, workers_per_skill: int, use_worker: bool = False) -> None:
+        self.repo_root = repo_root
+        self.workers_per_skill = workers_per_skill
+        self.use_worker = use_worker
+        self._lock = threading.Lock()
+        self._prepared: dict[Path, tuple[tuple[Any, ...], PreparedSkill, _WorkerPool | None]] = {}
+
+    def get(self, target: str, allow_template: bool) -> tuple[PreparedSkill, _WorkerPool | None]:
+        with self._lock:
+            skill_dir = _resolve_skill_dir(self.repo_root, target, allow_template=allow_template)
+            cached = self._prepared.get(skill_dir)
+            if cached is not None:
+                try:
+                    if _prepared_signature(self.repo_root, skill_dir, cached[1].manifest) == cached[0]:
+                        return cached[1], cached[2]
+                except (OSError, SkillctlError):
+                    pass
+                if cached[2] is not None:
+                    cached[2].close()
+            prepared = _prepare_skill(self.repo_root, skill_dir, use_worker=self.use_worker)
+            workers = _worker_pool_for(prepared, self.workers_per_skill)
+            signature = _prepared_signature(self.repo_root, skill_dir, prepared.manifest)
+            self._prepared[skill_dir] = (signature, prepared, workers)
+            return prepared, workers
+
+    def close(self) -> None:
+        with self._lock:
+            for _, _, workers in self._prepared.values():
+                if workers is not None:
+                    workers.close()
+            self._prepared.clear()
+
+
+def _handle_serve_request(warm: _WarmSkills, request: Any) -> dict[str, Any]:
+    try:
+        if not isinstance(request, dict):
+            raise SkillctlError("Request must be a JSON object")
+        target = request.get("target")
+        if not isinstance(target, str) or not target:
+            raise SkillctlError("Request field 'target' must be a non-empty string")
+        if _is_path_target(target) and not Path(target).is_absolute():
+            # The server's repo root and cwd need not be the client's, so a relative path is ambiguous.
+            raise SkillctlError(f"Request field 'target' must be a skill id or an absolute path: {target}")
+        if "input" not in request:
+            raise SkillctlError("Request field 'input' is required")
+        timeout_raw = request.get("timeoutMs")
+        if timeout_raw is not None and (not isinstance(timeout_raw, int) or timeout_raw < 1):
+            raise SkillctlError("Request field 'timeoutMs' must be a positive integer")
+
+        prepared, workers = warm.get(target, allow_template=bool(request.get("allowTemplate", False)))
+        _check_instance(prepared.input_validator, request["input"])
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+
+    outputs: list[bytes] = []
+    timeout_ms = timeout_raw if timeout_raw is not None else prepared.timeout_ms
+    outcome = _execute_skill(prepared, request["input"], timeout_ms, outputs.append, workers)
+    report = _run_report(warm.repo_root, prepared.ref, outcome)
+    sys.stderr.write(_canonical_json(report))
+    response: dict[str, Any] = {
+        "ok": outcome.status == "success",
+        "stderr": outcome.stderr.decode("utf-8", errors="replace"),
+        "report": report,
+    }
+    if outputs:
+        response["output"] = outputs[0].decode("utf-8")
+    return response
+
+
+class _ServeHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        warm: _WarmSkills = self.server.warm  # type: ignore[attr-defined]
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line.decode("utf-8"))
+            except Exception as e:
+                response: dict[str, Any] = {"ok": False, "error": f"Request is not valid UTF-8 JSON: {e}"}
+            else:
+                response = _handle_serve_request(warm, request)
+            self.wfile.write(_canonical_json(response).encode("utf-8"))
+            self.wfile.flush()
+
+
+class _ServeServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def _interrupt_on_signal(signum: int, frame: Any) -> None:
+    raise KeyboardInterrupt
+
+
+def cmd_serve(repo_root: Path, args: argparse.Namespace) -> int:
+    _require_deps()
+    socket_path = Path(args.socket) if args.socket else _default_socket_path(repo_root)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(socket_path))
+        except OSError:
+            socket_path.unlink()
+        else:
+            raise SkillctlError(f"skillctl serve is already listening on: {socket_path}")
+        finally:
+            probe.close()
+
+    workers_per_skill = int(args.workers) if args.workers is not None else (os.cpu_count() or 1)
+    if workers_per_skill < 1:
+        raise SkillctlError("--workers must be a positive integer")
+    warm = _WarmSkills(repo_root, workers_per_skill, use_worker=args.worker)
+    _load_registry(repo_root)
+    with _ServeServer(str(socket_path), _ServeHandler) as server:
+        server.warm = warm  # type: ignore[attr-defined]
+        signal.signal(signal.SIGTERM, _interrupt_on_signal)
+        _eprint(f"skillctl serving on: {socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            warm.close()
+            socket_path.unlink(missing_ok=True)
+    return 0
+
+
+def _run_via_server(repo_root: Path, args: argparse.Namespace) -> int:
+    # Path targets resolve against this client's repo root, as in a local run; ids resolve on the server.
+    target = args.target
+    if _is_path_target(target):
+        target = str(_resolve_skill_dir(repo_root, target, allow_template=args.allow_template))
+    request: dict[str, Any] = {
+        "target": target,
+        "input": _read_run_input(args),
+        "allowTemplate": bool(args.allow_template),
+    }
+    if args.timeout_ms is not None:
+        request["timeoutMs"] = int(args.timeout_ms)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        try:
+            conn.connect(args.server)
+        except OSError as e:
+            raise SkillctlError(f"Could not connect to skillctl server at {args.server}: {e}") from e
+        with conn.makefile("rwb") as stream:
+            stream.write(_canonical_json(request).encode("utf-8"))
+            stream.flush()
+            line = stream.readline()
+    if not line:
+        raise SkillctlError("skillctl server closed the connection without a response")
+    response = json.loads(line.decode("utf-8"))
+
+    if "report" not in response:
+        raise SkillctlError(str(response.get("error", "skillctl server returned an invalid response")))
+    if "output" in response:
+        _output_writer(args)(response["output"].encode("utf-8"))
+        sys.stdout.flush()
+    _emit_skill_stderr(response.get("stderr", "").encode("utf-8"))
+    sys.stderr.write(_canonical_json(response["report"]))
+    return 0 if response.get("ok") else 1
 
 
 def _yaml_quote(value: str) -> str:
@@ -636,6 +1821,8 @@ def build_parser() -> argparse.ArgumentParser:
     p_validate.add_argument("targets", nargs="*")
     p_validate.add_argument("--all", action="store_true")
     p_validate.add_argument("--allow-template", action="store_true", help="Allow targeting skills under skills/_*.")
+    p_validate.add_argument("--jobs", type=int, default=None, help="Parallel validation processes for large batches (default: CPU count).")
+    p_validate.add_argument("--no-cache", action="store_true", help="Ignore and do not update the validation result cache.")
     p_validate.set_defaults(func=cmd_validate)
 
     p_run = subparsers.add_parser("run")
@@ -644,8 +1831,20 @@ def build_parser() -> argparse.ArgumentParser:
     p_run.add_argument("--output", help="Write output JSON to a file (default: stdout).")
     p_run.add_argument("--timeout-ms", type=int, default=None)
     p_run.add_argument("--allow-template", action="store_true", help="Allow targeting skills under skills/_*.")
+    p_run.add_argument("--server", default=None, help="Send the run to a `skillctl serve` Unix socket.")
+    p_run.add_argument("--batch", action="store_true", help="Treat input as NDJSON (one input per line) and emit NDJSON outputs in order.")
+    p_run.add_argument("--jobs", type=int, default=None, help="Concurrent Skill processes for --batch (default: CPU count).")
+    p_run.add_argument("--stream", action="store_true", help="Validate input and output incrementally so memory stays bounded for large array payloads.")
+    p_run.add_argument("--no-canonical", action="store_true", help="Emit validated output without canonical key ordering.")
+    p_run.add_argument("--worker", action="store_true", help="Use the Skill's opt-in `runtime.workerCommand` when it declares one.")
     p_run.set_defaults(func=cmd_run)
 
+    p_serve = subparsers.add_parser("serve")
+    p_serve.add_argument("--socket", default=None, help="Unix socket path (default: .skillctl-cache/skillctl.sock).")
+    p_serve.add_argument("--workers", type=int, default=None, help="Max warm processes per worker-runtime Skill (default: CPU count).")
+    p_serve.add_argument("--worker", action="store_true", help="Use each Skill's opt-in `runtime.workerCommand` when it declares one.")
+    p_serve.set_defaults(func=cmd_serve)
+
     p_scaffold = subparsers.add_parser("scaffold")
     p_scaffold.add_argument("skill_id", help="New skill id (example: fs.hash_tree).")
     p_scaffold.add_argument("slug", help="New skill slug under skills/ (example: fs-hash-tree).")
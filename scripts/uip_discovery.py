@@ -0,0 +1,373 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Directories whose *.json files are artifacts regardless of suffix ("auto" still requires one).
+KNOWN_DIRS = {
+    "ui-artifacts": "auto",
+    "ui-contracts/examples": "event",
+    "synchronizations/examples": "event",
+    "skills/ui-intent-emit/examples": "intent",
+    "concepts/ui-intent-protocol/handlers/reference": "intent",
+}
+
+ARTIFACT_SUFFIXES = {
+    ".intent.json": "intent",
+    ".event.json": "event",
+}
+
+# Directories never descended into, in addition to anything the repo's .gitignore files exclude.
+# Bare names match at any depth; entries containing "/" are repo-relative paths.
+# Extend with UIP_DISCOVERY_PRUNE (comma-separated) or `discover(prune=...)`.
+DEFAULT_PRUNE = (
+    ".git",
+    "node_modules",
+    ".venv",
+    "venv",
+    ".venv-skillctl",
+    "dist",
+    "__pycache__",
+    ".skillctl-cache",
+    ".uip-cache",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+    ".tox",
+    ".nox",
+)
+PRUNE_ENV = "UIP_DISCOVERY_PRUNE"
+
+MANIFEST_PATH = ROOT / ".uip-cache" / "artifacts.json"
+MANIFEST_FORMAT = 2
+
+
+class DiscoveryError(Exception):
+    """An artifact that cannot be loaded; `str()` is the UIP-STRUCTURAL-VIOLATION report line."""
+
+    def __init__(self, file_path: Path, rule: str, suggestion: str) -> None:
+        try:
+            display_path: Path = file_path.relative_to(ROOT)
+        except ValueError:
+            display_path = file_path
+        super().__init__(
+            "UIP-STRUCTURAL-VIOLATION"
+            f" | file: {display_path}"
+            f" | rule: {rule}"
+            f" | suggestion: {suggestion}"
+        )
+        self.file_path = file_path
+        self.rule = rule
+        self.suggestion = suggestion
+
+
+@dataclass(frozen=True)
+class Artifact:
+    path: Path
+    type: str
+    payload: Any
+
+    def to_json(self) -> dict[str, str]:
+        return {"path": str(self.path), "type": self.type}
+
+
+def classify(rel_dir: str, name: str) -> Optional[str]:
+    """Return the artifact type of `rel_dir/name`, or None if it is not a UIP artifact."""
+    if not name.endswith(".json"):
+        return None
+    known = KNOWN_DIRS.get(rel_dir)
+    if known is not None and known != "auto":
+        return known
+    for suffix, kind in ARTIFACT_SUFFIXES.items():
+        if name.endswith(suffix):
+            return kind
+    return None
+
+
+@dataclass(frozen=True)
+class IgnoreRule:
+    regex: re.Pattern[str]
+    negate: bool
+    dir_only: bool
+
+
+def _translate_gitignore_glob(pattern: str) -> str:
+    out: list[str] = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == len(pattern):
+            out.append("/.*")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 2 :]:
+            end = pattern.index("]", i + 2)
+            body = pattern[i + 1 : end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append("[" + body.replace("\\", "\\\\") + "]")
+            i = end + 1
+        elif pattern[i] == "\\" and i + 1 < len(pattern):
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(out)
+
+
+def parse_gitignore(text: str) -> list[IgnoreRule]:
+    """Compile .gitignore lines into rules matched against paths relative to the file's directory."""
+    rules: list[IgnoreRule] = []
+    for raw in text.splitlines():
+        line = raw.rstrip()
+        if raw.endswith("\\ "):
+            line += " "
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        # A slash anywhere but the end anchors the pattern to this directory; otherwise it matches any depth.
+        anchored = "/" in line
+        regex = _translate_gitignore_glob(line.lstrip("/"))
+        if not anchored:
+            regex = "(?:.*/)?" + regex
+        rules.append(IgnoreRule(regex=re.compile(regex, re.DOTALL), negate=negate, dir_only=dir_only))
+    return rules
+
+
+# Active .gitignore rules for a directory: (repo-relative base directory, rules) from the root downward.
+IgnoreChain = tuple[tuple[str, tuple[IgnoreRule, ...]], ...]
+
+
+def is_ignored(chain: IgnoreChain, rel_path: str, is_dir: bool) -> bool:
+    """Apply git's precedence: the last matching rule wins, and deeper .gitignore files come later."""
+    for base, rules in reversed(chain):
+        sub_path = rel_path[len(base) + 1 :] if base else rel_path
+        for rule in reversed(rules):
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.regex.fullmatch(sub_path):
+                return not rule.negate
+    return False
+
+
+def _protected_dirs() -> set[str]:
+    # KNOWN_DIRS and their ancestors are always walked, whatever the prune list or .gitignore say.
+    protected = {""}
+    for rel_dir in KNOWN_DIRS:
+        parts = rel_dir.split("/")
+        protected.update("/".join(parts[: i + 1]) for i in range(len(parts)))
+    return protected
+
+
+class Manifest:
+    """On-disk record of the last discovery, so a repeat run re-lists and re-parses only what changed.
+
+    `dirs` maps a repo-relative directory to `[mtime_ns, subdirectories, artifact names, has .gitignore]`:
+    a directory whose mtime is unchanged has the same entries, so it is not listed again. `files` maps an artifact
+    path to `[mtime_ns, size, payload]`. Entries whose mtime is not older than the manifest itself are
+    "racy" (possibly changed within the same timestamp tick) and are always re-read.
+    """
+
+    def __init__(self, path: Optional[Path]) -> None:
+        self.path = path
+        self.dirs: dict[str, list[Any]] = {}
+        self.files: dict[str, list[Any]] = {}
+        self.fresh_dirs: dict[str, list[Any]] = {}
+        self.fresh_files: dict[str, list[Any]] = {}
+        self._stamp_ns = 0
+        self._dirty = False
+        if path is None:
+            return
+        try:
+            self._stamp_ns = path.stat().st_mtime_ns
+            loaded = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if (
+            isinstance(loaded, dict)
+            and loaded.get("format") == MANIFEST_FORMAT
+            and loaded.get("root") == str(ROOT)
+            and isinstance(loaded.get("dirs"), dict)
+            and isinstance(loaded.get("files"), dict)
+        ):
+            self.dirs = loaded["dirs"]
+            self.files = loaded["files"]
+
+    def _current(self, entry: Any, size: int, mtime_ns: int) -> bool:
+        return (
+            isinstance(entry, list)
+            and len(entry) == size
+            and entry[0] == mtime_ns
+            and mtime_ns < self._stamp_ns
+        )
+
+    def list_dir(self, rel_dir: str, abs_dir: str) -> tuple[list[str], list[str], bool]:
+        """Return (subdirectory names, artifact names, has .gitignore) of one directory.
+
+        Comes from the manifest when the directory's mtime is unchanged; otherwise one scandir pass.
+        """
+        mtime_ns = os.stat(abs_dir).st_mtime_ns
+        cached = self.dirs.get(rel_dir)
+        if self._current(cached, 4, mtime_ns):
+            subdirs, names, has_gitignore = cached[1], cached[2], cached[3]
+        else:
+            subdirs, names, has_gitignore = [], [], False
+            with os.scandir(abs_dir) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif entry.name == ".gitignore":
+                        has_gitignore = True
+                    elif classify(rel_dir, entry.name) is not None and entry.is_file():
+                        names.append(entry.name)
+            self._dirty = True
+        self.fresh_dirs[rel_dir] = [mtime_ns, subdirs, names, has_gitignore]
+        return subdirs, names, has_gitignore
+
+    def load_payload(self, path: Path) -> Any:
+        key = str(path)
+        st = path.stat()
+        cached = self.files.get(key)
+        if self._current(cached, 3, st.st_mtime_ns) and cached[1] == st.st_size:
+            payload = cached[2]
+        else:
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except json.JSONDecodeError:
+                raise DiscoveryError(
+                    path,
+                    "valid-json",
+                    "Fix JSON syntax so the artifact can be parsed.",
+                ) from None
+            self._dirty = True
+        self.fresh_files[key] = [st.st_mtime_ns, st.st_size, payload]
+        return payload
+
+    def save(self) -> None:
+        # Only what this walk saw is kept, so deleted directories and artifacts drop out.
+        if self.path is None:
+            return
+        if not self._dirty and self.fresh_dirs.keys() == self.dirs.keys() and self.fresh_files.keys() == self.files.keys():
+            return
+        payload = {"format": MANIFEST_FORMAT, "root": str(ROOT), "dirs": self.fresh_dirs, "files": self.fresh_files}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(prefix=f".{self.path.name}.", dir=self.path.parent)
+        except OSError:
+            return  # a read-only checkout still discovers, just without the manifest
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps(payload, separators=(",", ":"), sort_keys=True) + "\n")
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+
+def load_gitignore(abs_dir: str) -> tuple[IgnoreRule, ...]:
+    try:
+        with open(os.path.join(abs_dir, ".gitignore"), encoding="utf-8") as f:
+            return tuple(parse_gitignore(f.read()))
+    except (OSError, UnicodeDecodeError):
+        return ()
+
+
+def _walk(manifest: Manifest, prune: frozenset[str]) -> dict[str, str]:
+    """One pass over ROOT that skips pruned and gitignored directories before descending into them."""
+    protected = _protected_dirs()
+    artifacts: dict[str, str] = {}
+    stack: list[tuple[str, IgnoreChain]] = [("", ())]
+    while stack:
+        rel_dir, chain = stack.pop()
+        abs_dir = os.path.join(str(ROOT), rel_dir) if rel_dir else str(ROOT)
+        try:
+            subdirs, names, has_gitignore = manifest.list_dir(rel_dir, abs_dir)
+        except OSError:
+            continue
+        if has_gitignore:
+            rules = load_gitignore(abs_dir)
+            if rules:
+                chain = chain + ((rel_dir, rules),)
+        for name in names:
+            rel_path = f"{rel_dir}/{name}" if rel_dir else name
+            if chain and is_ignored(chain, rel_path, is_dir=False):
+                continue
+            artifacts[os.path.join(abs_dir, name)] = classify(rel_dir, name)  # type: ignore[assignment]
+        for name in subdirs:
+            rel_path = f"{rel_dir}/{name}" if rel_dir else name
+            if rel_path not in protected and (
+                name in prune or rel_path in prune or (chain and is_ignored(chain, rel_path, is_dir=True))
+            ):
+                continue
+            stack.append((rel_path, chain))
+    return artifacts
+
+
+def prune_list(extra: Iterable[str] = ()) -> frozenset[str]:
+    """DEFAULT_PRUNE plus UIP_DISCOVERY_PRUNE entries plus `extra`, with surrounding slashes removed."""
+    entries = [*DEFAULT_PRUNE, *os.environ.get(PRUNE_ENV, "").split(","), *extra]
+    return frozenset(e.strip().strip("/") for e in entries if e.strip().strip("/"))
+
+
+_discovered: dict[frozenset[str], tuple[list[Artifact], list[DiscoveryError]]] = {}
+
+
+def discover_with_errors(
+    use_cache: bool = True, prune: Iterable[str] = ()
+) -> tuple[list[Artifact], list[DiscoveryError]]:
+    """Return every loadable UIP artifact under ROOT and a DiscoveryError for each one that is not, both sorted by path.
+
+    Directories in `prune_list(prune)` or excluded by a .gitignore are not walked. The result is memoized
+    for the process, so checkers that run together share one walk and one parse.
+    """
+    pruned = prune_list(prune)
+    if pruned in _discovered:
+        return _discovered[pruned]
+
+    manifest = Manifest(MANIFEST_PATH if use_cache else None)
+    artifacts = []
+    errors = []
+    for path_str, kind in sorted(_walk(manifest, pruned).items()):
+        path = Path(path_str)
+        try:
+            artifacts.append(Artifact(path=path, type=kind, payload=manifest.load_payload(path)))
+        except DiscoveryError as exc:
+            errors.append(exc)
+    manifest.save()
+    _discovered[pruned] = (artifacts, errors)
+    return artifacts, errors
+
+
+def discover(use_cache: bool = True, prune: Iterable[str] = ()) -> list[Artifact]:
+    """Return every UIP artifact under ROOT, sorted by path, with its parsed JSON payload.
+
+    Raises the first DiscoveryError (by path) if any artifact is not valid JSON; see `discover_with_errors`.
+    """
+    artifacts, errors = discover_with_errors(use_cache, prune)
+    if errors:
+        raise errors[0]
+    return artifacts
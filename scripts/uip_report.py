@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional, Sequence, TypeVar, Union
+
+from uip_discovery import DiscoveryError
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+# Below this many items, forking a pool costs more than it saves.
+PARALLEL_MIN_ITEMS = 64
+PARALLEL_CHUNK_SIZE = 32
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def display_path(file_path: Union[Path, str]) -> str:
+    if isinstance(file_path, Path):
+        try:
+            return str(file_path.relative_to(ROOT))
+        except ValueError:
+            return str(file_path)
+    return file_path
+
+
+class Violation(Exception):
+    """One UIP rule violation; `str()` is the `CATEGORY | file: ... | rule: ... | suggestion: ...` report line."""
+
+    def __init__(self, category: str, file_path: Union[Path, str], rule: str, suggestion: str) -> None:
+        file = display_path(file_path)
+        super().__init__(category, file, rule, suggestion)
+        self.category = category
+        self.file = file
+        self.rule = rule
+        self.suggestion = suggestion
+
+    def __str__(self) -> str:
+        return f"{self.category} | file: {self.file} | rule: {self.rule} | suggestion: {self.suggestion}"
+
+    @classmethod
+    def from_discovery_error(cls, exc: DiscoveryError) -> "Violation":
+        return cls("UIP-STRUCTURAL-VIOLATION", exc.file_path, exc.rule, exc.suggestion)
+
+    def to_json(self) -> dict[str, str]:
+        return {"category": self.category, "file": self.file, "rule": self.rule, "suggestion": self.suggestion}
+
+
+def _attempt(check: Callable[[T], R], item: T) -> tuple[Optional[R], Optional[Violation]]:
+    try:
+        return check(item), None
+    except Violation as exc:
+        return None, exc
+
+
+def run_checks(
+    check: Callable[[T], R], items: Sequence[T], collect: bool, parallelism: int = 1
+) -> tuple[list[Optional[R]], list[Violation]]:
+    """Apply `check` to every item in order; return its results and the violations it raised.
+
+    Without `collect` the first Violation propagates. With it, each item stops at its own first violation
+    (later checks on an item may rely on earlier ones) and the rest still run; at PARALLEL_MIN_ITEMS or more
+    items they run in a forked process pool, so `check` must be a module-level function.
+    """
+    if not collect:
+        return [check(item) for item in items], []
+    attempt = functools.partial(_attempt, check)
+    if parallelism > 1 and len(items) >= PARALLEL_MIN_ITEMS and "fork" in multiprocessing.get_all_start_methods():
+        with ProcessPoolExecutor(max_workers=parallelism, mp_context=multiprocessing.get_context("fork")) as pool:
+            outcomes = list(pool.map(attempt, items, chunksize=PARALLEL_CHUNK_SIZE))
+    else:
+        outcomes = [attempt(item) for item in items]
+    return [result for result, _ in outcomes], [violation for _, violation in outcomes if violation is not None]
+
+
+def to_sarif(tool: str, violations: Sequence[Violation]) -> dict[str, Any]:
+    rules = sorted({violation.rule for violation in violations})
+    return {
+        "$schema": SARIF_SCHEMA,
+        "version": "2.1.0",
+        "runs": [
+            {
+                "tool": {
+                    "driver": {
+                        "name": tool,
+                        "rules": [{"id": rule, "shortDescription": {"text": rule}} for rule in rules],
+                    }
+                },
+                "results": [
+                    {
+                        "ruleId": violation.rule,
+                        "level": "error",
+                        "message": {"text": violation.suggestion},
+                        "locations": [{"physicalLocation": {"artifactLocation": {"uri": violation.file}}}],
+                        "properties": {"category": violation.category},
+                    }
+                    for violation in violations
+                ],
+            }
+        ],
+    }
+
+
+def report(tool: str, violations: Sequence[Violation], fmt: str, output: Optional[str]) -> None:
+    """Print every violation line to stderr, write the JSON/SARIF report if asked, and exit 1 if there were any."""
+    for violation in violations:
+        print(violation, file=sys.stderr)
+    if fmt != "text":
+        if fmt == "sarif":
+            document = to_sarif(tool, violations)
+        else:
+            document = {"tool": tool, "violations": [violation.to_json() for violation in violations]}
+        text = json.dumps(document, indent=2, sort_keys=True) + "\n"
+        if output:
+            Path(output).write_text(text, encoding="utf-8")
+        else:
+            sys.stdout.write(text)
+    if violations:
+        raise SystemExit(1)
+
+
+def run_checker(
+    tool: str, description: str, check: Callable[[bool, int], list[Violation]]
+) -> None:
+    """Command-line entry point shared by the UIP checkers.
+
+    `check(collect, parallelism)` raises the first Violation by default and returns all of them with --collect.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--collect",
+        action="store_true",
+        help="Check everything and report every violation before exiting (default: stop at the first).",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("text", "json", "sarif"),
+        default="text",
+        help="Also write the --collect report as JSON or SARIF 2.1.0 (default: text lines on stderr only).",
+    )
+    parser.add_argument("--output", metavar="PATH", help="Write the JSON/SARIF report here instead of stdout.")
+    parser.add_argument(
+        "--parallelism",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes used with --collect (default: CPU count; 1 checks serially).",
+    )
+    args = parser.parse_args()
+    if args.parallelism < 1:
+        parser.error("--parallelism must be a positive integer")
+    if not args.collect and (args.format != "text" or args.output):
+        parser.error("--format json/sarif and --output require --collect")
+
+    try:
+        violations = check(args.collect, args.parallelism)
+    except Violation as exc:
+        print(exc, file=sys.stderr)
+        raise SystemExit(1)
+    report(tool, violations, args.format, args.output)
@@ -0,0 +1,51 @@
+"""Bounded SKILL.md line reading shared by the skillcard.* Skills (imported by path; stdlib only)."""
+
+from __future__ import annotations
+
+import codecs
+from typing import Any, BinaryIO, Iterator
+
+# An opening or closing `---` delimiter line is at most `---\r\n`.
+DELIMITER_LINE_BYTES = 5
+
+
+def frontmatter_read_limit(max_frontmatter_bytes: int) -> int:
+    """Raw bytes enough to reach the closing `---` of any frontmatter within `max_frontmatter_bytes`.
+
+    The cap counts lines after `\r\n` is translated to `\n`, so raw content can take up to twice as many bytes.
+    """
+    return 2 * (max_frontmatter_bytes + DELIMITER_LINE_BYTES)
+
+
+def iter_file_lines(f: BinaryIO, limit: int | None = None, hasher: Any = None) -> Iterator[str]:
+    """Yield the lines `read_text(encoding="utf-8").splitlines(keepends=True)` would, reading lazily.
+
+    UTF-8 never encodes another character with a 0x0A byte, so decoding one binary line at a time is safe;
+    `\r\n` and lone `\r` endings are translated to `\n` as universal-newline reads do. At most `limit + 1`
+    bytes are read: the line that crosses `limit` is read only up to there, yielded cut short (minus any
+    trailing partial character), and ends the iteration. Every byte read is fed to `hasher`.
+    """
+    start = f.tell()
+    read = 0
+    while True:
+        raw = f.readline(-1 if limit is None else limit - read + 1)
+        if not raw:
+            return
+        if hasher is not None:
+            hasher.update(raw)
+        cut = limit is not None and read + len(raw) > limit
+        try:
+            text = codecs.getincrementaldecoder("utf-8")().decode(raw, final=not cut)
+        except UnicodeDecodeError as e:
+            # Positions are relative to this line; name the file offset a whole-file decode would report.
+            reason = f"{e.reason} (file offset {start + read + e.start})"
+            raise UnicodeDecodeError(e.encoding, raw, e.start, e.end, reason) from None
+        read += len(raw)
+        for line in text.splitlines(keepends=True):
+            if line.endswith("\r\n"):
+                line = line[:-2] + "\n"
+            elif line.endswith("\r"):
+                line = line[:-1] + "\n"
+            yield line
+        if cut:
+            return
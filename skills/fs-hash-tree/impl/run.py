@@ -4,102 +4,519 @@ from __future__ import annotations
 
 import fnmatch
 import hashlib
+import io
 import json
+import mmap
 import os
+import re
 import sys
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Callable, Iterator
+
+try:
+    import blake3  # type: ignore[import-not-found]
+except ImportError:  # optional: only needed for algorithm "blake3"
+    blake3 = None
 
 
 def eprint_json(event: str, payload: dict[str, Any]) -> None:
     sys.stderr.write(json.dumps({"event": event, **payload}, separators=(",", ":"), sort_keys=True) + "\n")
 
 
-def sha_file(path: Path, algorithm: str) -> str:
-    hasher = hashlib.new(algorithm)
-    with path.open("rb") as f:
-        while True:
-            chunk = f.read(1024 * 1024)
-            if not chunk:
-                break
-            hasher.update(chunk)
+ALGORITHMS = ("sha256", "sha1", "md5", "blake2b", "blake2s", "blake3")
+
+
+def new_hasher(algorithm: str) -> Any:
+    if algorithm == "blake3":
+        if blake3 is None:
+            raise ValueError("algorithm blake3 requires the blake3 module, which is not installed")
+        return blake3.blake3()
+    return hashlib.new(algorithm)
+
+
+SMALL_FILE_BYTES = 1024 * 1024
+MMAP_THRESHOLD_BYTES = 64 * 1024 * 1024
+READ_BUFFER_BYTES = 1024 * 1024
+
+_read_buffers = threading.local()
+
+
+def _readinto_digest(f: BinaryIO, hasher: Any) -> None:
+    # One preallocated buffer per hashing thread: no per-chunk bytes objects.
+    buf = getattr(_read_buffers, "buf", None)
+    if buf is None:
+        buf = _read_buffers.buf = memoryview(bytearray(READ_BUFFER_BYTES))
+    while True:
+        n = f.readinto(buf)
+        if not n:
+            break
+        hasher.update(buf[:n])
+
+
+def sha_file(path: Path, algorithm: str, size: int | None = None) -> str:
+    hasher = new_hasher(algorithm)
+    with path.open("rb", buffering=0) as f:
+        if size is not None and size <= SMALL_FILE_BYTES:
+            # A short read still falls through to the loop below if the file grew since it was stat'ed.
+            hasher.update(f.read(size))
+            _readinto_digest(f, hasher)
+            return hasher.hexdigest()
+        if size is not None and size >= MMAP_THRESHOLD_BYTES:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    hasher.update(mapped)
+                return hasher.hexdigest()
+            except (OSError, ValueError):
+                f.seek(0)
+                hasher = new_hasher(algorithm)
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, lambda: hasher).hexdigest()
+        _readinto_digest(f, hasher)
     return hasher.hexdigest()
 
 
-def matches_any(path_posix: str, patterns: list[str]) -> bool:
-    for pattern in patterns:
-        if fnmatch.fnmatch(path_posix, pattern):
-            return True
-    return False
+DIGEST_CACHE_FORMAT = 1
+# Relative to the Skill's working directory; must stay inside `security.access.filesystem.write` in skill.yaml.
+DIGEST_CACHE_PATH = Path(".skillctl-cache/fs-hash-tree/digests.json")
 
 
-def main() -> int:
-    try:
-        input_obj = json.load(sys.stdin)
-        if not isinstance(input_obj, dict):
-            raise ValueError("input must be a JSON object")
-        root_raw = input_obj.get("root")
-        if not isinstance(root_raw, str) or not root_raw:
-            raise ValueError("root must be a non-empty string")
-
-        algorithm = input_obj.get("algorithm", "sha256")
-        if algorithm not in {"sha256", "sha1", "md5"}:
-            raise ValueError("algorithm must be one of: sha256, sha1, md5")
-
-        exclude = input_obj.get("exclude", [])
-        if exclude is None:
-            exclude = []
-        if not isinstance(exclude, list) or any(not isinstance(p, str) or not p for p in exclude):
-            raise ValueError("exclude must be an array of non-empty strings")
-
-        root_path = Path(root_raw).resolve()
-        if not root_path.exists() or not root_path.is_dir():
-            raise ValueError("root must be an existing directory")
-
-        files: list[dict[str, Any]] = []
-        for dirpath, dirnames, filenames in os.walk(root_path, topdown=True, followlinks=False):
-            dir_path = Path(dirpath)
-            rel_dir = dir_path.relative_to(root_path).as_posix()
-            if rel_dir == ".":
-                rel_dir = ""
-
-            dirnames.sort()
-            filenames.sort()
-
-            pruned_dirnames = []
-            for d in dirnames:
-                rel = f"{rel_dir}/{d}" if rel_dir else d
-                if matches_any(rel, exclude):
-                    continue
-                pruned_dirnames.append(d)
-            dirnames[:] = pruned_dirnames
+class DigestCache:
+    """Persistent (path, size, mtime_ns, inode) -> digest map for one algorithm.
 
-            for filename in filenames:
-                file_path = dir_path / filename
-                if file_path.is_symlink() or not file_path.is_file():
-                    continue
-                rel = f"{rel_dir}/{filename}" if rel_dir else filename
-                if matches_any(rel, exclude):
+    Entries whose mtime is not older than the cache file itself are "racy": the file may have been
+    rewritten within the same timestamp tick after it was hashed, so they are always rehashed.
+    """
+
+    def __init__(self, path: Path, algorithm: str) -> None:
+        self.path = path
+        self.algorithm = algorithm
+        self.hits = 0
+        self.misses = 0
+        self._sections: dict[str, dict[str, list[Any]]] = {}
+        self._stamp_ns = 0
+        try:
+            self._stamp_ns = path.stat().st_mtime_ns
+            loaded = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            loaded = None
+        if isinstance(loaded, dict) and loaded.get("format") == DIGEST_CACHE_FORMAT:
+            sections = loaded.get("algorithms")
+            if isinstance(sections, dict):
+                self._sections = {k: v for k, v in sections.items() if isinstance(v, dict)}
+        self._entries = self._sections.get(algorithm, {})
+        self._fresh: dict[str, list[Any]] = {}
+
+    def lookup(self, file_path: Path, st: os.stat_result) -> str | None:
+        cached = self._entries.get(file_path.as_posix())
+        if (
+            isinstance(cached, list)
+            and len(cached) == 4
+            and cached[:3] == [st.st_size, st.st_mtime_ns, st.st_ino]
+            and st.st_mtime_ns < self._stamp_ns
+        ):
+            self.hits += 1
+            return cached[3]
+        self.misses += 1
+        return None
+
+    def record(self, file_path: Path, st: os.stat_result, digest: str) -> None:
+        self._fresh[file_path.as_posix()] = [st.st_size, st.st_mtime_ns, st.st_ino, digest]
+
+    def save(self, root_path: Path) -> None:
+        # Entries under the scanned root are replaced wholesale so deleted files drop out; other roots are kept.
+        prefix = root_path.as_posix().rstrip("/") + "/"
+        entries = {k: v for k, v in self._entries.items() if not k.startswith(prefix)}
+        entries.update(self._fresh)
+        self._sections[self.algorithm] = entries
+        payload = {"format": DIGEST_CACHE_FORMAT, "algorithms": self._sections}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{self.path.name}.", dir=self.path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps(payload, separators=(",", ":"), sort_keys=True) + "\n")
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+
+def _translate_segmented_glob(pattern: str) -> str:
+    # `**` patterns use gitignore-style segments: `*`/`?` stay within one path segment, `**/` spans any
+    # number of directories (including none), and a trailing `/**` covers the directory and everything below.
+    parts: list[str] = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == len(pattern):
+            parts.append("(?:/.*)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 2 :]:
+            end = pattern.index("]", i + 2) + 1
+            # Reuse fnmatch's bracket handling (negation, escaping) and strip its (?s:...)\Z wrapper.
+            parts.append(fnmatch.translate(pattern[i:end])[4:-3])
+            i = end
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return "(?s:" + "".join(parts) + r")\Z"
+
+
+class ExcludeMatcher:
+    """All `exclude` globs compiled into one regex per entry kind, built once per run.
+
+    Patterns without `**` keep `fnmatch` semantics (`*` may cross `/`). A trailing `/` makes a pattern
+    directory-only: it prunes matching directories during the walk and never matches files.
+    """
+
+    def __init__(self, patterns: list[str]) -> None:
+        file_parts: list[str] = []
+        dir_parts: list[str] = []
+        for pattern in patterns:
+            dir_only = pattern.endswith("/") and pattern.rstrip("/") != ""
+            glob = pattern.rstrip("/") if dir_only else pattern
+            regex = _translate_segmented_glob(glob) if "**" in glob else fnmatch.translate(glob)
+            dir_parts.append(regex)
+            if not dir_only:
+                file_parts.append(regex)
+        self._files = re.compile("|".join(file_parts)) if file_parts else None
+        self._dirs = re.compile("|".join(dir_parts)) if dir_parts else None
+
+    def excludes_file(self, rel: str) -> bool:
+        return self._files is not None and self._files.match(rel) is not None
+
+    def excludes_dir(self, rel: str) -> bool:
+        return self._dirs is not None and self._dirs.match(rel) is not None
+
+
+def merkle_directories(files: list[dict[str, Any]], algorithm: str) -> list[dict[str, Any]]:
+    """Bottom-up digests for every directory that contains files, keyed by POSIX path ("." is the root).
+
+    A directory digest covers its sorted children as `kind NUL name NUL digest NUL` records (`f` for files,
+    `d` for subdirectories), so two directories share a digest exactly when their subtrees are identical.
+    """
+    children: dict[str, list[tuple[str, str, str]]] = {".": []}
+    file_counts: dict[str, int] = {".": 0}
+    for entry in files:
+        parent, _, name = entry["path"].rpartition("/")
+        children.setdefault(parent or ".", []).append((name, "f", entry["digest"]))
+        file_counts["."] += 1
+        while parent:
+            children.setdefault(parent, [])
+            file_counts[parent] = file_counts.get(parent, 0) + 1
+            parent = parent.rpartition("/")[0]
+
+    digests: dict[str, str] = {}
+    # Deepest directories first, so every subdirectory digest exists before its parent is hashed.
+    for directory in sorted(children, key=lambda d: -1 if d == "." else d.count("/"), reverse=True):
+        hasher = new_hasher(algorithm)
+        for name, kind, digest in sorted(children[directory]):
+            hasher.update(kind.encode("ascii") + b"\0" + name.encode("utf-8") + b"\0" + digest.encode("ascii") + b"\0")
+        digests[directory] = hasher.hexdigest()
+        if directory != ".":
+            parent, _, name = directory.rpartition("/")
+            children[parent or "."].append((name, "d", digests[directory]))
+
+    return [
+        {"path": directory, "digest": digests[directory], "fileCount": file_counts[directory]}
+        for directory in sorted(digests)
+    ]
+
+
+def load_previous(previous: Any, algorithm: str) -> dict[str, Any]:
+    if isinstance(previous, str) and previous:
+        try:
+            previous = json.loads(Path(previous).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            raise ValueError(f"previous could not be read as JSON: {e}") from e
+    if (
+        not isinstance(previous, dict)
+        or not isinstance(previous.get("treeDigest"), str)
+        or not isinstance(previous.get("files"), list)
+    ):
+        raise ValueError("previous must be an fs.hash_tree output (object or path) with treeDigest and files")
+    if previous.get("algorithm") != algorithm:
+        raise ValueError(f"previous was hashed with {previous.get('algorithm')!r}, not {algorithm!r}")
+    for index, entry in enumerate(previous["files"]):
+        if (
+            not isinstance(entry, dict)
+            or not isinstance(entry.get("path"), str)
+            or not entry["path"]
+            or not isinstance(entry.get("digest"), str)
+            or not isinstance(entry.get("size"), int)
+            or isinstance(entry["size"], bool)
+            or entry["size"] < 0
+        ):
+            raise ValueError(f"previous.files[{index}] must be an object with path, digest and a non-negative size")
+    directories = previous.get("directories")
+    if directories is not None:
+        if not isinstance(directories, list) or not all(
+            isinstance(d, dict) and isinstance(d.get("path"), str) and isinstance(d.get("digest"), str)
+            for d in directories
+        ):
+            raise ValueError("previous.directories must be a list of objects with path and digest")
+    return previous
+
+
+def diff_files(
+    previous: dict[str, Any],
+    files: list[dict[str, Any]],
+    tree_digest: str,
+    directories: list[dict[str, Any]] | None,
+) -> dict[str, Any]:
+    if previous["treeDigest"] == tree_digest:
+        return {"unchanged": True, "added": [], "removed": [], "modified": []}
+
+    changed: set[str] | None = None
+    previous_dirs = previous.get("directories")
+    if directories is not None and isinstance(previous_dirs, list):
+        # Merkle short-circuit: only files directly inside a directory whose digest moved can differ.
+        before = {d["path"]: d["digest"] for d in previous_dirs}
+        after = {d["path"]: d["digest"] for d in directories}
+        changed = {path for path in before.keys() | after.keys() if before.get(path) != after.get(path)}
+
+    def in_scope(path: str) -> bool:
+        return changed is None or (path.rpartition("/")[0] or ".") in changed
+
+    old = {e["path"]: e for e in previous["files"] if in_scope(e["path"])}
+    new = {e["path"]: e for e in files if in_scope(e["path"])}
+    return {
+        "unchanged": False,
+        "added": [new[path] for path in sorted(new.keys() - old.keys())],
+        "removed": [
+            {key: old[path][key] for key in ("path", "digest", "size")} for path in sorted(old.keys() - new.keys())
+        ],
+        "modified": [
+            {**new[path], "previousDigest": old[path]["digest"]}
+            for path in sorted(new.keys() & old.keys())
+            if new[path]["digest"] != old[path]["digest"]
+        ],
+    }
+
+
+@dataclass(frozen=True)
+class TreeOptions:
+    root_path: Path
+    algorithm: str
+    matcher: ExcludeMatcher
+    parallelism: int
+    merkle: bool
+    cache: bool
+    previous: dict[str, Any] | None
+
+
+def parse_options(input_obj: Any) -> TreeOptions:
+    if not isinstance(input_obj, dict):
+        raise ValueError("input must be a JSON object")
+    root_raw = input_obj.get("root")
+    if not isinstance(root_raw, str) or not root_raw:
+        raise ValueError("root must be a non-empty string")
+
+    algorithm = input_obj.get("algorithm", "sha256")
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"algorithm must be one of: {', '.join(ALGORITHMS)}")
+    if algorithm == "blake3" and blake3 is None:
+        raise ValueError("algorithm blake3 requires the blake3 module, which is not installed")
+
+    exclude = input_obj.get("exclude", [])
+    if exclude is None:
+        exclude = []
+    if not isinstance(exclude, list) or any(not isinstance(p, str) or not p for p in exclude):
+        raise ValueError("exclude must be an array of non-empty strings")
+
+    root_path = Path(root_raw).resolve()
+    if not root_path.exists() or not root_path.is_dir():
+        raise ValueError("root must be an existing directory")
+
+    previous = input_obj.get("previous")
+    if previous is not None:
+        previous = load_previous(previous, algorithm)
+
+    parallelism = input_obj.get("parallelism", os.cpu_count() or 1)
+    if isinstance(parallelism, bool) or not isinstance(parallelism, int) or parallelism < 1:
+        raise ValueError("parallelism must be a positive integer")
+
+    merkle = input_obj.get("merkle", False)
+    if not isinstance(merkle, bool):
+        raise ValueError("merkle must be a boolean")
+
+    use_cache = input_obj.get("cache", False)
+    if not isinstance(use_cache, bool):
+        raise ValueError("cache must be a boolean")
+
+    return TreeOptions(
+        root_path=root_path,
+        algorithm=algorithm,
+        matcher=ExcludeMatcher(exclude),
+        parallelism=parallelism,
+        merkle=merkle,
+        cache=use_cache,
+        previous=previous,
+    )
+
+
+def walk_files(root_path: Path, matcher: ExcludeMatcher) -> Iterator[tuple[str, Path, os.stat_result]]:
+    """Yield (relative path, path, stat) for every included regular file, in sorted relative-path order.
+
+    Sibling directories sort by `name + "/"`, which places each subtree exactly where its paths fall in a
+    flat sort of all relative paths, so callers never need to buffer and sort the whole tree.
+    Symlinks are skipped and unreadable directories are ignored, as with `os.walk`.
+    """
+    stack: list[tuple[str, str, os.stat_result | None]] = [("", str(root_path), None)]
+    while stack:
+        rel, path, st = stack.pop()
+        if st is not None:
+            yield rel, Path(path), st
+            continue
+        try:
+            entries = os.scandir(path)
+        except OSError:
+            continue
+        children: list[tuple[str, str, os.stat_result | None]] = []
+        with entries:
+            # DirEntry answers type questions from the directory listing (d_type), so the only
+            # per-file syscall left is the single lstat behind entry.stat().
+            for entry in entries:
+                child_rel = rel + entry.name
+                if entry.is_symlink():
                     continue
-                digest = sha_file(file_path, algorithm)
-                size = file_path.stat().st_size
-                files.append({"path": rel, "digest": digest, "size": size})
-
-        files.sort(key=lambda x: x["path"])
-        tree_hasher = hashlib.new(algorithm)
-        for entry in files:
-            tree_hasher.update(entry["path"].encode("utf-8"))
-            tree_hasher.update(b"\0")
-            tree_hasher.update(entry["digest"].encode("ascii"))
-            tree_hasher.update(b"\0")
-
-        output = {
-            "algorithm": algorithm,
-            "root": str(root_path),
-            "treeDigest": tree_hasher.hexdigest(),
-            "fileCount": len(files),
-            "files": files,
-        }
+                if entry.is_dir(follow_symlinks=False):
+                    if not matcher.excludes_dir(child_rel):
+                        children.append((child_rel + "/", entry.path, None))
+                elif entry.is_file(follow_symlinks=False) and not matcher.excludes_file(child_rel):
+                    children.append((child_rel, entry.path, entry.stat(follow_symlinks=False)))
+        children.sort(key=lambda c: c[0], reverse=True)
+        stack.extend(children)
+
+
+def hash_files(options: TreeOptions, cache: DigestCache | None) -> Iterator[dict[str, Any]]:
+    """Yield `{path, digest, size}` entries in walk order, hashing up to `parallelism` files ahead."""
+
+    def hash_one(path: Path, st: os.stat_result) -> str:
+        return sha_file(path, options.algorithm, st.st_size)
+
+    def entry(rel: str, path: Path, st: os.stat_result, digest: str) -> dict[str, Any]:
+        if cache is not None:
+            cache.record(path, st, digest)
+        return {"path": rel, "digest": digest, "size": st.st_size}
+
+    walk = walk_files(options.root_path, options.matcher)
+    if options.parallelism == 1:
+        for rel, path, st in walk:
+            digest = cache.lookup(path, st) if cache is not None else None
+            yield entry(rel, path, st, digest or hash_one(path, st))
+        return
+
+    # A bounded window keeps the pool busy without materializing the walk.
+    window: deque[tuple[str, Path, os.stat_result, str | Future[str]]] = deque()
+    with ThreadPoolExecutor(max_workers=options.parallelism) as pool:
+        for rel, path, st in walk:
+            digest = cache.lookup(path, st) if cache is not None else None
+            window.append((rel, path, st, digest or pool.submit(hash_one, path, st)))
+            if len(window) >= options.parallelism * 4:
+                rel, path, st, pending = window.popleft()
+                yield entry(rel, path, st, pending if isinstance(pending, str) else pending.result())
+        while window:
+            rel, path, st, pending = window.popleft()
+            yield entry(rel, path, st, pending if isinstance(pending, str) else pending.result())
+
+
+def open_cache(options: TreeOptions) -> DigestCache | None:
+    return DigestCache(DIGEST_CACHE_PATH.resolve(), options.algorithm) if options.cache else None
+
+
+def close_cache(cache: DigestCache | None, options: TreeOptions) -> None:
+    if cache is not None:
+        cache.save(options.root_path)
+        eprint_json("digest_cache", {"hits": cache.hits, "misses": cache.misses, "path": str(cache.path)})
+
+
+def update_tree_digest(tree_hasher: Any, entry: dict[str, Any]) -> None:
+    tree_hasher.update(entry["path"].encode("utf-8"))
+    tree_hasher.update(b"\0")
+    tree_hasher.update(entry["digest"].encode("ascii"))
+    tree_hasher.update(b"\0")
+
+
+def hash_tree(input_obj: Any) -> dict[str, Any]:
+    options = parse_options(input_obj)
+    cache = open_cache(options)
+    files = list(hash_files(options, cache))
+    close_cache(cache, options)
+
+    tree_hasher = new_hasher(options.algorithm)
+    for entry in files:
+        update_tree_digest(tree_hasher, entry)
+
+    tree_digest = tree_hasher.hexdigest()
+    previous = options.previous
+    directories = None
+    if options.merkle or (previous is not None and isinstance(previous.get("directories"), list)):
+        directories = merkle_directories(files, options.algorithm)
+
+    output: dict[str, Any] = {
+        "algorithm": options.algorithm,
+        "root": str(options.root_path),
+        "treeDigest": tree_digest,
+        "fileCount": len(files),
+    }
+    if previous is not None:
+        output["diff"] = diff_files(previous, files, tree_digest, directories)
+    else:
+        output["files"] = files
+    if options.merkle:
+        output["directories"] = directories
+    return output
+
+
+def hash_tree_ndjson(input_obj: Any, write: Callable[[str], Any]) -> None:
+    """Emit one `file` record per entry as soon as it is hashed, then a `trailer` record.
+
+    Records are validated by schemas/output.ndjson.schema.json. Memory stays bounded by the hashing window,
+    so `merkle` and `previous` (which need the whole listing) are rejected.
+    """
+    options = parse_options(input_obj)
+    if options.merkle or options.previous is not None:
+        raise ValueError("merkle and previous are not supported with --ndjson output")
+    cache = open_cache(options)
+    tree_hasher = new_hasher(options.algorithm)
+    count = 0
+    for entry in hash_files(options, cache):
+        update_tree_digest(tree_hasher, entry)
+        count += 1
+        write(json.dumps({"type": "file", **entry}, separators=(",", ":"), sort_keys=True) + "\n")
+    close_cache(cache, options)
+    trailer = {
+        "type": "trailer",
+        "algorithm": options.algorithm,
+        "root": str(options.root_path),
+        "treeDigest": tree_hasher.hexdigest(),
+        "fileCount": count,
+    }
+    write(json.dumps(trailer, separators=(",", ":"), sort_keys=True) + "\n")
+
+
+def main(ndjson: bool = False) -> int:
+    try:
+        if ndjson:
+            hash_tree_ndjson(json.load(sys.stdin), sys.stdout.write)
+            return 0
+        output = hash_tree(json.load(sys.stdin))
         sys.stdout.write(json.dumps(output, separators=(",", ":"), sort_keys=True) + "\n")
         return 0
     except Exception as e:
@@ -107,6 +524,27 @@ def main() -> int:
         return 1
 
 
-if __name__ == "__main__":
-    raise SystemExit(main())
+def worker_main() -> int:
+    # skillctl worker protocol: one JSON input per stdin line, one reply envelope per stdout line.
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        logs = io.StringIO()
+        real_stderr, sys.stderr = sys.stderr, logs
+        try:
+            output: Any = hash_tree(json.loads(line))
+            exit_code = 0
+        except Exception as e:
+            eprint_json("error", {"message": str(e)})
+            output = None
+            exit_code = 1
+        finally:
+            sys.stderr = real_stderr
+        reply = {"exitCode": exit_code, "output": output, "stderr": logs.getvalue()}
+        sys.stdout.write(json.dumps(reply, separators=(",", ":"), sort_keys=True) + "\n")
+        sys.stdout.flush()
+    return 0
 
+
+if __name__ == "__main__":
+    raise SystemExit(worker_main() if sys.argv[1:] == ["--worker"] else main(ndjson=sys.argv[1:] == ["--ndjson"]))
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Benchmark fs.hash_tree throughput per parallelism level and digest algorithm on a synthetic tree.
+
+Usage: python3 tests/bench_hash_tree.py [--files 100000] [--file-size 4096] [--parallelism 1,4,8]
+                                        [--algorithms sha256,blake2b]
+
+Not part of the smoke test: it writes `--files` files to a temporary directory and prints one JSON line per
+(algorithm, parallelism) pair. All parallelism levels of one algorithm must produce the same `treeDigest`.
+Algorithms whose module is unavailable (blake3) are reported as skipped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+def load_skill() -> object:
+    impl = Path(__file__).resolve().parents[1] / "impl" / "run.py"
+    spec = importlib.util.spec_from_file_location("fs_hash_tree_run", impl)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_tree(root: Path, files: int, file_size: int) -> None:
+    per_dir = 1000
+    payload = os.urandom(file_size)
+    for i in range(files):
+        directory = root / f"d{i // per_dir:04d}"
+        if i % per_dir == 0:
+            directory.mkdir()
+        (directory / f"f{i:06d}.bin").write_bytes(i.to_bytes(8, "big") + payload)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--file-size", type=int, default=4096)
+    parser.add_argument("--parallelism", default=f"1,{os.cpu_count() or 1}")
+    parser.add_argument("--algorithms", default="sha256")
+    args = parser.parse_args()
+
+    skill = load_skill()
+    levels = [int(p) for p in args.parallelism.split(",")]
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        build_tree(root, args.files, args.file_size)
+        total_mb = args.files * (args.file_size + 8) / (1024 * 1024)
+        for algorithm in args.algorithms.split(","):
+            if algorithm == "blake3" and skill.blake3 is None:  # type: ignore[attr-defined]
+                sys.stdout.write(json.dumps({"algorithm": algorithm, "skipped": "blake3 module not installed"}) + "\n")
+                continue
+            digests = set()
+            for level in levels:
+                started = time.perf_counter()
+                output = skill.hash_tree(  # type: ignore[attr-defined]
+                    {"root": str(root), "algorithm": algorithm, "parallelism": level}
+                )
+                elapsed = time.perf_counter() - started
+                digests.add(output["treeDigest"])
+                result = {
+                    "algorithm": algorithm,
+                    "parallelism": level,
+                    "files": output["fileCount"],
+                    "seconds": round(elapsed, 3),
+                    "filesPerSecond": int(output["fileCount"] / elapsed),
+                    "mbPerSecond": round(total_mb / elapsed, 1),
+                }
+                sys.stdout.write(json.dumps(result, sort_keys=True) + "\n")
+            if len(digests) != 1:
+                sys.stderr.write(f"{algorithm}: treeDigest differs across parallelism levels\n")
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,6 +8,110 @@ trap 'rm -f "$tmp_out"' EXIT
 
 (cd "$skill_dir" && python3 "impl/run.py" < "fixtures/input.json" > "$tmp_out")
 
+# Worker protocol: two requests on one process must both match the one-shot output.
+tmp_worker="$(mktemp)"
+trap 'rm -f "$tmp_out" "$tmp_worker"' EXIT
+(cd "$skill_dir" && cat "fixtures/input.json" "fixtures/input.json" | python3 "impl/run.py" --worker > "$tmp_worker")
+python3 - "$tmp_out" "$tmp_worker" <<'PY'
+import json
+import sys
+from pathlib import Path
+
+one_shot = json.loads(Path(sys.argv[1]).read_text(encoding="utf-8"))
+replies = [json.loads(line) for line in Path(sys.argv[2]).read_text(encoding="utf-8").splitlines()]
+if len(replies) != 2 or any(r != {"exitCode": 0, "output": one_shot, "stderr": ""} for r in replies):
+    print("Worker replies mismatch:", replies, file=sys.stderr)
+    raise SystemExit(1)
+PY
+
+# Digest cache: a cold and a warm cached run must both match the uncached output byte for byte.
+tmp_cwd="$(mktemp -d)"
+tmp_cached="$(mktemp)"
+trap 'rm -f "$tmp_out" "$tmp_worker" "$tmp_cached"; rm -rf "$tmp_cwd"' EXIT
+(cd "$skill_dir" && python3 "impl/run.py" <<<"{\"root\":\"$skill_dir/fixtures/tree\"}" > "$tmp_cached")
+cached_input="{\"root\":\"$skill_dir/fixtures/tree\",\"cache\":true}"
+for _ in 1 2; do
+  (cd "$tmp_cwd" && python3 "$skill_dir/impl/run.py" <<<"$cached_input" 2>/dev/null | cmp -s - "$tmp_cached")
+done
+test -s "$tmp_cwd/.skillctl-cache/fs-hash-tree/digests.json"
+
+# Merkle mode: the root directory digest covers every file and treeDigest is unchanged.
+(cd "$skill_dir" && python3 "impl/run.py" <<<"{\"root\":\"$skill_dir/fixtures/tree\",\"merkle\":true}") | python3 -c '
+import json
+import sys
+
+flat = json.load(open(sys.argv[1], encoding="utf-8"))
+merkle = json.load(sys.stdin)
+paths = [d["path"] for d in merkle["directories"]]
+if merkle["treeDigest"] != flat["treeDigest"] or paths != [".", "subdir"] or merkle["directories"][0]["fileCount"] != flat["fileCount"]:
+    print("Merkle output mismatch:", merkle["directories"], file=sys.stderr)
+    raise SystemExit(1)
+' "$tmp_cached"
+
+# Directory-only excludes prune the whole subtree.
+(cd "$skill_dir" && python3 "impl/run.py" <<<"{\"root\":\"fixtures/tree\",\"exclude\":[\"**/subdir/\"]}") \
+  | python3 -c 'import json, sys; paths = [f["path"] for f in json.load(sys.stdin)["files"]]; sys.exit(paths != ["a.txt"])'
+
+# NDJSON mode: file records match the JSON output and the trailer carries the same treeDigest.
+(cd "$skill_dir" && python3 "impl/run.py" --ndjson < "fixtures/input.json") | python3 -c '
+import json
+import sys
+
+document = json.load(open(sys.argv[1], encoding="utf-8"))
+records = [json.loads(line) for line in sys.stdin]
+files = [{k: v for k, v in r.items() if k != "type"} for r in records if r["type"] == "file"]
+trailer = records[-1]
+if files != document["files"] or trailer["type"] != "trailer" or trailer["treeDigest"] != document["treeDigest"]:
+    print("NDJSON output mismatch:", records, file=sys.stderr)
+    raise SystemExit(1)
+' "$tmp_out"
+
+# BLAKE2b digests are 512-bit.
+(cd "$skill_dir" && python3 "impl/run.py" <<<"{\"root\":\"fixtures/tree\",\"algorithm\":\"blake2b\"}") \
+  | python3 -c 'import json, sys; out = json.load(sys.stdin); sys.exit(len(out["treeDigest"]) != 128 or out["algorithm"] != "blake2b")'
+
+# Diff mode: comparing the fixture tree against its own output reports no changes.
+(cd "$skill_dir" && python3 "impl/run.py" <<<"{\"root\":\"$skill_dir/fixtures/tree\",\"previous\":\"$tmp_cached\"}") | python3 -c '
+import json
+import sys
+
+diff = json.load(sys.stdin)["diff"]
+if diff != {"unchanged": True, "added": [], "removed": [], "modified": []}:
+    print("Unexpected diff:", diff, file=sys.stderr)
+    raise SystemExit(1)
+'
+
+# Diff mode on a changed copy: one file added, one removed, one modified (with its previous digest).
+tmp_tree="$(mktemp -d)"
+trap 'rm -f "$tmp_out" "$tmp_worker" "$tmp_cached"; rm -rf "$tmp_cwd" "$tmp_tree"' EXIT
+cp -R "$skill_dir/fixtures/tree/." "$tmp_tree"
+printf 'changed\n' > "$tmp_tree/a.txt"
+rm "$tmp_tree/subdir/b.txt"
+printf 'new\n' > "$tmp_tree/subdir/c.txt"
+python3 "$skill_dir/impl/run.py" <<<"{\"root\":\"$tmp_tree\",\"previous\":\"$tmp_cached\"}" | python3 -c '
+import json
+import sys
+
+previous = {f["path"]: f for f in json.load(open(sys.argv[1], encoding="utf-8"))["files"]}
+diff = json.load(sys.stdin)["diff"]
+added = [(f["path"], f["size"]) for f in diff["added"]]
+modified = [(f["path"], f["size"], f["previousDigest"]) for f in diff["modified"]]
+if (
+    diff["unchanged"] is not False
+    or added != [("subdir/c.txt", 4)]
+    or diff["removed"] != [previous["subdir/b.txt"]]
+    or modified != [("a.txt", 8, previous["a.txt"]["digest"])]
+):
+    print("Unexpected diff:", diff, file=sys.stderr)
+    raise SystemExit(1)
+' "$tmp_cached"
+
+# A malformed previous entry is rejected up front instead of leaking nulls into the diff.
+if python3 "$skill_dir/impl/run.py" <<<"{\"root\":\"$tmp_tree\",\"previous\":{\"algorithm\":\"sha256\",\"treeDigest\":\"00\",\"files\":[{\"path\":\"a.txt\"}]}}" >/dev/null 2>&1; then
+  echo "malformed previous was accepted" >&2
+  exit 1
+fi
+
 python3 - "$skill_dir/fixtures/output.expected.json" "$tmp_out" <<'PY'
 import json
 import sys
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import hashlib
+import itertools
 import json
+import multiprocessing
 import os
 import re
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Iterator, Literal
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "_lib"))
+from skillcard_lines import frontmatter_read_limit, iter_file_lines  # noqa: E402
 
 
 def eprint_json(event: str, payload: dict[str, Any]) -> None:
@@ -31,26 +39,45 @@ class Issue:
 Profile = Literal["compat", "anthropic-v1", "openai-codex-v1"]
 
 
-def _split_frontmatter(markdown: str) -> tuple[str, list[Issue]]:
-    lines = markdown.splitlines(keepends=True)
-    if not lines:
+DEFAULT_MAX_FRONTMATTER_BYTES = 64 * 1024
+
+
+def _split_frontmatter(lines: Iterator[str], max_frontmatter_bytes: int) -> tuple[str, list[Issue]]:
+    """Consume lines up to the closing `---` only; the body is never read."""
+    first = next(lines, None)
+    if first is None:
         return "", [Issue(code="empty_input", message="SKILL.md content is empty")]
 
-    if lines[0].strip("\r\n") != "---":
+    if first.strip("\r\n") != "---":
         return "", [Issue(code="missing_frontmatter", message="SKILL.md must start with YAML frontmatter '---'")]
 
     frontmatter_lines: list[str] = []
-    end_index: int | None = None
-    for i in range(1, len(lines)):
-        if lines[i].strip("\r\n") == "---":
-            end_index = i
-            break
-        frontmatter_lines.append(lines[i])
+    size = 0
+    for line in lines:
+        if line.strip("\r\n") == "---":
+            return "".join(frontmatter_lines), []
+        size += len(line.encode("utf-8"))
+        if size > max_frontmatter_bytes:
+            message = f"YAML frontmatter exceeds {max_frontmatter_bytes} bytes"
+            return "", [Issue(code="frontmatter_too_large", message=message)]
+        frontmatter_lines.append(line)
+
+    return "", [Issue(code="unterminated_frontmatter", message="YAML frontmatter must be terminated by '---'")]
 
-    if end_index is None:
-        return "", [Issue(code="unterminated_frontmatter", message="YAML frontmatter must be terminated by '---'")]
 
-    return "".join(frontmatter_lines), []
+# (frontmatter text, split issues, SHA-256 of the bytes read, stat taken before the read)
+FrontmatterRead = tuple[str, list[Issue], str, os.stat_result]
+
+
+def _read_frontmatter(skill_path: str, max_frontmatter_bytes: int) -> FrontmatterRead:
+    """Return the frontmatter text, split issues, the SHA-256 of the bytes that were read, and the file's
+    stat taken before the read (so a write during the read leaves the stat stale rather than the content)."""
+    hasher = hashlib.sha256()
+    with open(skill_path, "rb") as f:
+        st = os.fstat(f.fileno())
+        lines = iter_file_lines(f, frontmatter_read_limit(max_frontmatter_bytes), hasher)
+        frontmatter_text, issues = _split_frontmatter(lines, max_frontmatter_bytes)
+    return frontmatter_text, issues, hasher.hexdigest(), st
 
 
 def _unquote_scalar(value: str) -> str:
@@ -129,43 +156,210 @@ def _validate_frontmatter(frontmatter: dict[str, str], profile: Profile) -> tupl
     return errors, warnings
 
 
-def _index_skillcards(root: Path, profile: Profile, max_results: int | None) -> dict[str, Any]:
-    results: list[dict[str, Any]] = []
-    for dirpath, dirnames, filenames in os.walk(root, topdown=True, followlinks=False):
-        dirnames.sort()
-        filenames.sort()
-        if "SKILL.md" not in filenames:
+def _discover_skillcards(root: Path) -> Iterator[tuple[str, str]]:
+    """Yield (path relative to root, absolute path) of every SKILL.md in `os.walk` preorder.
+
+    Uses scandir's cached entry types and plain strings; symlinked directories are listed but not
+    descended into, and unreadable directories are skipped, exactly as `os.walk(followlinks=False)`.
+    """
+    stack: list[tuple[str, str]] = [("", str(root))]
+    while stack:
+        rel_dir, dir_path = stack.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
             continue
+        subdirs: list[tuple[str, str, str]] = []
+        has_card = False
+        with entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    has_card = has_card or entry.name == "SKILL.md"
+                elif not entry.is_symlink():
+                    subdirs.append((entry.name, rel_dir + entry.name + "/", entry.path))
+        if has_card:
+            yield rel_dir + "SKILL.md", os.path.join(dir_path, "SKILL.md")
+        # Siblings in plain name order, as os.walk's `dirnames.sort()` visits them.
+        subdirs.sort(reverse=True)
+        stack.extend((rel, path) for _, rel, path in subdirs)
+
+
+def _index_skillcard(
+    rel_path: str,
+    skill_path: str,
+    profile: Profile,
+    max_frontmatter_bytes: int = DEFAULT_MAX_FRONTMATTER_BYTES,
+    read: FrontmatterRead | None = None,
+) -> tuple[dict[str, Any], str | None, os.stat_result | None]:
+    """Return the card's index entry, the SHA-256 of the bytes read, and the stat taken before reading them
+    (both None if the card could not be read). A `read` already taken of the card is parsed, not repeated."""
+    errors: list[Issue] = []
+    warnings: list[Issue] = []
+    frontmatter: dict[str, str] = {}
+    digest: str | None = None
+    st: os.stat_result | None = None
+
+    try:
+        frontmatter_text, split_errors, digest, st = read or _read_frontmatter(skill_path, max_frontmatter_bytes)
+        frontmatter, parse_errors, parse_warnings = _parse_frontmatter_scalars(frontmatter_text)
+        val_errors, val_warnings = _validate_frontmatter(frontmatter, profile)
+        errors = split_errors + parse_errors + val_errors
+        warnings = parse_warnings + val_warnings
+    except Exception as e:
+        errors = [Issue(code="read_error", message=str(e))]
+        digest = None
+        st = None
+
+    result = {
+        "path": rel_path,
+        "ok": len(errors) == 0,
+        "frontmatter": dict(sorted(frontmatter.items())),
+        "errors": [e.to_json() for e in errors],
+        "warnings": [w.to_json() for w in warnings],
+    }
+    return result, digest, st
+
+
+def _index_skillcard_job(
+    job: tuple[str, str, Profile, int, FrontmatterRead | None]
+) -> tuple[dict[str, Any], str | None, os.stat_result | None]:
+    return _index_skillcard(*job)
+
+
+INDEX_STATE_FORMAT = 2
+# Relative to the Skill's working directory; must stay inside `security.access.filesystem.write` in skill.yaml.
+INDEX_STATE_PATH = Path(".skillctl-cache/skillcard-index/state.json")
+
 
-        skill_path = Path(dirpath) / "SKILL.md"
-        rel_path = skill_path.relative_to(root).as_posix()
+class IndexState:
+    """Persisted per-card results for one (root, profile, frontmatter cap), keyed by path relative to root.
 
-        errors: list[Issue] = []
-        warnings: list[Issue] = []
-        frontmatter: dict[str, str] = {}
+    A card whose (size, mtime_ns) is unchanged reuses its stored result without being read; a card whose
+    stat changed but whose frontmatter bytes hash the same is read up to its closing `---` but not
+    re-parsed. Cards modified in the same timestamp tick as the last save are "racy" and always re-checked
+    by content.
+    """
 
+    def __init__(self, path: Path, root: Path, profile: Profile, max_frontmatter_bytes: int) -> None:
+        self.path = path
+        self.max_frontmatter_bytes = max_frontmatter_bytes
+        self.section_key = f"{profile}:{max_frontmatter_bytes}:{root.as_posix()}"
+        self.hits = 0
+        self.misses = 0
+        self._sections: dict[str, dict[str, list[Any]]] = {}
+        self._stamp_ns = 0
         try:
-            markdown = skill_path.read_text(encoding="utf-8")
-            frontmatter_text, split_errors = _split_frontmatter(markdown)
-            frontmatter, parse_errors, parse_warnings = _parse_frontmatter_scalars(frontmatter_text)
-            val_errors, val_warnings = _validate_frontmatter(frontmatter, profile)
-            errors = split_errors + parse_errors + val_errors
-            warnings = parse_warnings + val_warnings
-        except Exception as e:
-            errors = [Issue(code="read_error", message=str(e))]
-
-        results.append(
-            {
-                "path": rel_path,
-                "ok": len(errors) == 0,
-                "frontmatter": dict(sorted(frontmatter.items())),
-                "errors": [e.to_json() for e in errors],
-                "warnings": [w.to_json() for w in warnings],
-            }
-        )
-
-        if max_results is not None and len(results) >= max_results:
-            break
+            self._stamp_ns = path.stat().st_mtime_ns
+            loaded = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            loaded = None
+        if isinstance(loaded, dict) and loaded.get("format") == INDEX_STATE_FORMAT:
+            sections = loaded.get("sections")
+            if isinstance(sections, dict):
+                self._sections = {k: v for k, v in sections.items() if isinstance(v, dict)}
+        self._cards = self._sections.get(self.section_key, {})
+        self._fresh: dict[str, list[Any]] = {}
+        self._dirty = False
+
+    def lookup(self, rel: str, skill_path: str) -> tuple[dict[str, Any] | None, FrontmatterRead | None]:
+        """Return the stored result if still valid, else None and the card's read if one was needed to tell."""
+        stored = self._cards.get(rel)
+        if not (isinstance(stored, list) and len(stored) == 4 and isinstance(stored[3], dict)):
+            self.misses += 1
+            return None, None
+        try:
+            st = os.stat(skill_path)
+        except OSError:
+            self.misses += 1
+            return None, None
+        size, mtime_ns, digest, result = stored
+        if [size, mtime_ns] == [st.st_size, st.st_mtime_ns] and st.st_mtime_ns < self._stamp_ns:
+            self.hits += 1
+            self._fresh[rel] = stored
+            return result, None
+        try:
+            read = _read_frontmatter(skill_path, self.max_frontmatter_bytes)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None, None
+        if read[2] == digest:
+            self.hits += 1
+            self._fresh[rel] = [read[3].st_size, read[3].st_mtime_ns, digest, result]
+            self._dirty = True
+            return result, None
+        # Changed: hand the read on so the card is parsed from it rather than read a second time.
+        self.misses += 1
+        return None, read
+
+    def record(self, result: dict[str, Any], digest: str | None, st: os.stat_result | None) -> None:
+        # `st` was taken before the card was read: a write racing the read then shows up as a stat change
+        # on the next run instead of being stored against the old parse.
+        if digest is None or st is None:
+            return
+        self._fresh[result["path"]] = [st.st_size, st.st_mtime_ns, digest, result]
+        self._dirty = True
+
+    def save(self, complete: bool) -> None:
+        # A complete walk replaces the section so deleted cards drop out; a capped walk only adds to it.
+        cards = self._fresh if complete else {**self._cards, **self._fresh}
+        if not self._dirty and cards.keys() == self._cards.keys():
+            return
+        self._sections[self.section_key] = cards
+        payload = {"format": INDEX_STATE_FORMAT, "sections": self._sections}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{self.path.name}.", dir=self.path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps(payload, separators=(",", ":"), sort_keys=True) + "\n")
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+
+# Below this many cards, forking a pool costs more than it saves.
+PARALLEL_MIN_CARDS = 64
+PARALLEL_CHUNK_SIZE = 32
+
+
+def _index_skillcards(
+    root: Path,
+    profile: Profile,
+    max_results: int | None,
+    parallelism: int = 1,
+    state: IndexState | None = None,
+    max_frontmatter_bytes: int = DEFAULT_MAX_FRONTMATTER_BYTES,
+) -> dict[str, Any]:
+    # maxResults bounds discovery itself: the walk stops as soon as enough cards are found, so no
+    # card beyond the cap is ever read or parsed.
+    cards = list(itertools.islice(_discover_skillcards(root), max_results))
+
+    lookups: list[tuple[dict[str, Any] | None, FrontmatterRead | None]] = [(None, None)] * len(cards)
+    if state is not None:
+        lookups = [state.lookup(rel_path, skill_path) for rel_path, skill_path in cards]
+    results = [result for result, _ in lookups]
+    pending = [i for i, result in enumerate(results) if result is None]
+    jobs = [(*cards[i], profile, max_frontmatter_bytes, lookups[i][1]) for i in pending]
+
+    if parallelism > 1 and len(pending) >= PARALLEL_MIN_CARDS:
+        context = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+        with ProcessPoolExecutor(max_workers=parallelism, mp_context=context) as pool:
+            # map() yields in submission order, so output order is the walk order regardless of scheduling.
+            indexed = list(pool.map(_index_skillcard_job, jobs, chunksize=PARALLEL_CHUNK_SIZE))
+    else:
+        indexed = [_index_skillcard(*job) for job in jobs]
+    for i, (result, digest, st) in zip(pending, indexed):
+        results[i] = result
+        if state is not None:
+            state.record(result, digest, st)
+
+    if state is not None:
+        state.save(complete=max_results is None or len(cards) < max_results)
+        eprint_json("index_state", {"hits": state.hits, "misses": state.misses, "path": str(state.path)})
 
     valid = sum(1 for r in results if r["ok"])
     invalid = len(results) - valid
@@ -199,11 +393,24 @@ def main() -> int:
             if not isinstance(max_results, int) or max_results < 1:
                 raise ValueError("maxResults must be a positive integer")
 
+        parallelism = input_obj.get("parallelism", os.cpu_count() or 1)
+        if isinstance(parallelism, bool) or not isinstance(parallelism, int) or parallelism < 1:
+            raise ValueError("parallelism must be a positive integer")
+
         root = Path(root_raw).resolve()
         if not root.exists() or not root.is_dir():
             raise ValueError("root must be an existing directory")
 
-        output = _index_skillcards(root, profile, max_results)
+        use_cache = input_obj.get("cache", False)
+        if not isinstance(use_cache, bool):
+            raise ValueError("cache must be a boolean")
+        max_frontmatter_bytes = input_obj.get("maxFrontmatterBytes", DEFAULT_MAX_FRONTMATTER_BYTES)
+        if isinstance(max_frontmatter_bytes, bool) or not isinstance(max_frontmatter_bytes, int) or max_frontmatter_bytes < 1:
+            raise ValueError("maxFrontmatterBytes must be a positive integer")
+
+        state = IndexState(INDEX_STATE_PATH.resolve(), root, profile, max_frontmatter_bytes) if use_cache else None
+
+        output = _index_skillcards(root, profile, max_results, parallelism, state, max_frontmatter_bytes)
         sys.stdout.write(json.dumps(output, separators=(",", ":"), sort_keys=True) + "\n")
         return 0
     except Exception as e:
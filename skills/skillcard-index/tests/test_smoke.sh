@@ -8,6 +8,96 @@ trap 'rm -f "$tmp_out"' EXIT
 
 (cd "$skill_dir" && python3 "impl/run.py" < "fixtures/input.json" > "$tmp_out")
 
+# Index state: a cold and a warm cached run must both match the uncached output byte for byte.
+tmp_cwd="$(mktemp -d)"
+trap 'rm -f "$tmp_out"; rm -rf "$tmp_cwd"' EXIT
+for _ in 1 2; do
+  (cd "$tmp_cwd" && python3 "$skill_dir/impl/run.py" <<<"{\"root\":\"$skill_dir/fixtures/repo\",\"profile\":\"compat\",\"cache\":true}" 2>/dev/null) \
+    | cmp -s - <(cd "$skill_dir" && python3 "impl/run.py" <<<"{\"root\":\"$skill_dir/fixtures/repo\",\"profile\":\"compat\"}")
+done
+test -s "$tmp_cwd/.skillctl-cache/skillcard-index/state.json"
+
+# A card rewritten while it is being read must not have its new stat stored against the old parse.
+mkdir -p "$tmp_cwd/race/card"
+printf -- '---\nname: before\ndescription: d\n---\n' > "$tmp_cwd/race/card/SKILL.md"
+(cd "$tmp_cwd" && python3 - "$skill_dir/impl" 2>/dev/null) <<'PY'
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, sys.argv[1])
+import run
+
+root = Path("race").resolve()
+card = root / "card" / "SKILL.md"
+split = run._split_frontmatter
+
+
+def split_then_rewrite(lines, max_bytes):
+    parsed = split(lines, max_bytes)
+    card.write_text("---\nname: after\ndescription: d\n---\n", encoding="utf-8")
+    os.utime(card, ns=(1_000_000_000, 1_000_000_000))
+    return parsed
+
+
+def index(split_fn):
+    run._split_frontmatter = split_fn
+    state = run.IndexState(run.INDEX_STATE_PATH.resolve(), root, "compat", run.DEFAULT_MAX_FRONTMATTER_BYTES)
+    return run._index_skillcards(root, "compat", None, 1, state)["skillcards"][0]["frontmatter"]["name"]
+
+
+assert index(split_then_rewrite) == "before"
+name = index(split)
+if name != "after":
+    print("stale cached card:", name, file=sys.stderr)
+    raise SystemExit(1)
+PY
+
+# A card whose stat and digest both changed is read once: the lookup's read is parsed, not repeated.
+(cd "$tmp_cwd" && python3 - "$skill_dir/impl" 2>/dev/null) <<'PY'
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, sys.argv[1])
+import run
+
+root = Path("race").resolve()
+card = root / "card" / "SKILL.md"
+card.write_text("---\nname: changed\ndescription: d\n---\n", encoding="utf-8")
+os.utime(card, ns=(2_000_000_000, 2_000_000_000))
+reads = []
+read_frontmatter = run._read_frontmatter
+
+
+def counting_read(*args):
+    reads.append(args[0])
+    return read_frontmatter(*args)
+
+
+run._read_frontmatter = counting_read
+state = run.IndexState(run.INDEX_STATE_PATH.resolve(), root, "compat", run.DEFAULT_MAX_FRONTMATTER_BYTES)
+output = run._index_skillcards(root, "compat", None, 1, state)
+if output["skillcards"][0]["frontmatter"]["name"] != "changed" or reads != [str(card)]:
+    print("changed card was not read exactly once:", reads, output, file=sys.stderr)
+    raise SystemExit(1)
+PY
+
+# Walk order is os.walk preorder with siblings sorted by name: `a-b` and `a0` come after `a` and its subtree,
+# and maxResults keeps the first cards in that order.
+for limit in "" ',"maxResults":2'; do
+  (cd "$skill_dir" && python3 "impl/run.py" <<<"{\"root\":\"fixtures/order\"${limit}}") | python3 -c '
+import json
+import sys
+
+paths = [card["path"] for card in json.load(sys.stdin)["skillcards"]]
+expected = ["a/SKILL.md", "a/x/SKILL.md", "a-b/SKILL.md", "a0/SKILL.md"][: int(sys.argv[1] or 4)]
+if paths != expected:
+    print("walk order mismatch:", paths, file=sys.stderr)
+    raise SystemExit(1)
+' "${limit:+2}"
+done
+
 python3 - "$skill_dir/fixtures/output.expected.json" "$tmp_out" <<'PY'
 import json
 import sys
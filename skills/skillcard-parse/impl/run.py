@@ -7,7 +7,10 @@ import re
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Iterator, Literal
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "_lib"))
+from skillcard_lines import frontmatter_read_limit, iter_file_lines  # noqa: E402
 
 
 def eprint_json(event: str, payload: dict[str, Any]) -> None:
@@ -30,28 +33,41 @@ class Issue:
 Profile = Literal["compat", "anthropic-v1", "openai-codex-v1"]
 
 
-def _split_frontmatter(markdown: str) -> tuple[str, str, list[Issue]]:
-    lines = markdown.splitlines(keepends=True)
-    if not lines:
+DEFAULT_MAX_FRONTMATTER_BYTES = 64 * 1024
+
+
+def _split_frontmatter(
+    lines: Iterator[str],
+    include_body: bool = True,
+    max_frontmatter_bytes: int = DEFAULT_MAX_FRONTMATTER_BYTES,
+    body_lines: Iterator[str] | None = None,
+) -> tuple[str, str, list[Issue]]:
+    """Split a line stream at the closing `---`; the body is only consumed when `include_body` is set.
+
+    The body is read from `body_lines` when given (e.g. an unbounded reader over the rest of the file).
+    """
+    first = next(lines, None)
+    if first is None:
         return "", "", [Issue(code="empty_input", message="SKILL.md content is empty")]
 
-    if lines[0].strip("\r\n") != "---":
+    if first.strip("\r\n") != "---":
         return "", "", [Issue(code="missing_frontmatter", message="SKILL.md must start with YAML frontmatter '---'")]
 
     frontmatter_lines: list[str] = []
-    end_index: int | None = None
-    for i in range(1, len(lines)):
-        if lines[i].strip("\r\n") == "---":
-            end_index = i
+    size = 0
+    for line in lines:
+        if line.strip("\r\n") == "---":
             break
-        frontmatter_lines.append(lines[i])
-
-    if end_index is None:
+        size += len(line.encode("utf-8"))
+        if size > max_frontmatter_bytes:
+            message = f"YAML frontmatter exceeds {max_frontmatter_bytes} bytes"
+            return "", "", [Issue(code="frontmatter_too_large", message=message)]
+        frontmatter_lines.append(line)
+    else:
         return "", "", [Issue(code="unterminated_frontmatter", message="YAML frontmatter must be terminated by '---'")]
 
-    frontmatter_text = "".join(frontmatter_lines)
-    body_text = "".join(lines[end_index + 1 :])
-    return frontmatter_text, body_text, []
+    body_text = "".join(lines if body_lines is None else body_lines) if include_body else ""
+    return "".join(frontmatter_lines), body_text, []
 
 
 def _unquote_scalar(value: str) -> str:
@@ -156,6 +172,101 @@ def _build_result(
     }
 
 
+def _parse_skillcard(
+    path_raw: Any,
+    text_raw: Any,
+    include_body: bool,
+    profile: Profile,
+    max_frontmatter_bytes: int,
+) -> dict[str, Any]:
+    mode: Literal["path", "text"]
+    source_path: str | None = None
+    if isinstance(path_raw, str) and path_raw and text_raw is None:
+        mode = "path"
+        source_path = path_raw
+        with Path(path_raw).open("rb") as f:
+            frontmatter_text, body_text, split_errors = _split_frontmatter(
+                iter_file_lines(f, frontmatter_read_limit(max_frontmatter_bytes)),
+                include_body,
+                max_frontmatter_bytes,
+                body_lines=iter_file_lines(f),
+            )
+    elif isinstance(text_raw, str) and text_raw and path_raw is None:
+        mode = "text"
+        frontmatter_text, body_text, split_errors = _split_frontmatter(
+            iter(text_raw.splitlines(keepends=True)), include_body, max_frontmatter_bytes
+        )
+    else:
+        raise ValueError("Provide exactly one of: path, text")
+
+    frontmatter, parse_errors, parse_warnings = _parse_frontmatter_scalars(frontmatter_text)
+    val_errors, val_warnings = _validate_frontmatter(frontmatter, profile)
+
+    errors = split_errors + parse_errors + val_errors
+    warnings = parse_warnings + val_warnings
+    return _build_result(
+        ok=(len(errors) == 0),
+        frontmatter=frontmatter,
+        errors=errors,
+        warnings=warnings,
+        body=body_text if include_body else None,
+        profile=profile,
+        mode=mode,
+        path=source_path,
+    )
+
+
+def _runtime_error_result(
+    e: Exception,
+    profile: Profile,
+    mode: Literal["path", "text"] = "text",
+    path: str | None = None,
+) -> dict[str, Any]:
+    return _build_result(
+        ok=False,
+        frontmatter={},
+        errors=[Issue(code="runtime_error", message=str(e))],
+        warnings=[],
+        body=None,
+        profile=profile,
+        mode=mode,
+        path=path,
+    )
+
+
+def _parse_items(
+    items: list[Any],
+    include_body: bool,
+    profile: Profile,
+    max_frontmatter_bytes: int,
+) -> dict[str, Any]:
+    """Parse every item in order; a failing item gets a `runtime_error` result and never aborts the batch."""
+    results: list[dict[str, Any]] = []
+    for index, item in enumerate(items):
+        path_raw = item.get("path") if isinstance(item, dict) else None
+        text_raw = item.get("text") if isinstance(item, dict) else None
+        try:
+            if not isinstance(item, dict) or item.keys() - {"path", "text"}:
+                raise ValueError("items entries must be objects with exactly one of: path, text")
+            results.append(_parse_skillcard(path_raw, text_raw, include_body, profile, max_frontmatter_bytes))
+        except Exception as e:
+            eprint_json("error", {"index": index, "message": str(e)})
+            if isinstance(path_raw, str) and path_raw and text_raw is None:
+                results.append(_runtime_error_result(e, profile, "path", path_raw))
+            else:
+                results.append(_runtime_error_result(e, profile))
+
+    valid = sum(1 for r in results if r["ok"])
+    return {
+        "ok": valid == len(results),
+        "profile": profile,
+        "total": len(results),
+        "valid": valid,
+        "invalid": len(results) - valid,
+        "items": results,
+    }
+
+
 def main() -> int:
     input_obj = json.load(sys.stdin)
     if not isinstance(input_obj, dict):
@@ -167,51 +278,23 @@ def main() -> int:
         raise ValueError("profile must be one of: compat, anthropic-v1, openai-codex-v1")
     profile: Profile = profile_raw
 
-    path_raw = input_obj.get("path")
-    text_raw = input_obj.get("text")
-
-    mode: Literal["path", "text"]
-    source_path: str | None = None
-    markdown: str
-    try:
-        if isinstance(path_raw, str) and path_raw and text_raw is None:
-            mode = "path"
-            source_path = path_raw
-            markdown = Path(path_raw).read_text(encoding="utf-8")
-        elif isinstance(text_raw, str) and text_raw and path_raw is None:
-            mode = "text"
-            markdown = text_raw
-        else:
-            raise ValueError("Provide exactly one of: path, text")
-
-        frontmatter_text, body_text, split_errors = _split_frontmatter(markdown)
-        frontmatter, parse_errors, parse_warnings = _parse_frontmatter_scalars(frontmatter_text)
-        val_errors, val_warnings = _validate_frontmatter(frontmatter, profile)
-
-        errors = split_errors + parse_errors + val_errors
-        warnings = parse_warnings + val_warnings
-        result = _build_result(
-            ok=(len(errors) == 0),
-            frontmatter=frontmatter,
-            errors=errors,
-            warnings=warnings,
-            body=body_text if include_body else None,
-            profile=profile,
-            mode=mode,
-            path=source_path,
-        )
-    except Exception as e:
-        eprint_json("error", {"message": str(e)})
-        result = _build_result(
-            ok=False,
-            frontmatter={},
-            errors=[Issue(code="runtime_error", message=str(e))],
-            warnings=[],
-            body=None,
-            profile=profile,
-            mode="text",
-            path=None,
-        )
+    max_frontmatter_bytes = input_obj.get("maxFrontmatterBytes", DEFAULT_MAX_FRONTMATTER_BYTES)
+    if isinstance(max_frontmatter_bytes, bool) or not isinstance(max_frontmatter_bytes, int) or max_frontmatter_bytes < 1:
+        raise ValueError("maxFrontmatterBytes must be a positive integer")
+
+    items_raw = input_obj.get("items")
+    if items_raw is not None:
+        if not isinstance(items_raw, list) or "path" in input_obj or "text" in input_obj:
+            raise ValueError("items must be an array and cannot be combined with path or text")
+        result = _parse_items(items_raw, include_body, profile, max_frontmatter_bytes)
+    else:
+        try:
+            result = _parse_skillcard(
+                input_obj.get("path"), input_obj.get("text"), include_body, profile, max_frontmatter_bytes
+            )
+        except Exception as e:
+            eprint_json("error", {"message": str(e)})
+            result = _runtime_error_result(e, profile)
 
     sys.stdout.write(json.dumps(result, separators=(",", ":"), sort_keys=True) + "\n")
     return 0
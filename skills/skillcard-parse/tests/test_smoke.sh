@@ -34,3 +34,40 @@ PY
 
 run_case "fixtures/valid/input.json" "fixtures/valid/output.expected.json"
 run_case "fixtures/invalid/input.json" "fixtures/invalid/output.expected.json"
+run_case "fixtures/oversized/input.json" "fixtures/oversized/output.expected.json"
+run_case "fixtures/batch/input.json" "fixtures/batch/output.expected.json"
+
+# Reads stay bounded by maxFrontmatterBytes even when a line never ends, and CRLF frontmatter within the
+# cap still parses although its raw size exceeds it.
+python3 - "$skill_dir/impl" <<'PY'
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, sys.argv[1])
+import run
+
+cases = [
+    (b"---\n" + b"a" * (16 << 20), "frontmatter_too_large"),
+    (b"-" * (16 << 20), "missing_frontmatter"),
+    (b"---\r\nname: n\r\ndescription: d\r\n" + b"#\r\n" * 400 + b"---\r\nbody\r\n", None),
+]
+for content, code in cases:
+    with tempfile.NamedTemporaryFile(suffix=".md", delete=False) as f:
+        f.write(content)
+    try:
+        tracemalloc.start()
+        result = run._parse_skillcard(f.name, None, True, "compat", 1024)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    finally:
+        os.unlink(f.name)
+    codes = [error["code"] for error in result["errors"]]
+    if (code is None and codes) or (code is not None and code not in codes) or peak > 1 << 20:
+        print("bounded read mismatch:", code, codes, peak, file=sys.stderr)
+        raise SystemExit(1)
+    if code is None and (result["frontmatter"] != {"description": "d", "name": "n"} or result["body"] != "body\n"):
+        print("CRLF card mismatch:", result, file=sys.stderr)
+        raise SystemExit(1)
+PY
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import io
+import json
+import math
+import os
+import re
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+
+def eprint_json(event: str, payload: dict[str, Any]) -> None:
+    sys.stderr.write(json.dumps({"event": event, **payload}, separators=(",", ":"), sort_keys=True) + "\n")
+
+
+TOKEN_RE = re.compile(r"[^\W_]+")
+
+# BM25 parameters. `name` tokens count NAME_BOOST times, so a card named after a term outranks one that
+# only mentions it in passing (a one-field approximation of BM25F).
+BM25_K1 = 1.2
+BM25_B = 0.75
+NAME_BOOST = 2
+# Weights are rounded when the catalog is built, so persisted and freshly built catalogs score identically.
+WEIGHT_DIGITS = 6
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_RE.findall(text.casefold())
+
+
+def _frontmatter_field(card: dict[str, Any], key: str) -> str | None:
+    frontmatter = card.get("frontmatter")
+    value = frontmatter.get(key) if isinstance(frontmatter, dict) else None
+    return value if isinstance(value, str) else None
+
+
+class Catalog:
+    """Inverted index over the `name` and `description` of every card in one skillcard.index output.
+
+    `documents[i]` is `[path, name, description, ok]`; `postings[term]` lists `[i, weight]` in document order,
+    where weight is the card's precomputed BM25 contribution for the term. A query sums the weights of its
+    terms, so answering it touches only the postings of those terms.
+    """
+
+    def __init__(
+        self,
+        digest: str,
+        root: str | None,
+        documents: list[list[Any]],
+        postings: dict[str, list[list[Any]]],
+    ) -> None:
+        self.digest = digest
+        self.root = root
+        self.documents = documents
+        self.postings = postings
+        # [path, size, mtime_ns, ino] of the index file the catalog was built from, when it came from a path.
+        self.source_stat: list[Any] | None = None
+        # mtime of the persisted catalog (or, for one only held in memory, the clock at read time less
+        # RACY_CLOCK_MARGIN_NS); source files modified since are "racy" and re-hashed.
+        self.stamp_ns = 0
+
+    @classmethod
+    def build(cls, index: Any, digest: str) -> Catalog:
+        if not isinstance(index, dict) or not isinstance(index.get("skillcards"), list):
+            raise ValueError("index must be a skillcard.index output (object or path) with skillcards")
+        root = index.get("root") if isinstance(index.get("root"), str) else None
+
+        documents: list[list[Any]] = []
+        term_counts: list[tuple[Counter[str], int]] = []
+        for card in index["skillcards"]:
+            if not isinstance(card, dict) or not isinstance(card.get("path"), str):
+                raise ValueError("index skillcards entries must be objects with a string path")
+            name = _frontmatter_field(card, "name")
+            description = _frontmatter_field(card, "description")
+            name_tokens = tokenize(name or "")
+            description_tokens = tokenize(description or "")
+            if not name_tokens and not description_tokens:
+                continue
+            counts: Counter[str] = Counter(description_tokens)
+            for token in name_tokens:
+                counts[token] += NAME_BOOST
+            documents.append([card["path"], name, description, card.get("ok") is True])
+            term_counts.append((counts, NAME_BOOST * len(name_tokens) + len(description_tokens)))
+
+        total = len(documents)
+        average_length = sum(length for _, length in term_counts) / total if total else 0.0
+        document_frequency: Counter[str] = Counter()
+        for counts, _ in term_counts:
+            document_frequency.update(counts.keys())
+        idf = {
+            term: math.log(1 + (total - df + 0.5) / (df + 0.5)) for term, df in document_frequency.items()
+        }
+
+        postings: dict[str, list[list[Any]]] = {}
+        for doc_id, (counts, length) in enumerate(term_counts):
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+            for term, tf in counts.items():
+                weight = round(idf[term] * tf * (BM25_K1 + 1) / (tf + norm), WEIGHT_DIGITS)
+                postings.setdefault(term, []).append([doc_id, weight])
+        return cls(digest, root, documents, postings)
+
+    def search(self, terms: list[str], limit: int) -> tuple[int, list[dict[str, Any]]]:
+        scores: dict[int, float] = {}
+        for term in terms:
+            for doc_id, weight in self.postings.get(term, ()):
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight
+        documents = self.documents
+        candidates = scores.items()
+        if len(scores) > limit:
+            # Rounding is monotonic, so every card that can rank in the top `limit` scores at least this.
+            cutoff = round(heapq.nlargest(limit, scores.values())[-1], WEIGHT_DIGITS)
+            candidates = [item for item in candidates if round(item[1], WEIGHT_DIGITS) >= cutoff]
+        ranked = sorted(
+            ((round(score, WEIGHT_DIGITS), doc_id) for doc_id, score in candidates),
+            key=lambda item: (-item[0], documents[item[1]][0]),
+        )
+        results = []
+        for score, doc_id in ranked[:limit]:
+            path, name, description, ok = documents[doc_id]
+            results.append({"path": path, "name": name, "description": description, "ok": ok, "score": score})
+        return len(scores), results
+
+
+CATALOG_PATH = Path(".skillctl-cache/skillcard-search/catalog.json")
+CATALOG_FORMAT = 1
+
+
+def _load_persisted_catalog(path: Path) -> Catalog | None:
+    try:
+        stamp_ns = path.stat().st_mtime_ns
+        loaded = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(loaded, dict) or loaded.get("format") != CATALOG_FORMAT:
+        return None
+    digest, documents, postings = loaded.get("digest"), loaded.get("documents"), loaded.get("postings")
+    if not isinstance(digest, str) or not isinstance(documents, list) or not isinstance(postings, dict):
+        return None
+    catalog = Catalog(digest, loaded.get("root"), documents, postings)
+    source_stat = loaded.get("sourceStat")
+    catalog.source_stat = source_stat if isinstance(source_stat, list) else None
+    catalog.stamp_ns = stamp_ns
+    return catalog
+
+
+def _save_catalog(path: Path, catalog: Catalog) -> None:
+    payload = {
+        "format": CATALOG_FORMAT,
+        "digest": catalog.digest,
+        "root": catalog.root,
+        "sourceStat": catalog.source_stat,
+        "documents": catalog.documents,
+        "postings": catalog.postings,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(json.dumps(payload, separators=(",", ":"), sort_keys=True) + "\n")
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    catalog.stamp_ns = path.stat().st_mtime_ns
+
+
+# An in-memory catalog has no file to take a stamp from, so it is stamped with the clock, backed off for
+# filesystems whose timestamps are coarser than the clock.
+RACY_CLOCK_MARGIN_NS = 2_000_000_000
+
+# The catalog most recently served by this process; a `--worker` process answers repeat queries from it.
+_warm_catalog: Catalog | None = None
+
+
+def open_catalog(index_raw: Any, use_cache: bool) -> Catalog:
+    """Return the catalog for `index_raw`, reusing the warm or persisted one when its source is unchanged.
+
+    A path source whose (size, mtime_ns, inode) matches a non-racy stored stat is not read at all; otherwise
+    the source is hashed and a catalog with the same digest is reused. Only a new digest rebuilds. The warm
+    catalog records its source stat with or without the persisted cache.
+    """
+    persisted_path = CATALOG_PATH.resolve()
+    persisted: Catalog | None = None
+    stat_key: list[Any] | None = None
+    clock_stamp_ns = time.time_ns() - RACY_CLOCK_MARGIN_NS
+
+    if isinstance(index_raw, str) and index_raw:
+        index_path = Path(index_raw).resolve()
+        if index_path.suffix != ".json":
+            raise ValueError("index path must name a .json file")
+        try:
+            st = index_path.stat()
+            stat_key = [index_path.as_posix(), st.st_size, st.st_mtime_ns, st.st_ino]
+            if _is_current(_warm_catalog, stat_key):
+                return _serve(_warm_catalog, "warm", use_cache)
+            if use_cache:
+                persisted = _load_persisted_catalog(persisted_path)
+                if _is_current(persisted, stat_key):
+                    return _serve(persisted, "cache", use_cache)
+            data = index_path.read_bytes()
+        except OSError as e:
+            raise ValueError(f"index could not be read: {e}") from e
+    elif isinstance(index_raw, dict):
+        data = json.dumps(index_raw, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    else:
+        raise ValueError("index must be a skillcard.index output object or a path to one")
+
+    digest = hashlib.sha256(data).hexdigest()
+    if _warm_catalog is not None and _warm_catalog.digest == digest:
+        if stat_key is not None and not use_cache:
+            _warm_catalog.source_stat, _warm_catalog.stamp_ns = stat_key, clock_stamp_ns
+        return _serve(_warm_catalog, "warm", use_cache)
+    if use_cache:
+        if stat_key is None:  # inline index: the persisted catalog has not been loaded yet
+            persisted = _load_persisted_catalog(persisted_path)
+        if persisted is not None and persisted.digest == digest:
+            if stat_key is not None and persisted.source_stat != stat_key:
+                # Same content under a new stat (touched or rewritten): record it so the next run skips hashing.
+                persisted.source_stat = stat_key
+                _save_catalog(persisted_path, persisted)
+            return _serve(persisted, "cache", use_cache)
+
+    if isinstance(index_raw, dict):
+        index = index_raw
+    else:
+        try:
+            index = json.loads(data)
+        except ValueError as e:
+            raise ValueError(f"index could not be read as JSON: {e}") from e
+    catalog = Catalog.build(index, digest)
+    catalog.source_stat = stat_key
+    if use_cache:
+        _save_catalog(persisted_path, catalog)
+    else:
+        catalog.stamp_ns = clock_stamp_ns
+    return _serve(catalog, "built", use_cache)
+
+
+def _is_current(catalog: Catalog | None, stat_key: list[Any]) -> bool:
+    return catalog is not None and catalog.source_stat == stat_key and stat_key[2] < catalog.stamp_ns
+
+
+def _serve(catalog: Catalog, source: str, use_cache: bool) -> Catalog:
+    global _warm_catalog
+    _warm_catalog = catalog
+    payload: dict[str, Any] = {"source": source, "documents": len(catalog.documents), "terms": len(catalog.postings)}
+    if use_cache:
+        payload["path"] = str(CATALOG_PATH.resolve())
+    eprint_json("catalog", payload)
+    return catalog
+
+
+DEFAULT_LIMIT = 10
+
+
+def search_skillcards(input_obj: Any) -> dict[str, Any]:
+    if not isinstance(input_obj, dict):
+        raise ValueError("input must be a JSON object")
+
+    query = input_obj.get("query")
+    if not isinstance(query, str):
+        raise ValueError("query must be a string")
+
+    limit = input_obj.get("limit", DEFAULT_LIMIT)
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+        raise ValueError("limit must be a positive integer")
+
+    use_cache = input_obj.get("cache", False)
+    if not isinstance(use_cache, bool):
+        raise ValueError("cache must be a boolean")
+
+    catalog = open_catalog(input_obj.get("index"), use_cache)
+    terms = list(dict.fromkeys(tokenize(query)))
+    matched, results = catalog.search(terms, limit)
+    return {
+        "root": catalog.root,
+        "query": query,
+        "terms": terms,
+        "documents": len(catalog.documents),
+        "matched": matched,
+        "results": results,
+    }
+
+
+def main() -> int:
+    try:
+        output = search_skillcards(json.load(sys.stdin))
+        sys.stdout.write(json.dumps(output, separators=(",", ":"), sort_keys=True) + "\n")
+        return 0
+    except Exception as e:
+        eprint_json("error", {"message": str(e)})
+        return 1
+
+
+def worker_main() -> int:
+    # skillctl worker protocol: one JSON input per stdin line, one reply envelope per stdout line.
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        logs = io.StringIO()
+        real_stderr, sys.stderr = sys.stderr, logs
+        try:
+            output: Any = search_skillcards(json.loads(line))
+            exit_code = 0
+        except Exception as e:
+            eprint_json("error", {"message": str(e)})
+            output = None
+            exit_code = 1
+        finally:
+            sys.stderr = real_stderr
+        reply = {"exitCode": exit_code, "output": output, "stderr": logs.getvalue()}
+        sys.stdout.write(json.dumps(reply, separators=(",", ":"), sort_keys=True) + "\n")
+        sys.stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(worker_main() if sys.argv[1:] == ["--worker"] else main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+skill_dir="$(CDPATH= cd -- "$(dirname -- "${BASH_SOURCE[0]}")/.." && pwd)"
+
+tmp_out="$(mktemp)"
+tmp_cwd="$(mktemp -d)"
+trap 'rm -f "$tmp_out"; rm -rf "$tmp_cwd"' EXIT
+
+(cd "$skill_dir" && python3 "impl/run.py" < "fixtures/input.json" > "$tmp_out" 2>/dev/null)
+
+python3 - "$skill_dir/fixtures/output.expected.json" "$tmp_out" <<'PY'
+import json
+import sys
+from pathlib import Path
+
+expected = json.loads(Path(sys.argv[1]).read_text(encoding="utf-8"))
+actual = json.loads(Path(sys.argv[2]).read_text(encoding="utf-8"))
+
+if expected != actual:
+    print("Mismatch:", file=sys.stderr)
+    print("expected:", expected, file=sys.stderr)
+    print("actual:", actual, file=sys.stderr)
+    raise SystemExit(1)
+PY
+
+# Persisted catalog: a cold and a warm cached run, and an inline index object, must all match the uncached output.
+index_path="$skill_dir/fixtures/index.json"
+for _ in 1 2; do
+  (cd "$tmp_cwd" && python3 "$skill_dir/impl/run.py" <<<"{\"index\":\"$index_path\",\"query\":\"fill PDF forms\",\"limit\":3,\"cache\":true}" 2>/dev/null) \
+    | cmp -s - "$tmp_out"
+done
+test -s "$tmp_cwd/.skillctl-cache/skillcard-search/catalog.json"
+python3 -c 'import json,sys; print(json.dumps({"index": json.load(open(sys.argv[1])), "query": "fill PDF forms", "limit": 3}))' "$index_path" \
+  | python3 "$skill_dir/impl/run.py" 2>/dev/null | cmp -s - "$tmp_out"
+
+# Worker mode answers repeated queries from the warm catalog with the same output.
+replies="$(cd "$skill_dir" && printf '%s\n%s\n' "$(tr -d '\n' < fixtures/input.json)" "$(tr -d '\n' < fixtures/input.json)" | python3 impl/run.py --worker)"
+python3 - "$tmp_out" "$replies" <<'PY'
+import json
+import sys
+from pathlib import Path
+
+expected = json.loads(Path(sys.argv[1]).read_text(encoding="utf-8"))
+replies = [json.loads(line) for line in sys.argv[2].splitlines()]
+assert [r["exitCode"] for r in replies] == [0, 0], replies
+assert all(r["output"] == expected for r in replies), replies
+assert '"source":"warm"' in replies[1]["stderr"], replies[1]["stderr"]
+PY
+
+# Without the persisted cache, the warm catalog still records its source stat, so an unchanged index file
+# is not read again. (The copy is backdated so it is not "racy" against the clock stamp.)
+cp "$index_path" "$tmp_cwd/index.json"
+touch -d '2000-01-01' "$tmp_cwd/index.json"
+python3 - "$skill_dir/impl" "$tmp_cwd/index.json" 2>/dev/null <<'PY'
+import sys
+from pathlib import Path
+
+sys.path.insert(0, sys.argv[1])
+import run
+
+first = run.open_catalog(sys.argv[2], False)
+
+
+def no_read(self):
+    raise AssertionError(f"unchanged index was read again: {self}")
+
+
+Path.read_bytes = no_read
+assert run.open_catalog(sys.argv[2], False) is first
+PY
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 import json
+import os
 import sys
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List
 
 SCHEMA_VERSION = "1.0.0"
 ALLOWED_TYPES = {
@@ -14,6 +15,11 @@ ALLOWED_TYPES = {
 }
 ALLOWED_SEVERITIES = {"info", "warning", "error", "success"}
 BANNED_KEYS = {"jsx", "html", "tailwind", "class", "className", "style"}
+BANNED_KEY_TOKENS = tuple(f'"{key}"'.encode() for key in sorted(BANNED_KEYS))
+
+# --ndjson writes a counters line to stderr after every this many records, and once at end of input.
+PROGRESS_EVERY = 10000
+READ_CHUNK_SIZE = 1 << 16
 
 
 def error(path: str, message: str) -> Dict[str, str]:
@@ -28,6 +34,11 @@ def is_dict(value: Any) -> bool:
     return isinstance(value, dict)
 
 
+def may_have_banned_keys(raw: bytes) -> bool:
+    # JSON keys are quoted strings, so a banned key shows up verbatim in the text unless it uses escapes.
+    return b"\\" in raw or any(token in raw for token in BANNED_KEY_TOKENS)
+
+
 def find_banned_keys(node: Any, path: str, errors: List[Dict[str, str]]) -> None:
     if isinstance(node, dict):
         for key, value in node.items():
@@ -41,13 +52,15 @@ def find_banned_keys(node: Any, path: str, errors: List[Dict[str, str]]) -> None
             find_banned_keys(value, current_path, errors)
 
 
-def validate_intent(intent: Any) -> List[Dict[str, str]]:
+def validate_intent(intent: Any, scan_keys: bool = True) -> List[Dict[str, str]]:
     errors: List[Dict[str, str]] = []
 
     if not is_dict(intent):
         return [error("", "intent must be an object")]
 
-    find_banned_keys(intent, "", errors)
+    # Stream mode passes scan_keys=False when may_have_banned_keys has ruled them out from the raw line.
+    if scan_keys:
+        find_banned_keys(intent, "", errors)
 
     if intent.get("schemaVersion") != SCHEMA_VERSION:
         errors.append(error("schemaVersion", "Unsupported or missing schemaVersion"))
@@ -120,7 +133,76 @@ def validate_intent(intent: Any) -> List[Dict[str, str]]:
     return errors
 
 
-def main() -> None:
+def eprint_json(event: str, payload: Dict[str, Any]) -> None:
+    sys.stderr.write(json.dumps({"event": event, **payload}, separators=(",", ":"), sort_keys=True) + "\n")
+
+
+VALID_RECORD = json.dumps({"ok": True, "errors": []}, separators=(",", ":"), sort_keys=True) + "\n"
+
+
+def iter_lines(read: Callable[[], bytes], before_read: Callable[[], Any]) -> Iterator[bytes]:
+    """Split `read()` chunks into lines, calling `before_read()` each time the lines read so far are used up.
+
+    Passing the output flush as `before_read` answers a live producer before waiting on it again, while a bulk
+    feed still gets one write per chunk.
+    """
+    partial: List[bytes] = []
+    while True:
+        before_read()
+        chunk = read()
+        if not chunk:
+            break
+        lines = chunk.split(b"\n")
+        if len(lines) == 1:
+            partial.append(chunk)
+            continue
+        partial.append(lines[0])
+        yield b"".join(partial)
+        yield from lines[1:-1]
+        partial = [lines[-1]]
+    if partial:
+        yield b"".join(partial)
+
+
+def validate_stream(lines: Iterable[bytes], write: Callable[[str], Any]) -> Dict[str, int]:
+    """Write one `{ok, errors}` record per non-blank NDJSON line, in input order, and return the counters.
+
+    Records are validated by schemas/output.ndjson.schema.json. Each line is a bare intent (not wrapped in
+    `{"intent": ...}`); a line that is not JSON gets the same error as a malformed single-document input.
+    Only the current line is held, so memory does not grow with the stream.
+    """
+    counts = {"total": 0, "valid": 0, "invalid": 0, "malformed": 0}
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            intent = json.loads(line)
+        except ValueError as exc:
+            errors = [error("", f"Invalid JSON input: {exc}")]
+            counts["malformed"] += 1
+        else:
+            errors = validate_intent(intent, scan_keys=may_have_banned_keys(line))
+        counts["total"] += 1
+        if errors:
+            counts["invalid"] += 1
+            write(json.dumps({"ok": False, "errors": errors}, separators=(",", ":"), sort_keys=True) + "\n")
+        else:
+            counts["valid"] += 1
+            write(VALID_RECORD)
+        if counts["total"] % PROGRESS_EVERY == 0:
+            eprint_json("intent_stream_progress", counts)
+    eprint_json("intent_stream_summary", counts)
+    return counts
+
+
+def main(ndjson: bool = False) -> None:
+    if ndjson:
+        stdin_fd = sys.stdin.fileno()
+        lines = iter_lines(lambda: os.read(stdin_fd, READ_CHUNK_SIZE), sys.stdout.flush)
+        validate_stream(lines, sys.stdout.write)
+        sys.stdout.flush()
+        return
+
     try:
         payload = json.load(sys.stdin)
     except json.JSONDecodeError as exc:
@@ -146,4 +228,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    main(ndjson=sys.argv[1:] == ["--ndjson"])
@@ -34,3 +34,25 @@ PY
 
 run_case "fixtures/valid/input.json" "fixtures/valid/output.expected.json"
 run_case "fixtures/invalid/input.json" "fixtures/invalid/output.expected.json"
+
+# NDJSON stream mode: one {ok, errors} record per non-blank line, in order, matching single-document results.
+(cd "$skill_dir" && {
+  python3 -c 'import json, sys; print(json.dumps(json.load(open(sys.argv[1]))["intent"]))' "fixtures/valid/input.json"
+  echo
+  python3 -c 'import json, sys; print(json.dumps(json.load(open(sys.argv[1]))["intent"]))' "fixtures/invalid/input.json"
+  echo '{not json'
+} | python3 "impl/run.py" --ndjson 2>/dev/null) | python3 -c '
+import json
+import sys
+
+valid = json.load(open(sys.argv[1], encoding="utf-8"))
+invalid = json.load(open(sys.argv[2], encoding="utf-8"))
+records = [json.loads(line) for line in sys.stdin]
+expected = [
+    {"ok": True, "errors": []},
+    {"ok": False, "errors": invalid["errors"]},
+]
+if valid["ok"] is not True or records[:2] != expected or len(records) != 3 or records[2]["ok"] is not False:
+    print("NDJSON output mismatch:", records, file=sys.stderr)
+    raise SystemExit(1)
+' "$skill_dir/fixtures/valid/output.expected.json" "$skill_dir/fixtures/invalid/output.expected.json"
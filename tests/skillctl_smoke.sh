@@ -7,13 +7,272 @@ if [[ ! -x "$repo_root/.venv-skillctl/bin/python" ]]; then
   "$repo_root/scripts/setup-skillctl-venv.sh" >/dev/null
 fi
 
+stdout_file="$(mktemp)"
+cache_dir="$(mktemp -d)"
+trap 'rm -f "$stdout_file"; rm -rf "$cache_dir"' EXIT
+export SKILLCTL_CACHE_DIR="$cache_dir"
+repo_cache_dir="$cache_dir/$(python3 -c 'import hashlib, os, sys; print(hashlib.sha256(os.fsencode(os.path.realpath(sys.argv[1]))).hexdigest()[:16])' "$repo_root")"
+
 "$repo_root/scripts/skillctl" validate --allow-template "$repo_root/skills/_template"
 
-stdout_file="$(mktemp)"
-trap 'rm -f "$stdout_file"' EXIT
+# Parallel validation records content-hash results; the cached rerun must still pass.
+"$repo_root/scripts/skillctl" validate --all --jobs 2
+test -s "$repo_cache_dir/validate.json"
+"$repo_root/scripts/skillctl" validate --all
+
+# Small batches validate inline; the process pool only starts at VALIDATE_PARALLEL_MIN_SKILLS.
+"$repo_root/.venv-skillctl/bin/python" - "$repo_root" <<'PY'
+import argparse
+import sys
+from pathlib import Path
+
+repo_root = Path(sys.argv[1])
+sys.path.insert(0, str(repo_root / "scripts"))
+import skillctl
+
+args = argparse.Namespace(all=True, targets=[], jobs=2, no_cache=True, allow_template=False)
+pool = skillctl.ProcessPoolExecutor
+started = []
+
+
+def counting_pool(*a, **kw):
+    started.append(True)
+    return pool(*a, **kw)
+
+
+skillctl.ProcessPoolExecutor = counting_pool
+assert skillctl.cmd_validate(repo_root, args) == 0
+assert not started, "pool started for a small batch"
+skillctl.VALIDATE_PARALLEL_MIN_SKILLS = 2
+assert skillctl.cmd_validate(repo_root, args) == 0
+assert started, "pool not started at the threshold"
+PY
 
 "$repo_root/scripts/skillctl" run --allow-template "$repo_root/skills/_template" \
   --input "$repo_root/skills/_template/fixtures/input.json" \
   >"$stdout_file" 2>/dev/null
 
 diff -u "$repo_root/skills/_template/fixtures/output.expected.json" "$stdout_file"
+
+# Streaming mode must produce the same canonical output as a buffered run.
+"$repo_root/scripts/skillctl" run --allow-template "$repo_root/skills/_template" --stream \
+  --input "$repo_root/skills/_template/fixtures/input.json" \
+  >"$stdout_file" 2>/dev/null
+
+diff -u "$repo_root/skills/_template/fixtures/output.expected.json" "$stdout_file"
+
+# --no-canonical keeps arrival order inside streamed array items too; the default sorts them.
+# (run reports skill paths relative to the repo, so the scratch Skill lives in the gitignored repo cache dir.)
+mkdir -p "$repo_root/.skillctl-cache"
+array_skill="$(mktemp -d "$repo_root/.skillctl-cache/smoke-array-echo.XXXXXX")"
+cp -R "$repo_root/skills/_template/." "$array_skill"
+cat >"$array_skill/schemas/output.schema.json" <<'JSON'
+{
+  "$schema": "https://json-schema.org/draft/2020-12/schema",
+  "type": "object",
+  "properties": {
+    "items": { "type": "array", "items": { "type": "object" } }
+  }
+}
+JSON
+cat >"$array_skill/schemas/input.schema.json" <<'JSON'
+{
+  "$schema": "https://json-schema.org/draft/2020-12/schema",
+  "type": "object",
+  "properties": {
+    "tags": { "type": "array", "items": { "type": "string" } }
+  }
+}
+JSON
+array_input='{"z":0,"items":[{"b":1,"a":{"d":2,"c":3}},{"y":4,"x":5}]}'
+"$repo_root/scripts/skillctl" run --allow-template "$array_skill" --stream --no-canonical \
+  <<<"$array_input" 2>/dev/null | diff -u <(echo "$array_input") -
+"$repo_root/scripts/skillctl" run --allow-template "$array_skill" --stream \
+  <<<"$array_input" 2>/dev/null | diff -u <(echo '{"items":[{"a":{"c":3,"d":2},"b":1},{"x":5,"y":4}],"z":0}') -
+
+# A failed streamed validation must leave stdout empty in either mode, not a truncated prefix.
+for flag in --no-canonical ""; do
+  if "$repo_root/scripts/skillctl" run --allow-template "$array_skill" --stream $flag \
+    <<<'{"z":0,"items":[{"a":1},2]}' >"$stdout_file" 2>/dev/null; then
+    echo "expected invalid streamed item to fail" >&2
+    exit 1
+  fi
+  test ! -s "$stdout_file"
+done
+
+# Streamed input is validated item by item too, with the same pointer-style error as a buffered run.
+if "$repo_root/scripts/skillctl" run --allow-template "$array_skill" --stream \
+  <<<'{"tags":["a",1]}' >"$stdout_file" 2>"$cache_dir/stream.stderr"; then
+  echo "expected invalid streamed input to fail" >&2
+  exit 1
+fi
+grep -q 'Input validation failed at /tags/1' "$cache_dir/stream.stderr"
+test ! -s "$stdout_file"
+rm -rf "$array_skill"
+
+# Multi-line input reaches a worker Skill as one request line.
+python3 -m json.tool "$repo_root/skills/fs-hash-tree/fixtures/input.json" \
+  | "$repo_root/scripts/skillctl" run fs.hash_tree --stream --worker 2>/dev/null \
+  | cmp -s - <("$repo_root/scripts/skillctl" run fs.hash_tree --input "$repo_root/skills/fs-hash-tree/fixtures/input.json" 2>/dev/null)
+
+# Id resolution populates the registry index; a second lookup must resolve from it.
+"$repo_root/scripts/skillctl" describe fs.hash_tree >/dev/null
+test -s "$repo_cache_dir/registry.json"
+"$repo_root/scripts/skillctl" describe --json fs.hash_tree >/dev/null
+
+# Repos sharing SKILLCTL_CACHE_DIR keep separate registries even for identical relative paths and stats.
+for name in one two; do
+  mkdir -p "$cache_dir/repo-$name/skills"
+  cp -R "$repo_root/skills/fs-hash-tree" "$cache_dir/repo-$name/skills/demo"
+  sed -i "s/^id: fs\.hash_tree\$/id: demo.$name/" "$cache_dir/repo-$name/skills/demo/skill.yaml"
+  touch -d '2000-01-01' "$cache_dir/repo-$name/skills/demo/skill.yaml"
+done
+"$repo_root/scripts/skillctl" --repo-root "$cache_dir/repo-one" describe demo.one >/dev/null
+"$repo_root/scripts/skillctl" --repo-root "$cache_dir/repo-two" describe demo.two >/dev/null
+"$repo_root/scripts/skillctl" --repo-root "$cache_dir/repo-one" describe demo.one >/dev/null
+
+# Batch mode answers every NDJSON record, in input order.
+batch_input="$cache_dir/batch.ndjson"
+cat "$repo_root/skills/_template/fixtures/input.json" "$repo_root/skills/_template/fixtures/input.json" >"$batch_input"
+"$repo_root/scripts/skillctl" run --allow-template "$repo_root/skills/_template" --batch --jobs 2 \
+  --input "$batch_input" \
+  >"$stdout_file" 2>/dev/null
+diff -u <(cat "$repo_root/skills/_template/fixtures/output.expected.json" "$repo_root/skills/_template/fixtures/output.expected.json") "$stdout_file"
+
+# Blank lines are skipped without shifting `record`: report N must describe output line N.
+batch_stderr="$cache_dir/batch.stderr"
+{ echo; cat "$repo_root/skills/_template/fixtures/input.json"; echo; echo "not json"; } >"$batch_input"
+if "$repo_root/scripts/skillctl" run --allow-template "$repo_root/skills/_template" --batch --jobs 2 \
+  --input "$batch_input" \
+  >"$stdout_file" 2>"$batch_stderr"; then
+  echo "expected batch with an invalid record to fail" >&2
+  exit 1
+fi
+diff -u <(cat "$repo_root/skills/_template/fixtures/output.expected.json"; echo null) "$stdout_file"
+python3 - "$batch_stderr" <<'PY'
+import json
+import sys
+from pathlib import Path
+
+reports = [json.loads(line) for line in Path(sys.argv[1]).read_text(encoding="utf-8").splitlines() if line.startswith("{")]
+outcomes = [(r["record"], r["status"]) for r in reports if r.get("event") == "skill_run_report"]
+if outcomes != [(1, "success"), (2, "error")]:
+    print("batch record numbering mismatch:", outcomes, file=sys.stderr)
+    raise SystemExit(1)
+PY
+
+# fs.hash_tree runs as a fresh process by default; --worker opts into its persistent worker entry point.
+# Both must produce the fixture digests.
+for worker_flag in "" --worker; do
+  "$repo_root/scripts/skillctl" run fs.hash_tree $worker_flag \
+    --input "$repo_root/skills/fs-hash-tree/fixtures/input.json" \
+    >"$stdout_file" 2>/dev/null
+  python3 - "$repo_root/skills/fs-hash-tree/fixtures/output.expected.json" "$stdout_file" <<'PY'
+import json
+import sys
+from pathlib import Path
+
+expected = json.loads(Path(sys.argv[1]).read_text(encoding="utf-8"))
+actual = json.loads(Path(sys.argv[2]).read_text(encoding="utf-8"))
+if (expected["treeDigest"], expected["files"]) != (actual["treeDigest"], actual["files"]):
+    print("fs.hash_tree output mismatch:", actual, file=sys.stderr)
+    raise SystemExit(1)
+PY
+done
+"$repo_root/.venv-skillctl/bin/python" - "$repo_root" <<'PY'
+import sys
+from pathlib import Path
+
+repo_root = Path(sys.argv[1])
+sys.path.insert(0, str(repo_root / "scripts"))
+import skillctl
+
+skill_dir = repo_root / "skills/fs-hash-tree"
+assert skillctl._prepare_skill(repo_root, skill_dir).runtime_type == "command"
+assert skillctl._prepare_skill(repo_root, skill_dir, use_worker=True).runtime_type == "worker"
+PY
+
+# Reloading a worker Skill while a request is in flight must not leak the busy worker of the old pool.
+"$repo_root/.venv-skillctl/bin/python" - "$repo_root" <<'PY'
+import os
+import sys
+import threading
+from pathlib import Path
+
+repo_root = Path(sys.argv[1])
+sys.path.insert(0, str(repo_root / "scripts"))
+import skillctl
+
+warm = skillctl._WarmSkills(repo_root, 1, use_worker=True)
+_, old_pool = warm.get("fs.hash_tree", allow_template=False)
+entered, proceed = threading.Event(), threading.Event()
+busy = []
+original_request = skillctl._WorkerProcess.request
+
+
+def gated_request(self, input_obj, timeout_ms):
+    busy.append(self)
+    entered.set()
+    proceed.wait(10)
+    return original_request(self, input_obj, timeout_ms)
+
+
+skillctl._WorkerProcess.request = gated_request
+fixture_input = {"root": str(repo_root / "skills/fs-hash-tree/fixtures/tree")}
+request = threading.Thread(target=old_pool.invoke, args=(fixture_input, 60000))
+request.start()
+entered.wait(10)
+
+manifest = repo_root / "skills/fs-hash-tree/skill.yaml"
+st = manifest.stat()
+try:
+    os.utime(manifest, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    _, new_pool = warm.get("fs.hash_tree", allow_template=False)
+finally:
+    os.utime(manifest, ns=(st.st_atime_ns, st.st_mtime_ns))
+proceed.set()
+request.join(30)
+skillctl._WorkerProcess.request = original_request
+
+if new_pool is old_pool or busy[0].proc.poll() is None:
+    print("busy worker of the reloaded pool is still running", file=sys.stderr)
+    raise SystemExit(1)
+warm.close()
+PY
+
+# Daemon mode must reproduce the output of a local run.
+socket_path="$cache_dir/skillctl.sock"
+"$repo_root/scripts/skillctl" serve --socket "$socket_path" 2>/dev/null &
+serve_pid=$!
+trap 'kill "$serve_pid" 2>/dev/null || true; rm -f "$stdout_file"; rm -rf "$cache_dir"' EXIT
+for _ in $(seq 1 50); do
+  [[ -S "$socket_path" ]] && break
+  sleep 0.1
+done
+
+"$repo_root/scripts/skillctl" run --allow-template "$repo_root/skills/_template" --server "$socket_path" \
+  --input "$repo_root/skills/_template/fixtures/input.json" \
+  >"$stdout_file" 2>/dev/null
+
+diff -u "$repo_root/skills/_template/fixtures/output.expected.json" "$stdout_file"
+
+# Relative path targets are resolved by the client; the daemon rejects them rather than guess a base directory.
+(cd "$cache_dir" && "$repo_root/scripts/skillctl" --repo-root "$repo_root" run --allow-template skills/_template \
+  --server "$socket_path" --input "$repo_root/skills/_template/fixtures/input.json") \
+  >"$stdout_file" 2>/dev/null
+diff -u "$repo_root/skills/_template/fixtures/output.expected.json" "$stdout_file"
+python3 - "$socket_path" <<'PY'
+import json
+import socket
+import sys
+
+with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+    conn.connect(sys.argv[1])
+    with conn.makefile("rwb") as stream:
+        stream.write(b'{"allowTemplate":true,"input":{},"target":"skills/_template"}\n')
+        stream.flush()
+        response = json.loads(stream.readline())
+if response.get("ok") or "absolute path" not in response.get("error", ""):
+    print("relative target was not rejected:", response, file=sys.stderr)
+    raise SystemExit(1)
+PY